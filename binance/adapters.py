@@ -0,0 +1,91 @@
+# coding=utf-8
+
+import socket
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+
+def get_keepalive_socket_options(idle=60, interval=10, count=6):
+    """Socket options enabling TCP keep-alive probes on pooled connections
+
+    Options not supported by the platform are left out.
+
+    :param idle: Seconds a connection is idle before the first probe
+    :type idle: int
+    :param interval: Seconds between probes
+    :type interval: int
+    :param count: Number of unanswered probes before the connection is dropped
+    :type count: int
+
+    :return: list of (level, option, value) tuples
+
+    """
+    options = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    # TCP_KEEPIDLE is named TCP_KEEPALIVE on macOS
+    idle_option = getattr(socket, 'TCP_KEEPIDLE', getattr(socket, 'TCP_KEEPALIVE', None))
+    if idle_option is not None:
+        options.append((socket.IPPROTO_TCP, idle_option, idle))
+    if hasattr(socket, 'TCP_KEEPINTVL'):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, interval))
+    if hasattr(socket, 'TCP_KEEPCNT'):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPCNT, count))
+    return options
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+
+    __attrs__ = HTTPAdapter.__attrs__ + ['_socket_options']
+
+    def __init__(self, pool_maxsize=10, pool_block=False, tcp_keepalive=False, **kwargs):
+        """HTTPAdapter with a connection pool for a single host
+
+        :param pool_maxsize: Maximum number of connections kept open to the host, should be at least
+            the number of threads sharing the client
+        :type pool_maxsize: int
+        :param pool_block: Wait for a free connection when all are in use instead of opening one that
+            is discarded after the request
+        :type pool_block: bool
+        :param tcp_keepalive: Enable TCP keep-alive probes so idle connections are not silently dropped
+        :type tcp_keepalive: bool
+
+        """
+        self._socket_options = None
+        if tcp_keepalive:
+            self._socket_options = HTTPConnection.default_socket_options + get_keepalive_socket_options()
+        super(PooledHTTPAdapter, self).__init__(pool_connections=1, pool_maxsize=pool_maxsize,
+                                                pool_block=pool_block, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        if self._socket_options:
+            kwargs['socket_options'] = self._socket_options
+        super(PooledHTTPAdapter, self).init_poolmanager(*args, **kwargs)
+
+    @staticmethod
+    def _count_idle(pool):
+        if pool.pool is None:
+            return 0
+        # the queue is filled with None placeholders for connections which are not open yet
+        return sum(1 for conn in list(pool.pool.queue) if conn is not None)
+
+    def get_pool_stats(self):
+        """Get usage of the connection pools
+
+        Requests made over a pooled connection are hits, each new connection is a miss.
+
+        :return: dict of host to stats, see :meth:`binance.client.Client.get_pool_stats`
+
+        """
+        stats = {}
+        for key in self.poolmanager.pools.keys():
+            pool = self.poolmanager.pools.get(key)
+            if pool is None:
+                continue
+            stats[pool.host] = {
+                'requests': pool.num_requests,
+                'connections': pool.num_connections,
+                'hits': pool.num_requests - pool.num_connections,
+                'misses': pool.num_connections,
+                'idle': self._count_idle(pool),
+            }
+        return stats
@@ -0,0 +1,724 @@
+# coding=utf-8
+
+import asyncio
+import json
+import time
+from collections import deque
+
+import aiohttp
+
+from .backfill import AggregateTradesBackfill
+from .client import Client, _timer
+from .exchangeinfo import ExchangeInfoCache
+from .helpers import date_to_milliseconds, interval_to_milliseconds
+from .records import AggTrade, BookTicker, DepthUpdate, Kline, Trade, to_records
+from .retry import ORDER_NOT_FOUND_CODE
+from .exceptions import BinanceAPIException, BinanceRequestException, BinanceWithdrawException
+
+
+class AsyncClient(Client):
+    """asyncio version of the Binance API Client
+
+    Every endpoint method available on :class:`binance.client.Client` is available here and
+    returns an awaitable instead of the decoded response.
+
+    .. code:: python
+
+        client = await AsyncClient.create(api_key, api_secret)
+        klines = await client.get_klines(symbol='BNBBTC', interval=AsyncClient.KLINE_INTERVAL_1MINUTE)
+        await client.close_connection()
+
+    """
+
+    DEFAULT_CONNECTOR_LIMIT = 100
+
+    def __init__(self, api_key=None, api_secret=None, requests_params=None, tld='com', rate_limiter=None,
+                 json_loads=None, exchange_info_ttl=ExchangeInfoCache.DEFAULT_TTL, validate_orders=False,
+                 connector_limit=DEFAULT_CONNECTOR_LIMIT, time_sync=None, retry_policy=None, request_hooks=None):
+        """Binance asyncio API Client constructor
+
+        The aiohttp session is created on the first request so the client may be constructed
+        outside of a running event loop. Use :meth:`create` to also check connectivity.
+
+        :param api_key: Api Key
+        :type api_key: str.
+        :param api_secret: Api Secret
+        :type api_secret: str.
+        :param requests_params: optional - Dictionary of aiohttp request params to use for all calls
+        :type requests_params: dict.
+        :param rate_limiter: optional - RateLimiter to hold back calls before they exceed the rate limits
+        :type rate_limiter: binance.ratelimiter.RateLimiter
+        :param json_loads: optional - Function to decode responses with, e.g. orjson.loads. It is passed the
+            response bytes and should raise a ValueError for invalid JSON
+        :type json_loads: function
+        :param exchange_info_ttl: optional - Number of seconds exchange info is cached for symbol lookups,
+            use 0 to fetch it for every lookup
+        :type exchange_info_ttl: int
+        :param validate_orders: optional - Check orders against the cached symbol filters before sending them
+        :type validate_orders: bool
+        :param connector_limit: optional - Maximum number of pooled connections kept open
+        :type connector_limit: int.
+        :param time_sync: optional - ServerTimeSync to timestamp signed requests with the server time, the
+            server clock is measured in a background task started by :meth:`create`
+        :type time_sync: binance.timesync.ServerTimeSync
+        :param retry_policy: optional - RetryPolicy to retry calls failing with a timeout, 5xx or 429 response
+        :type retry_policy: binance.retry.RetryPolicy
+        :param request_hooks: optional - Functions called with the stats of each request, see
+            :meth:`binance.client.Client.add_request_hook`
+        :type request_hooks: list
+
+        """
+
+        self.API_URL = self.API_URL.format(tld)
+        self.WITHDRAW_API_URL = self.WITHDRAW_API_URL.format(tld)
+        self.MARGIN_API_URL = self.MARGIN_API_URL.format(tld)
+        self.WEBSITE_URL = self.WEBSITE_URL.format(tld)
+        self.FUTURES_URL = self.FUTURES_URL.format(tld)
+
+        self.API_KEY = api_key
+        self.API_SECRET = api_secret
+        self._hmac = None
+        self._hmac_secret = None
+        self.session = None
+        self._requests_params = requests_params
+        self._rate_limiter = rate_limiter
+        self._json_loads = json_loads
+        self._exchange_info_cache = ExchangeInfoCache(exchange_info_ttl)
+        self._validate_orders = validate_orders
+        self._connector_limit = connector_limit
+        self._time_sync = time_sync
+        self._time_sync_task = None
+        self._retry_policy = retry_policy
+        self._request_hooks = list(request_hooks or [])
+        self._pool_counts = {}
+        self.response = None
+
+    @classmethod
+    async def create(cls, api_key=None, api_secret=None, requests_params=None, tld='com', **kwargs):
+        """Create the client and init DNS and SSL cert with a ping
+
+        :returns: AsyncClient
+
+        """
+        self = cls(api_key, api_secret, requests_params, tld, **kwargs)
+        await self.ping()
+        if self._time_sync:
+            await self.sync_server_time()
+            self._time_sync_task = asyncio.ensure_future(self._resync_server_time())
+        return self
+
+    async def sync_server_time(self, samples=3):
+        """Measure the server clock for the time_sync
+
+        See :meth:`binance.timesync.ServerTimeSync.sync`
+
+        """
+        measurements = []
+        for _ in range(samples):
+            sent = time.time()
+            server_time = (await self.get_server_time())['serverTime']
+            measurements.append((sent, time.time(), server_time))
+        self._time_sync.update(*min(measurements, key=lambda m: m[1] - m[0]))
+
+    async def _resync_server_time(self):
+        while True:
+            await asyncio.sleep(self._time_sync.resync_interval)
+            try:
+                await self.sync_server_time()
+            except (BinanceAPIException, BinanceRequestException, aiohttp.ClientError, asyncio.TimeoutError):
+                # keep the previous offset and try again at the next interval
+                pass
+
+    async def warmup(self, connections=1):
+        """Open pooled connections to the spot and futures API hosts concurrently
+
+        See :meth:`binance.client.Client.warmup`
+
+        """
+        await asyncio.gather(*[ping() for ping in [self.ping, self.futures_ping] * connections])
+
+    async def map_requests(self, calls, max_workers=None, return_exceptions=True):
+        """Make many API calls concurrently over the pooled connections
+
+        See :meth:`binance.client.Client.map_requests`, max_workers defaults to connector_limit
+
+        """
+        semaphore = asyncio.Semaphore(max_workers or self._connector_limit)
+
+        async def call(method, params):
+            if not callable(method):
+                method = getattr(self, method)
+            async with semaphore:
+                return await method(**params)
+
+        return await asyncio.gather(*[call(method, params) for method, params in calls],
+                                    return_exceptions=return_exceptions)
+
+    def _init_session(self):
+
+        headers = {'Accept': 'application/json',
+                   'User-Agent': 'binance/python'}
+        if self.API_KEY:
+            headers['X-MBX-APIKEY'] = self.API_KEY
+        connector = aiohttp.TCPConnector(limit=self._connector_limit)
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(self._on_request_start)
+        trace_config.on_connection_create_end.append(self._on_connection_create_end)
+        return aiohttp.ClientSession(connector=connector, headers=headers, trace_configs=[trace_config])
+
+    async def _on_request_start(self, session, trace_config_ctx, params):
+        trace_config_ctx.host = params.url.host
+        counts = self._pool_counts.setdefault(params.url.host, {'requests': 0, 'connections': 0})
+        counts['requests'] += 1
+
+    async def _on_connection_create_end(self, session, trace_config_ctx, params):
+        self._pool_counts[trace_config_ctx.host]['connections'] += 1
+
+    def get_pool_stats(self):
+        """Get connection pool usage for each host
+
+        See :meth:`binance.client.Client.get_pool_stats`, the counts are kept from the first request.
+
+        :return: dict of host to stats
+
+        """
+        idle = {}
+        if self.session is not None:
+            # keep-alive connections of the connector waiting to be reused, by host
+            for key, conns in getattr(self.session.connector, '_conns', {}).items():
+                idle[key.host] = idle.get(key.host, 0) + len(conns)
+        stats = {}
+        for host, counts in self._pool_counts.items():
+            stats[host] = {
+                'requests': counts['requests'],
+                'connections': counts['connections'],
+                'hits': counts['requests'] - counts['connections'],
+                'misses': counts['connections'],
+                'idle': idle.get(host, 0),
+            }
+        return stats
+
+    async def close_connection(self):
+        """Close the underlying aiohttp session and its pooled connections
+
+        """
+        if self._time_sync_task is not None:
+            self._time_sync_task.cancel()
+            self._time_sync_task = None
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def _request(self, method, uri, signed, force_params=False, **kwargs):
+
+        if not self._retry_policy or not self._retry_policy.prepare(method, uri, kwargs.get('data')):
+            return await self._send_request(method, uri, signed, force_params, **kwargs)
+
+        data = kwargs.get('data')
+        order_query = self._retry_policy.get_order_query(method, uri, data)
+        attempt = 0
+        while True:
+            if data is not None:
+                # sign each attempt again from the original params
+                kwargs['data'] = dict(data)
+            try:
+                return await self._send_request(method, uri, signed, force_params, **kwargs)
+            except BinanceAPIException as e:
+                exception, status_code, retry_after = e, e.status_code, e.response.headers.get('Retry-After')
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                exception, status_code, retry_after = e, None, None
+            attempt += 1
+            wait = self._retry_policy.get_wait(attempt, status_code, retry_after)
+            if wait is None:
+                raise exception
+            self._retry_policy.notify(attempt, wait, method, uri, exception)
+            await asyncio.sleep(wait)
+            if order_query is not None and self._retry_policy.is_order_unknown(status_code):
+                # the order may have been placed, only send it again if it does not exist
+                order = await self._query_unknown_order(order_query, exception)
+                if order is not None:
+                    return order
+
+    async def _query_unknown_order(self, order_query, exception):
+        """Look up an order whose call failed with an unknown result
+
+        See :meth:`binance.client.Client._query_unknown_order`
+
+        """
+        uri, params = order_query
+        try:
+            return await self._request('get', uri, True, data=dict(params))
+        except BinanceAPIException as e:
+            if e.code == ORDER_NOT_FOUND_CODE:
+                return None
+            raise exception
+        except (aiohttp.ClientError, asyncio.TimeoutError, BinanceRequestException):
+            raise exception
+
+    async def _send_request(self, method, uri, signed, force_params=False, **kwargs):
+
+        if self._rate_limiter:
+            wait = self._rate_limiter.reserve(method, uri, kwargs.get('data'))
+            if wait:
+                await asyncio.sleep(wait)
+
+        stats = None
+        if self._request_hooks:
+            stats = self._get_request_stats(method, uri, kwargs.get('data'))
+            start = _timer()
+
+        kwargs = self._get_request_kwargs(method, signed, force_params, **kwargs)
+
+        # aiohttp expects a ClientTimeout rather than a number of seconds
+        timeout = kwargs.pop('timeout', None)
+        if isinstance(timeout, (int, float)):
+            kwargs['timeout'] = aiohttp.ClientTimeout(total=timeout)
+
+        if self.session is None:
+            self.session = self._init_session()
+
+        if stats is not None:
+            sent = _timer()
+
+        async with getattr(self.session, method)(uri, **kwargs) as response:
+            # calls may run concurrently on one client, self.response only keeps the last response for callers
+            self.response = response
+            if self._rate_limiter:
+                self._rate_limiter.update(uri, response.status, response.headers)
+            if stats is None:
+                return self._handle_response(response, await response.read())
+
+            headers_received = _timer()
+            body = await response.read()
+            received = _timer()
+            stats.update({
+                'status_code': response.status,
+                'bytes': len(body),
+                'prepare_time': sent - start,
+                'ttfb': headers_received - sent,
+                'transfer_time': received - headers_received,
+            })
+            try:
+                return self._handle_response(response, body)
+            finally:
+                decoded = _timer()
+                stats['decode_time'] = decoded - received
+                stats['total_time'] = decoded - start
+                self._call_request_hooks(stats)
+
+    def _handle_response(self, response, body):
+        """Internal helper for handling API responses from the Binance server.
+        Raises the appropriate exceptions when necessary; otherwise, returns the
+        response.
+
+        :param response: aiohttp response
+        :param body: the response body read before the response was released
+        :type body: bytes
+
+        """
+        if not str(response.status).startswith('2'):
+            raise BinanceAPIException(response, response.status, body.decode('utf8', 'replace'))
+        try:
+            if self._json_loads:
+                return self._json_loads(body)
+            return json.loads(body.decode('utf8'))
+        except ValueError:
+            raise BinanceRequestException('Invalid Response: %s' % body.decode('utf8', 'replace'))
+
+    async def _paginate(self, fetch, params, next_params, items_key=None, time_key=None, prefetch=False, id_key=None):
+        end_time = params.get('endTime') if time_key else None
+        seen = set()
+
+        task = asyncio.ensure_future(fetch(**params)) if prefetch else None
+        try:
+            while params is not None:
+                page = await task if prefetch else await fetch(**params)
+                params = next_params(params, page)
+                if prefetch and params is not None:
+                    task = asyncio.ensure_future(fetch(**params))
+
+                ids = set()
+                for item in (page.get(items_key, []) if items_key else page):
+                    if id_key is not None:
+                        ids.add(item[id_key])
+                        if item[id_key] in seen:
+                            continue
+                    if end_time is not None and item[time_key] > end_time:
+                        return
+                    yield item
+                seen = ids
+        finally:
+            if task is not None and not task.done():
+                task.cancel()
+
+    # Endpoints which process the response before returning it
+
+    async def get_symbol_info(self, symbol):
+        """Return information about a symbol
+
+        See :meth:`binance.client.Client.get_symbol_info`
+
+        """
+
+        await self._refresh_exchange_info()
+        return self._exchange_info_cache.get_symbol(symbol)
+
+    async def _refresh_exchange_info(self):
+        if not self._exchange_info_cache.is_valid():
+            self._exchange_info_cache.update(await self.get_exchange_info())
+
+    async def aggregate_trade_iter(self, symbol, start_str=None, last_id=None, end_str=None, max_workers=None):
+        """Iterate over aggregate trade data from (start_time or last_id) to
+        the end of the history so far.
+
+        See :meth:`binance.client.Client.aggregate_trade_iter`, use with ``async for``. With max_workers
+        that many pages are fetched concurrently.
+
+        """
+        if start_str is not None and last_id is not None:
+            raise ValueError(
+                'start_time and last_id may not be simultaneously specified.')
+
+        if max_workers:
+            async for t in self._aggregate_trades_backfill(symbol, start_str, end_str, last_id, max_workers):
+                yield t
+            return
+
+        if last_id is None:
+            if start_str is None:
+                trades = await self.get_aggregate_trades(symbol=symbol, fromId=0)
+            else:
+                if type(start_str) == int:
+                    start_ts = start_str
+                else:
+                    start_ts = date_to_milliseconds(start_str)
+                while True:
+                    end_ts = start_ts + (60 * 60 * 1000)
+                    trades = await self.get_aggregate_trades(
+                        symbol=symbol,
+                        startTime=start_ts,
+                        endTime=end_ts)
+                    if len(trades) > 0:
+                        break
+                    if end_ts > int(time.time() * 1000):
+                        return
+                    start_ts = end_ts
+            for t in trades:
+                yield t
+            last_id = trades[-1][self.AGG_ID]
+
+        while True:
+            trades = await self.get_aggregate_trades(symbol=symbol, fromId=last_id)
+            # fromId=n returns a set starting with id n, but we already have that one
+            trades = trades[1:]
+            if len(trades) == 0:
+                return
+            for t in trades:
+                yield t
+            last_id = trades[-1][self.AGG_ID]
+
+    async def _find_first_agg_trade_id(self, symbol, start_ts):
+        # move forward window by window until a trade is found
+        now = int(time.time() * 1000)
+        while start_ts <= now:
+            trades = await self.get_aggregate_trades(
+                symbol=symbol, startTime=start_ts, endTime=start_ts + AggregateTradesBackfill.SEARCH_WINDOW - 1)
+            if trades:
+                return trades[0]['a']
+            start_ts += AggregateTradesBackfill.SEARCH_WINDOW
+        return None
+
+    async def _aggregate_trades_backfill(self, symbol, start_str, end_str, last_id, max_workers):
+        """Fetch the trades of the range in pages of ids as concurrent tasks, yielding them in order
+
+        See :class:`binance.backfill.AggregateTradesBackfill`
+
+        """
+        if (start_str is None) == (last_id is None):
+            raise ValueError('One of start_str and last_id must be specified.')
+
+        if last_id is not None:
+            first_id = last_id + 1
+        else:
+            start_ts = start_str if type(start_str) == int else date_to_milliseconds(start_str)
+            first_id = await self._find_first_agg_trade_id(symbol, start_ts)
+        if first_id is None:
+            return
+
+        trades = await self.get_aggregate_trades(symbol=symbol, limit=1)
+        if not trades:
+            return
+        end_id = trades[-1]['a']
+        if end_str:
+            end_ts = end_str if type(end_str) == int else date_to_milliseconds(end_str)
+            if trades[-1]['T'] > end_ts:
+                # the last trade of the range is the one before the first trade after it
+                next_id = await self._find_first_agg_trade_id(symbol, end_ts + 1)
+                if next_id is not None:
+                    end_id = next_id - 1
+
+        page_size = AggregateTradesBackfill.PAGE_SIZE
+        pages = deque(range(first_id, end_id + 1, page_size))
+        pending = deque()
+        seen_id = None
+        try:
+            while pages or pending:
+                # keep max_workers pages in flight
+                while pages and len(pending) < max_workers:
+                    page_start = pages.popleft()
+                    task = asyncio.ensure_future(
+                        self.get_aggregate_trades(symbol=symbol, fromId=page_start, limit=page_size))
+                    pending.append((task, min(page_start + page_size - 1, end_id)))
+                task, page_end = pending.popleft()
+                for trade in await task:
+                    if trade['a'] > page_end or (seen_id is not None and trade['a'] <= seen_id):
+                        continue
+                    seen_id = trade['a']
+                    yield trade
+        finally:
+            for task, _ in pending:
+                task.cancel()
+
+    async def _get_earliest_valid_timestamp(self, symbol, interval):
+        kline = await self.get_klines(
+            symbol=symbol,
+            interval=interval,
+            limit=1,
+            startTime=0,
+            endTime=None
+        )
+        return kline[0][0]
+
+    async def get_historical_klines(self, symbol, interval, start_str, end_str=None,
+                                    limit=500):
+        """Get Historical Klines from Binance
+
+        See :meth:`binance.client.Client.get_historical_klines`
+
+        """
+        output_data = []
+        async for kline in self.get_historical_klines_generator(symbol, interval, start_str, end_str, limit):
+            output_data.append(kline)
+        return output_data
+
+    async def get_historical_klines_generator(self, symbol, interval, start_str, end_str=None, limit=500):
+        """Get Historical Klines from Binance
+
+        See :meth:`binance.client.Client.get_historical_klines_generator`, use with ``async for``
+
+        """
+        async for klines in self._historical_klines_pages(symbol, interval, start_str, end_str, limit):
+            for o in klines:
+                yield o
+
+    async def get_klines_columns(self, **params):
+        """Kline/candlestick bars for a symbol as columns of NumPy arrays, requires numpy.
+
+        See :meth:`binance.client.Client.get_klines_columns`
+
+        """
+        from .columns import KlineColumnsBuilder
+
+        builder = KlineColumnsBuilder()
+        builder.append(await self.get_klines(**params))
+        return builder.get_columns()
+
+    async def get_historical_klines_columns(self, symbol, interval, start_str, end_str=None, limit=1000):
+        """Get Historical Klines from Binance as columns of NumPy arrays
+
+        See :meth:`binance.client.Client.get_historical_klines_columns`
+
+        """
+        from .columns import KlineColumnsBuilder
+
+        builder = KlineColumnsBuilder()
+        async for klines in self._historical_klines_pages(symbol, interval, start_str, end_str, limit):
+            builder.append(klines)
+        return builder.get_columns()
+
+    async def _historical_klines_pages(self, symbol, interval, start_str, end_str, limit):
+        timeframe = interval_to_milliseconds(interval)
+
+        if type(start_str) == int:
+            start_ts = start_str
+        else:
+            start_ts = date_to_milliseconds(start_str)
+
+        first_valid_ts = await self._get_earliest_valid_timestamp(symbol, interval)
+        start_ts = max(start_ts, first_valid_ts)
+
+        end_ts = None
+        if end_str:
+            if type(end_str) == int:
+                end_ts = end_str
+            else:
+                end_ts = date_to_milliseconds(end_str)
+
+        idx = 0
+        while True:
+            output_data = await self.get_klines(
+                symbol=symbol,
+                interval=interval,
+                limit=limit,
+                startTime=start_ts,
+                endTime=end_ts
+            )
+
+            if not len(output_data):
+                break
+
+            yield output_data
+
+            start_ts = output_data[-1][0]
+
+            idx += 1
+            if len(output_data) < limit:
+                break
+
+            start_ts += timeframe
+
+            # sleep after every 3rd call to be kind to the API
+            if idx % 3 == 0:
+                await asyncio.sleep(1)
+
+    async def get_order_book_record(self, **params):
+        """Get the Order Book for the market as a record
+
+        See :meth:`binance.client.Client.get_order_book_record`
+
+        """
+        return to_records(DepthUpdate, await self.get_order_book(**params))
+
+    async def get_recent_trade_records(self, **params):
+        """Get recent trades as records
+
+        See :meth:`binance.client.Client.get_recent_trade_records`
+
+        """
+        return to_records(Trade, await self.get_recent_trades(**params))
+
+    async def get_aggregate_trade_records(self, **params):
+        """Get compressed, aggregate trades as records
+
+        See :meth:`binance.client.Client.get_aggregate_trade_records`
+
+        """
+        return to_records(AggTrade, await self.get_aggregate_trades(**params))
+
+    async def get_kline_records(self, **params):
+        """Kline/candlestick bars for a symbol as records
+
+        See :meth:`binance.client.Client.get_kline_records`
+
+        """
+        return to_records(Kline, await self.get_klines(**params))
+
+    async def get_orderbook_ticker_records(self, **params):
+        """Best price and quantity on the order book for a symbol or symbols as records
+
+        See :meth:`binance.client.Client.get_orderbook_ticker_records`
+
+        """
+        return to_records(BookTicker, await self.get_orderbook_ticker(**params))
+
+    async def create_order(self, **params):
+        """Send in a new order
+
+        See :meth:`binance.client.Client.create_order`
+
+        """
+        if self._validate_orders:
+            await self._refresh_exchange_info()
+            self._exchange_info_cache.validate_order(params)
+        return await self._post('order', True, data=params)
+
+    async def create_oco_order(self, **params):
+        """Send in a new OCO order
+
+        See :meth:`binance.client.Client.create_oco_order`
+
+        """
+        if self._validate_orders:
+            await self._refresh_exchange_info()
+            self._exchange_info_cache.validate_oco_order(params)
+        return await self._post('order/oco', True, data=params)
+
+    async def get_asset_balance(self, asset, **params):
+        """Get current asset balance.
+
+        See :meth:`binance.client.Client.get_asset_balance`
+
+        """
+        res = await self.get_account(**params)
+        if 'balances' in res:
+            for bal in res['balances']:
+                if bal['asset'].lower() == asset.lower():
+                    return bal
+        return None
+
+    async def _request_withdraw_api_checked(self, method, path, **params):
+        res = await self._request_withdraw_api(method, path, True, data=params)
+        if not res['success']:
+            raise BinanceWithdrawException(res['msg'])
+        return res
+
+    async def get_account_status(self, **params):
+        """Get account status detail.
+
+        See :meth:`binance.client.Client.get_account_status`
+
+        """
+        return await self._request_withdraw_api_checked('get', 'accountStatus.html', **params)
+
+    async def get_dust_log(self, **params):
+        """Get log of small amounts exchanged for BNB.
+
+        See :meth:`binance.client.Client.get_dust_log`
+
+        """
+        return await self._request_withdraw_api_checked('get', 'userAssetDribbletLog.html', **params)
+
+    async def get_trade_fee(self, **params):
+        """Get trade fee.
+
+        See :meth:`binance.client.Client.get_trade_fee`
+
+        """
+        return await self._request_withdraw_api_checked('get', 'tradeFee.html', **params)
+
+    async def get_asset_details(self, **params):
+        """Fetch details on assets.
+
+        See :meth:`binance.client.Client.get_asset_details`
+
+        """
+        return await self._request_withdraw_api_checked('get', 'assetDetail.html', **params)
+
+    async def withdraw(self, **params):
+        """Submit a withdraw request.
+
+        See :meth:`binance.client.Client.withdraw`
+
+        """
+        # force a name for the withdrawal if one not set
+        if 'asset' in params and 'name' not in params:
+            params['name'] = params['asset']
+        return await self._request_withdraw_api_checked('post', 'withdraw.html', **params)
+
+    async def stream_get_listen_key(self):
+        """Start a new user data stream and return the listen key
+
+        See :meth:`binance.client.Client.stream_get_listen_key`
+
+        """
+        res = await self._post('userDataStream', False, data={})
+        return res['listenKey']
+
+    async def margin_stream_get_listen_key(self):
+        """Start a new margin data stream and return the listen key
+
+        See :meth:`binance.client.Client.margin_stream_get_listen_key`
+
+        """
+        res = await self._request_margin_api('post', 'userDataStream', signed=True, data={})
+        return res['listenKey']
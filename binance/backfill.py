@@ -0,0 +1,299 @@
+# coding=utf-8
+
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from .helpers import date_to_milliseconds, interval_to_milliseconds
+
+
+def fetch_in_order(fetch, pages, max_workers):
+    """Call fetch for each page concurrently, yielding the results in order
+
+    At most max_workers pages are fetched ahead of the result being yielded.
+
+    :param fetch: function taking a page
+    :type fetch: function
+    :param pages: pages to fetch
+    :type pages: list
+    :param max_workers: Number of pages to fetch concurrently
+    :type max_workers: int
+
+    :return: generator of fetch results
+
+    """
+    pages = deque(pages)
+    pending = deque()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while pages or pending:
+            # keep the pool busy without holding more than max_workers pages in memory
+            while pages and len(pending) < max_workers:
+                pending.append(executor.submit(fetch, pages.popleft()))
+            yield pending.popleft().result()
+
+
+class KlinesBackfill(object):
+
+    DEFAULT_MAX_WORKERS = 4
+
+    def __init__(self, client, symbol, interval, start_str, end_str=None, limit=500,
+                 max_workers=DEFAULT_MAX_WORKERS, checkpoint_file=None):
+        """Initialise the KlinesBackfill
+
+        The requested range is split into pages of limit klines up front which are fetched concurrently
+        and returned in order. Pass a rate_limiter to the client to keep the concurrent calls within the
+        rate limits.
+
+        See dateparser docs for valid start and end string formats http://dateparser.readthedocs.io/en/latest/
+
+        :param client: Binance API client
+        :type client: binance.Client
+        :param symbol: Name of symbol pair e.g BNBBTC
+        :type symbol: str
+        :param interval: Binance Kline interval, monthly intervals are not supported
+        :type interval: str
+        :param start_str: Start date string in UTC format or timestamp in milliseconds
+        :type start_str: str|int
+        :param end_str: optional - end date string in UTC format or timestamp in milliseconds (default will fetch everything up to now)
+        :type end_str: str|int
+        :param limit: Number of klines per request, default 500; max 1000.
+        :type limit: int
+        :param max_workers: Number of pages to fetch concurrently
+        :type max_workers: int
+        :param checkpoint_file: optional - path of a file to record fetched pages in, an interrupted
+            backfill with the same checkpoint file resumes without fetching those pages again. Only pages
+            of closed klines are recorded, pages still open are fetched again.
+        :type checkpoint_file: str
+
+        """
+        self._client = client
+        self._symbol = symbol
+        self._interval = interval
+        self._limit = limit
+        self._max_workers = max_workers
+        self._checkpoint_file = checkpoint_file
+
+        self._timeframe = interval_to_milliseconds(interval)
+        if self._timeframe is None:
+            raise ValueError('Backfill requires a fixed length interval, got {}'.format(interval))
+
+        if type(start_str) == int:
+            self._start_ts = start_str
+        else:
+            self._start_ts = date_to_milliseconds(start_str)
+
+        self._end_ts = None
+        if end_str:
+            if type(end_str) == int:
+                self._end_ts = end_str
+            else:
+                self._end_ts = date_to_milliseconds(end_str)
+
+    def get_pages(self):
+        """Split the backfill range into pages
+
+        :return: list of (startTime, endTime) tuples, both inclusive
+
+        """
+        # establish first available start timestamp
+        first_valid_ts = self._client._get_earliest_valid_timestamp(self._symbol, self._interval)
+        start_ts = max(self._start_ts, first_valid_ts)
+        end_ts = self._end_ts if self._end_ts is not None else int(time.time() * 1000)
+
+        page_length = self._limit * self._timeframe
+        pages = []
+        for page_start in range(start_ts, end_ts + 1, page_length):
+            pages.append((page_start, min(page_start + page_length - 1, end_ts)))
+        return pages
+
+    def _load_checkpoint(self):
+        pages = {}
+        if not self._checkpoint_file or not os.path.exists(self._checkpoint_file):
+            return pages
+        with open(self._checkpoint_file) as f:
+            for line in f:
+                try:
+                    page = json.loads(line)
+                except ValueError:
+                    # ignore a partially written last line from an interrupted run
+                    continue
+                if page.get('symbol') != self._symbol or page.get('interval') != self._interval:
+                    raise ValueError('Checkpoint file {} is for {} {}, not {} {}'.format(
+                        self._checkpoint_file, page.get('symbol'), page.get('interval'), self._symbol,
+                        self._interval))
+                pages[(page['start'], page['end'])] = page['klines']
+        return pages
+
+    def _save_checkpoint(self, page, klines):
+        if not self._checkpoint_file:
+            return
+        with open(self._checkpoint_file, 'a') as f:
+            f.write(json.dumps({'symbol': self._symbol, 'interval': self._interval, 'start': page[0],
+                                'end': page[1], 'klines': klines}) + '\n')
+
+    def _fetch_page(self, page):
+        return self._client.get_klines(
+            symbol=self._symbol,
+            interval=self._interval,
+            limit=self._limit,
+            startTime=page[0],
+            endTime=page[1]
+        )
+
+    def pages_generator(self):
+        """Fetch the pages concurrently, yielding each page of klines in order
+
+        At most max_workers pages are fetched ahead of the page being yielded.
+
+        :return: generator of lists of OHLCV values
+
+        """
+        completed = self._load_checkpoint()
+
+        def fetch(page):
+            if page in completed:
+                return page, completed.pop(page), False
+            fetch_time = int(time.time() * 1000)
+            klines = self._fetch_page(page)
+            # a page ending within the last interval may be missing klines or hold the open kline
+            return page, klines, page[1] + self._timeframe < fetch_time
+
+        for page, klines, save in fetch_in_order(fetch, self.get_pages(), self._max_workers):
+            # written here rather than in the workers so lines of concurrent pages don't interleave
+            if save:
+                self._save_checkpoint(page, klines)
+            yield klines
+
+    def klines_generator(self):
+        """Fetch the klines concurrently, yielding them in order
+
+        :return: generator of OHLCV values
+
+        """
+        for klines in self.pages_generator():
+            for kline in klines:
+                yield kline
+
+    def get_klines(self):
+        """Fetch all klines in the backfill range
+
+        :return: list of OHLCV values
+
+        """
+        output_data = []
+        for klines in self.pages_generator():
+            output_data += klines
+        return output_data
+
+
+class AggregateTradesBackfill(object):
+
+    DEFAULT_MAX_WORKERS = 4
+    PAGE_SIZE = 1000
+    # length of the time windows searched for the first trade after a time
+    SEARCH_WINDOW = 60 * 60 * 1000
+
+    def __init__(self, client, symbol, start_str=None, end_str=None, last_id=None,
+                 max_workers=DEFAULT_MAX_WORKERS):
+        """Initialise the AggregateTradesBackfill
+
+        The ids of the first and last trade of the range are looked up, the ids between them are split
+        into pages which are fetched concurrently and returned in order.
+
+        See dateparser docs for valid start and end string formats http://dateparser.readthedocs.io/en/latest/
+
+        :param client: Binance API client
+        :type client: binance.Client
+        :param symbol: Name of symbol pair e.g BNBBTC
+        :type symbol: str
+        :param start_str: Start date string in UTC format or timestamp in milliseconds
+        :type start_str: str|int
+        :param end_str: optional - end date string in UTC format or timestamp in milliseconds (default will fetch everything up to now)
+        :type end_str: str|int
+        :param last_id: optional - aggregate trade ID of the last known aggregate trade, start with the trade after it instead of start_str
+        :type last_id: int
+        :param max_workers: Number of pages to fetch concurrently
+        :type max_workers: int
+
+        """
+        if (start_str is None) == (last_id is None):
+            raise ValueError('One of start_str and last_id must be specified.')
+
+        self._client = client
+        self._symbol = symbol
+        self._last_id = last_id
+        self._max_workers = max_workers
+
+        self._start_ts = None
+        if start_str is not None:
+            if type(start_str) == int:
+                self._start_ts = start_str
+            else:
+                self._start_ts = date_to_milliseconds(start_str)
+
+        self._end_ts = None
+        if end_str:
+            if type(end_str) == int:
+                self._end_ts = end_str
+            else:
+                self._end_ts = date_to_milliseconds(end_str)
+
+    def _find_first_id(self, start_ts):
+        # move forward window by window until a trade is found
+        now = int(time.time() * 1000)
+        while start_ts <= now:
+            trades = self._client.get_aggregate_trades(
+                symbol=self._symbol, startTime=start_ts, endTime=start_ts + self.SEARCH_WINDOW - 1)
+            if trades:
+                return trades[0]['a']
+            start_ts += self.SEARCH_WINDOW
+        return None
+
+    def _get_last_id(self):
+        trades = self._client.get_aggregate_trades(symbol=self._symbol, limit=1)
+        if not trades:
+            return None
+        if self._end_ts is None or trades[-1]['T'] <= self._end_ts:
+            return trades[-1]['a']
+        # the last trade of the range is the one before the first trade after it
+        next_id = self._find_first_id(self._end_ts + 1)
+        return next_id - 1 if next_id is not None else trades[-1]['a']
+
+    def get_pages(self):
+        """Split the range into pages of trade ids
+
+        :return: list of (first id, last id) tuples, both inclusive
+
+        """
+        if self._last_id is not None:
+            first_id = self._last_id + 1
+        else:
+            first_id = self._find_first_id(self._start_ts)
+        if first_id is None:
+            return []
+        last_id = self._get_last_id()
+        if last_id is None or last_id < first_id:
+            return []
+        return [(page_start, min(page_start + self.PAGE_SIZE - 1, last_id))
+                for page_start in range(first_id, last_id + 1, self.PAGE_SIZE)]
+
+    def _fetch_page(self, page):
+        trades = self._client.get_aggregate_trades(symbol=self._symbol, fromId=page[0], limit=self.PAGE_SIZE)
+        return [t for t in trades if t['a'] <= page[1]]
+
+    def trades_generator(self):
+        """Fetch the trades concurrently, yielding them in order without duplicates
+
+        :return: generator of aggregate trades
+
+        """
+        last_id = None
+        for trades in fetch_in_order(self._fetch_page, self.get_pages(), self._max_workers):
+            for trade in trades:
+                if last_id is not None and trade['a'] <= last_id:
+                    continue
+                last_id = trade['a']
+                yield trade
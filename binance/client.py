@@ -4,10 +4,25 @@ import hashlib
 import hmac
 import requests
 import time
+from concurrent.futures import ThreadPoolExecutor
 from operator import itemgetter
+try:
+    from urllib.parse import urlparse
+except ImportError:  # pragma: no cover
+    from urlparse import urlparse
+from .adapters import PooledHTTPAdapter
+from .backfill import AggregateTradesBackfill
+from .exchangeinfo import ExchangeInfoCache
+from .pagination import id_cursor, page_number_cursor, time_cursor, time_window_cursor
+from .ratelimiter import get_endpoint, get_request_weight
+from .records import AggTrade, BookTicker, DepthUpdate, Kline, Trade, to_records
+from .retry import ORDER_NOT_FOUND_CODE
 from .helpers import date_to_milliseconds, interval_to_milliseconds
 from .exceptions import BinanceAPIException, BinanceRequestException, BinanceWithdrawException
 
+# timer for request stats, perf_counter is not available on python 2
+_timer = getattr(time, 'perf_counter', time.time)
+
 
 class Client(object):
 
@@ -22,6 +37,13 @@ class Client(object):
     MARGIN_API_VERSION = 'v1'
     FUTURES_API_VERSION = 'v1'
 
+    FORM_CONTENT_TYPE = 'application/x-www-form-urlencoded'
+
+    DEFAULT_POOL_MAXSIZE = 10
+
+    # length of the time windows deposit and withdraw history are fetched in
+    HISTORY_WINDOW = 90 * 24 * 60 * 60 * 1000
+
     SYMBOL_TYPE_SPOT = 'SPOT'
 
     ORDER_STATUS_NEW = 'NEW'
@@ -77,7 +99,10 @@ class Client(object):
     AGG_BUYER_MAKES = 'm'
     AGG_BEST_MATCH = 'M'
 
-    def __init__(self, api_key=None, api_secret=None, requests_params=None, tld='com'):
+    def __init__(self, api_key=None, api_secret=None, requests_params=None, tld='com', rate_limiter=None,
+                 json_loads=None, exchange_info_ttl=ExchangeInfoCache.DEFAULT_TTL, validate_orders=False,
+                 pool_maxsize=DEFAULT_POOL_MAXSIZE, pool_block=False, tcp_keepalive=False, ping=True,
+                 time_sync=None, retry_policy=None, request_hooks=None):
         """Binance API Client constructor
 
         :param api_key: Api Key
@@ -86,6 +111,35 @@ class Client(object):
         :type api_secret: str.
         :param requests_params: optional - Dictionary of requests params to use for all calls
         :type requests_params: dict.
+        :param rate_limiter: optional - RateLimiter to hold back calls before they exceed the rate limits,
+            may be shared between clients
+        :type rate_limiter: binance.ratelimiter.RateLimiter
+        :param json_loads: optional - Function to decode responses with, e.g. orjson.loads. It is passed the
+            response bytes and should raise a ValueError for invalid JSON
+        :type json_loads: function
+        :param exchange_info_ttl: optional - Number of seconds exchange info is cached for symbol lookups,
+            use 0 to fetch it for every lookup
+        :type exchange_info_ttl: int
+        :param validate_orders: optional - Check orders against the cached symbol filters before sending them
+        :type validate_orders: bool
+        :param pool_maxsize: optional - Number of connections kept open to each host, set it to at least the
+            number of threads sharing the client
+        :type pool_maxsize: int
+        :param pool_block: optional - Wait for a pooled connection when all are in use instead of opening
+            an extra connection which is closed after the request
+        :type pool_block: bool
+        :param tcp_keepalive: optional - Enable TCP keep-alive probes on pooled connections
+        :type tcp_keepalive: bool
+        :param ping: optional - Ping the server to init DNS and SSL cert, pass False to defer connecting
+            to the first request or an explicit :meth:`warmup`
+        :type ping: bool
+        :param time_sync: optional - ServerTimeSync to timestamp signed requests with the server time, the
+            server clock is measured in a background thread
+        :type time_sync: binance.timesync.ServerTimeSync
+        :param retry_policy: optional - RetryPolicy to retry calls failing with a timeout, 5xx or 429 response
+        :type retry_policy: binance.retry.RetryPolicy
+        :param request_hooks: optional - Functions called with the stats of each request, see :meth:`add_request_hook`
+        :type request_hooks: list
 
         """
 
@@ -97,12 +151,47 @@ class Client(object):
 
         self.API_KEY = api_key
         self.API_SECRET = api_secret
+        self._hmac = None
+        self._hmac_secret = None
+        self._pool_maxsize = pool_maxsize
+        self._pool_block = pool_block
+        self._tcp_keepalive = tcp_keepalive
         self.session = self._init_session()
         self._requests_params = requests_params
+        self._rate_limiter = rate_limiter
+        self._json_loads = json_loads
+        self._exchange_info_cache = ExchangeInfoCache(exchange_info_ttl)
+        self._validate_orders = validate_orders
+        self._time_sync = time_sync
+        self._retry_policy = retry_policy
+        self._request_hooks = list(request_hooks or [])
+        self._time_sync_session = None
         self.response = None
 
         # init DNS and SSL cert
-        self.ping()
+        if ping:
+            self.ping()
+
+        if self._time_sync:
+            if ping:
+                self._time_sync.sync(self.get_server_time)
+            self._time_sync.start(self._get_sync_server_time)
+
+    def _get_sync_server_time(self):
+        """Get the server time for the background time sync
+
+        Uses its own session so the sync thread never touches self.response or the session of the caller.
+
+        """
+        if self._time_sync_session is None:
+            self._time_sync_session = self._init_session()
+        uri = self._create_api_uri('time', False, self.PUBLIC_API_VERSION)
+        if self._rate_limiter:
+            self._rate_limiter.acquire('get', uri, None)
+        response = self._time_sync_session.get(uri, **(self._requests_params or {}))
+        if self._rate_limiter:
+            self._rate_limiter.update(uri, response.status_code, response.headers)
+        return self._handle_response(response)
 
     def _init_session(self):
 
@@ -110,8 +199,113 @@ class Client(object):
         session.headers.update({'Accept': 'application/json',
                                 'User-Agent': 'binance/python',
                                 'X-MBX-APIKEY': self.API_KEY})
+        # give each host its own connection pool
+        for url in self._get_host_urls():
+            session.mount(url, PooledHTTPAdapter(pool_maxsize=self._pool_maxsize, pool_block=self._pool_block,
+                                                 tcp_keepalive=self._tcp_keepalive))
         return session
 
+    def warmup(self, connections=1):
+        """Open pooled connections to the spot and futures API hosts in parallel
+
+        Use with ``ping=False`` to connect at a convenient time instead of on construction.
+
+        .. code:: python
+
+            client = Client(api_key, api_secret, ping=False)
+            client.warmup(connections=4)
+
+        :param connections: Number of connections to open to each host, at most pool_maxsize are kept
+        :type connections: int
+
+        :raises: BinanceRequestException, BinanceAPIException
+
+        """
+        pings = [self.ping, self.futures_ping] * connections
+        with ThreadPoolExecutor(max_workers=len(pings)) as executor:
+            futures = [executor.submit(ping) for ping in pings]
+        for future in futures:
+            future.result()
+
+    def map_requests(self, calls, max_workers=None, return_exceptions=True):
+        """Make many API calls concurrently over the pooled connections
+
+        Calls go through the client's rate limiter if one is set, so a large batch is spread out
+        within the rate limits.
+
+        .. code:: python
+
+            orders = client.map_requests([
+                ('get_order', {'symbol': 'BNBBTC', 'orderId': order_id}) for order_id in order_ids
+            ])
+
+        :param calls: list of (method, params) tuples, method is the name of a client method or the method itself
+        :type calls: list
+        :param max_workers: optional - Number of calls to make at once, defaults to pool_maxsize
+        :type max_workers: int
+        :param return_exceptions: optional - Return the exception of a failed call in place of its result,
+            if False the first failed call raises
+        :type return_exceptions: bool
+
+        :return: list of results in the order of the calls
+
+        """
+        if not calls:
+            return []
+
+        def call(method, params):
+            if not callable(method):
+                method = getattr(self, method)
+            return method(**params)
+
+        results = []
+        with ThreadPoolExecutor(max_workers=min(max_workers or self._pool_maxsize, len(calls))) as executor:
+            futures = [executor.submit(call, method, params) for method, params in calls]
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    if not return_exceptions:
+                        raise
+                    results.append(e)
+        return results
+
+    def _get_host_urls(self):
+        urls = []
+        for url in (self.API_URL, self.WITHDRAW_API_URL, self.MARGIN_API_URL, self.WEBSITE_URL, self.FUTURES_URL):
+            parsed = urlparse(url)
+            host_url = '{}://{}/'.format(parsed.scheme, parsed.netloc)
+            if host_url not in urls:
+                urls.append(host_url)
+        return urls
+
+    def get_pool_stats(self):
+        """Get connection pool usage for each host
+
+        A request sent over an open pooled connection is a hit, a request which had to open a new
+        connection is a miss. A high number of misses with many threads means pool_maxsize is too small.
+
+        :return: dict of host to stats
+
+        .. code-block:: python
+
+            {
+                "api.binance.com": {
+                    "requests": 120,
+                    "connections": 4,
+                    "hits": 116,
+                    "misses": 4,
+                    "idle": 3
+                }
+            }
+
+        """
+        stats = {}
+        for adapter in self.session.adapters.values():
+            if isinstance(adapter, PooledHTTPAdapter):
+                stats.update(adapter.get_pool_stats())
+        return stats
+
     def _create_api_uri(self, path, signed=True, version=PUBLIC_API_VERSION):
         v = self.PRIVATE_API_VERSION if signed else version
         return self.API_URL + '/' + v + '/' + path
@@ -132,7 +326,16 @@ class Client(object):
 
         ordered_data = self._order_params(data)
         query_string = '&'.join(["{}={}".format(d[0], d[1]) for d in ordered_data])
-        m = hmac.new(self.API_SECRET.encode('utf-8'), query_string.encode('utf-8'), hashlib.sha256)
+        return self._sign(query_string)
+
+    def _sign(self, query_string):
+
+        # key the HMAC once and copy it for each signature, rekey if the secret is changed
+        if self._hmac is None or self._hmac_secret != self.API_SECRET:
+            self._hmac = hmac.new(self.API_SECRET.encode('utf-8'), digestmod=hashlib.sha256)
+            self._hmac_secret = self.API_SECRET
+        m = self._hmac.copy()
+        m.update(query_string.encode('utf-8'))
         return m.hexdigest()
 
     def _order_params(self, data):
@@ -155,7 +358,12 @@ class Client(object):
             params.append(('signature', data['signature']))
         return params
 
-    def _request(self, method, uri, signed, force_params=False, **kwargs):
+    def _get_timestamp(self):
+        if self._time_sync:
+            return self._time_sync.timestamp()
+        return int(time.time() * 1000)
+
+    def _get_request_kwargs(self, method, signed, force_params=False, **kwargs):
 
         # set default requests timeout
         kwargs['timeout'] = 10
@@ -175,26 +383,180 @@ class Client(object):
                 del(kwargs['data']['requests_params'])
 
         if signed:
-            # generate signature
-            kwargs['data']['timestamp'] = int(time.time() * 1000)
-            kwargs['data']['signature'] = self._generate_signature(kwargs['data'])
+            kwargs['data']['timestamp'] = self._get_timestamp()
 
-        # sort get and post params to match signature order
+        data = kwargs.get('data', None)
         if data:
-            # sort post params
-            kwargs['data'] = self._order_params(kwargs['data'])
-            # Remove any arguments with values of None.
-            null_args = [i for i, (key, value) in enumerate(kwargs['data']) if value is None]
-            for i in reversed(null_args):
-                del kwargs['data'][i]
+            # build the query string once, without arguments with values of None, and send it
+            # exactly as it was signed
+            query_string = '&'.join('%s=%s' % (key, value) for key, value in self._order_params(data) if value is not None)
+            if signed:
+                query_string += '&signature=' + self._sign(query_string)
+
+            # if get request pass the query string as params for requests lib
+            if method == 'get' or force_params:
+                kwargs['params'] = query_string
+                del(kwargs['data'])
+            else:
+                kwargs['data'] = query_string
+                kwargs['headers'] = dict(kwargs.get('headers') or {}, **{'Content-Type': self.FORM_CONTENT_TYPE})
+
+        return kwargs
+
+    def _request(self, method, uri, signed, force_params=False, **kwargs):
 
-        # if get request assign data array to params value for requests lib
-        if data and (method == 'get' or force_params):
-            kwargs['params'] = '&'.join('%s=%s' % (data[0], data[1]) for data in kwargs['data'])
-            del(kwargs['data'])
+        if not self._retry_policy or not self._retry_policy.prepare(method, uri, kwargs.get('data')):
+            return self._send_request(method, uri, signed, force_params, **kwargs)
 
-        self.response = getattr(self.session, method)(uri, **kwargs)
-        return self._handle_response()
+        data = kwargs.get('data')
+        order_query = self._retry_policy.get_order_query(method, uri, data)
+        attempt = 0
+        while True:
+            if data is not None:
+                # sign each attempt again from the original params
+                kwargs['data'] = dict(data)
+            try:
+                return self._send_request(method, uri, signed, force_params, **kwargs)
+            except BinanceAPIException as e:
+                exception, status_code, retry_after = e, e.status_code, e.response.headers.get('Retry-After')
+            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+                exception, status_code, retry_after = e, None, None
+            attempt += 1
+            wait = self._retry_policy.get_wait(attempt, status_code, retry_after)
+            if wait is None:
+                raise exception
+            self._retry_policy.notify(attempt, wait, method, uri, exception)
+            time.sleep(wait)
+            if order_query is not None and self._retry_policy.is_order_unknown(status_code):
+                # the order may have been placed, only send it again if it does not exist
+                order = self._query_unknown_order(order_query, exception)
+                if order is not None:
+                    return order
+
+    def _query_unknown_order(self, order_query, exception):
+        """Look up an order whose call failed with an unknown result
+
+        :param order_query: tuple of query uri and params from RetryPolicy.get_order_query
+        :param exception: exception of the failed call, raised if the order can't be looked up
+
+        :return: the order or None if it does not exist
+
+        """
+        uri, params = order_query
+        try:
+            return self._request('get', uri, True, data=dict(params))
+        except BinanceAPIException as e:
+            if e.code == ORDER_NOT_FOUND_CODE:
+                return None
+            raise exception
+        except (requests.exceptions.RequestException, BinanceRequestException):
+            raise exception
+
+    def _send_request(self, method, uri, signed, force_params=False, **kwargs):
+
+        if self._rate_limiter:
+            self._rate_limiter.acquire(method, uri, kwargs.get('data'))
+
+        if self._request_hooks:
+            return self._send_request_with_hooks(method, uri, signed, force_params, **kwargs)
+
+        kwargs = self._get_request_kwargs(method, signed, force_params, **kwargs)
+
+        # calls may run concurrently on one client, self.response only keeps the last response for callers
+        response = self.response = getattr(self.session, method)(uri, **kwargs)
+
+        if self._rate_limiter:
+            self._rate_limiter.update(uri, response.status_code, response.headers)
+
+        return self._handle_response(response)
+
+    def _send_request_with_hooks(self, method, uri, signed, force_params=False, **kwargs):
+
+        stats = self._get_request_stats(method, uri, kwargs.get('data'))
+
+        start = _timer()
+        kwargs = self._get_request_kwargs(method, signed, force_params, **kwargs)
+        sent = _timer()
+
+        response = self.response = getattr(self.session, method)(uri, **kwargs)
+        received = _timer()
+
+        if self._rate_limiter:
+            self._rate_limiter.update(uri, response.status_code, response.headers)
+
+        # the response body has been read, elapsed is the time until the headers were parsed
+        ttfb = response.elapsed.total_seconds()
+        stats.update({
+            'status_code': response.status_code,
+            'bytes': len(response.content),
+            'prepare_time': sent - start,
+            'ttfb': ttfb,
+            'transfer_time': max(received - sent - ttfb, 0.0),
+        })
+        try:
+            return self._handle_response(response)
+        finally:
+            decoded = _timer()
+            stats['decode_time'] = decoded - received
+            stats['total_time'] = decoded - start
+            self._call_request_hooks(stats)
+
+    def _get_request_stats(self, method, uri, params):
+        host, endpoint = get_endpoint(uri)
+        return {
+            'method': method,
+            'host': host,
+            'endpoint': endpoint,
+            'weight': get_request_weight(endpoint, params),
+        }
+
+    def _call_request_hooks(self, stats):
+        for hook in self._request_hooks:
+            hook(stats)
+
+    def add_request_hook(self, hook):
+        """Add a function called with the stats of each request
+
+        The function is passed a dict of numbers, times are in seconds. The time to resolve and connect
+        to the host is part of the ttfb.
+
+        .. code:: python
+
+            def record_latency(stats):
+                histograms[stats['endpoint']].observe(stats['total_time'])
+
+            client.add_request_hook(record_latency)
+
+        .. code-block:: python
+
+            {
+                "method": "get",
+                "host": "api.binance.com",
+                "endpoint": "klines",
+                "weight": 1,
+                "status_code": 200,
+                "bytes": 46512,
+                "prepare_time": 0.000012,   # ordering and signing params
+                "ttfb": 0.0421,             # request sent until response headers received
+                "transfer_time": 0.0017,    # response headers until body received
+                "decode_time": 0.0009,      # JSON decoding
+                "total_time": 0.0449
+            }
+
+        :param hook: function taking the stats dict
+        :type hook: function
+
+        """
+        self._request_hooks.append(hook)
+
+    def remove_request_hook(self, hook):
+        """Remove a function added with :meth:`add_request_hook`
+
+        :param hook: function taking the stats dict
+        :type hook: function
+
+        """
+        self._request_hooks.remove(hook)
 
     def _request_api(self, method, path, signed=False, version=PUBLIC_API_VERSION, **kwargs):
         uri = self._create_api_uri(path, signed, version)
@@ -221,17 +583,19 @@ class Client(object):
 
         return self._request(method, uri, signed, True, **kwargs)
 
-    def _handle_response(self):
+    def _handle_response(self, response):
         """Internal helper for handling API responses from the Binance server.
         Raises the appropriate exceptions when necessary; otherwise, returns the
         response.
         """
-        if not str(self.response.status_code).startswith('2'):
-            raise BinanceAPIException(self.response)
+        if not str(response.status_code).startswith('2'):
+            raise BinanceAPIException(response)
         try:
-            return self.response.json()
+            if self._json_loads:
+                return self._json_loads(response.content)
+            return response.json()
         except ValueError:
-            raise BinanceRequestException('Invalid Response: %s' % self.response.text)
+            raise BinanceRequestException('Invalid Response: %s' % response.text)
 
     def _get(self, path, signed=False, version=PUBLIC_API_VERSION, **kwargs):
         return self._request_api('get', path, signed, version, **kwargs)
@@ -245,6 +609,74 @@ class Client(object):
     def _delete(self, path, signed=False, version=PUBLIC_API_VERSION, **kwargs):
         return self._request_api('delete', path, signed, version, **kwargs)
 
+    def _paginate(self, fetch, params, next_params, items_key=None, time_key=None, prefetch=False, id_key=None):
+        """Iterate over the items of the pages of a history endpoint
+
+        :param fetch: endpoint method
+        :param params: params of the first page
+        :param next_params: cursor from binance.pagination returning the params of the next page
+        :param items_key: optional - key of the list of items in a page, if a page is not a list
+        :param time_key: optional - key of the item time, items after the endTime param are not returned
+        :param prefetch: fetch the next page in a background thread while the current page is consumed
+        :param id_key: optional - key of the item id, items of the previous page are skipped for cursors
+            where pages overlap
+
+        """
+        end_time = params.get('endTime') if time_key else None
+        seen = set()
+
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            future = executor.submit(fetch, **params) if prefetch else None
+            while params is not None:
+                page = future.result() if prefetch else fetch(**params)
+                params = next_params(params, page)
+                if prefetch and params is not None:
+                    future = executor.submit(fetch, **params)
+
+                ids = set()
+                for item in (page.get(items_key, []) if items_key else page):
+                    if id_key is not None:
+                        ids.add(item[id_key])
+                        if item[id_key] in seen:
+                            continue
+                    if end_time is not None and item[time_key] > end_time:
+                        return
+                    yield item
+                seen = ids
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+    def _id_cursor_iter(self, fetch, cursor_param, id_key, symbol, limit, prefetch, params):
+        params.update(symbol=symbol, limit=limit)
+        # without an id or start time the most recent items are returned, start from the first instead
+        if cursor_param not in params and 'startTime' not in params:
+            params[cursor_param] = 0
+        return self._paginate(fetch, params, id_cursor(cursor_param, id_key, limit), time_key='time',
+                              prefetch=prefetch)
+
+    def _time_window_iter(self, fetch, items_key, start_str, end_str, prefetch, params):
+        if type(start_str) == int:
+            start_ts = start_str
+        else:
+            start_ts = date_to_milliseconds(start_str)
+        end_ts = int(time.time() * 1000)
+        if end_str:
+            if type(end_str) == int:
+                end_ts = end_str
+            else:
+                end_ts = date_to_milliseconds(end_str)
+
+        params.update(startTime=start_ts, endTime=min(start_ts + self.HISTORY_WINDOW - 1, end_ts))
+        return self._paginate(fetch, params, time_window_cursor(self.HISTORY_WINDOW, end_ts), items_key,
+                              prefetch=prefetch)
+
+    def _page_number_iter(self, fetch, asset, size, prefetch, params):
+        params.update(asset=asset, size=size)
+        params.setdefault('current', 1)
+        return self._paginate(fetch, params, page_number_cursor(size), 'rows', prefetch=prefetch)
+
     # Exchange Endpoints
 
     def get_products(self):
@@ -328,6 +760,9 @@ class Client(object):
     def get_symbol_info(self, symbol):
         """Return information about a symbol
 
+        The exchange info is cached for exchange_info_ttl seconds, see invalidate_exchange_info
+        to fetch it again on the next call.
+
         :param symbol: required e.g BNBBTC
         :type symbol: str
 
@@ -366,13 +801,17 @@ class Client(object):
 
         """
 
-        res = self._get('exchangeInfo')
+        self._refresh_exchange_info()
+        return self._exchange_info_cache.get_symbol(symbol)
 
-        for item in res['symbols']:
-            if item['symbol'] == symbol.upper():
-                return item
+    def _refresh_exchange_info(self):
+        self._exchange_info_cache.refresh(self.get_exchange_info)
 
-        return None
+    def invalidate_exchange_info(self):
+        """Discard the cached exchange info used by get_symbol_info
+
+        """
+        self._exchange_info_cache.invalidate()
 
     # General Endpoints
 
@@ -505,6 +944,18 @@ class Client(object):
         """
         return self._get('depth', data=params)
 
+    def get_order_book_record(self, **params):
+        """Get the Order Book for the market as a record with parsed prices and quantities
+
+        Takes the same parameters as :meth:`get_order_book`
+
+        :returns: :class:`binance.records.DepthUpdate` with bids and asks as lists of (price, quantity) tuples
+
+        :raises: BinanceRequestException, BinanceAPIException
+
+        """
+        return to_records(DepthUpdate, self.get_order_book(**params))
+
     def get_recent_trades(self, **params):
         """Get recent trades (up to last 500).
 
@@ -535,6 +986,18 @@ class Client(object):
         """
         return self._get('trades', data=params)
 
+    def get_recent_trade_records(self, **params):
+        """Get recent trades as records with parsed prices and quantities
+
+        Takes the same parameters as :meth:`get_recent_trades`
+
+        :returns: list of :class:`binance.records.Trade`
+
+        :raises: BinanceRequestException, BinanceAPIException
+
+        """
+        return to_records(Trade, self.get_recent_trades(**params))
+
     def get_historical_trades(self, **params):
         """Get older trades.
 
@@ -567,6 +1030,31 @@ class Client(object):
         """
         return self._get('historicalTrades', data=params)
 
+    def historical_trades_iter(self, symbol, limit=500, prefetch=False, **params):
+        """Iterate over the trades of a symbol from the first trade, or from fromId
+
+        Pages of limit trades are fetched as they are consumed. With prefetch the next page is fetched
+        in the background while the current page is consumed.
+
+        :param symbol: required
+        :type symbol: str
+        :param limit: Number of trades per request, default 500; max 500.
+        :type limit: int
+        :param prefetch: optional - Fetch the next page while the current page is consumed
+        :type prefetch: bool
+        :param fromId: optional - TradeId to start from
+        :type fromId: int
+
+        :returns: generator of trades, see :meth:`get_historical_trades`
+
+        :raises: BinanceRequestException, BinanceAPIException
+
+        """
+        params.update(symbol=symbol, limit=limit)
+        params.setdefault('fromId', 0)
+        return self._paginate(self.get_historical_trades, params, id_cursor('fromId', 'id', limit),
+                              prefetch=prefetch)
+
     def get_aggregate_trades(self, **params):
         """Get compressed, aggregate trades. Trades that fill at the time,
         from the same order, with the same price will have the quantity aggregated.
@@ -606,7 +1094,19 @@ class Client(object):
         """
         return self._get('aggTrades', data=params)
 
-    def aggregate_trade_iter(self, symbol, start_str=None, last_id=None):
+    def get_aggregate_trade_records(self, **params):
+        """Get compressed, aggregate trades as records with parsed prices and quantities
+
+        Takes the same parameters as :meth:`get_aggregate_trades`
+
+        :returns: list of :class:`binance.records.AggTrade`
+
+        :raises: BinanceRequestException, BinanceAPIException
+
+        """
+        return to_records(AggTrade, self.get_aggregate_trades(**params))
+
+    def aggregate_trade_iter(self, symbol, start_str=None, last_id=None, end_str=None, max_workers=None):
         """Iterate over aggregate trade data from (start_time or last_id) to
         the end of the history so far.
 
@@ -636,11 +1136,23 @@ class Client(object):
         each object is identical to Client.aggregate_trades().
 
         :type last_id: int
+        :param end_str: optional - end date string in UTC format or timestamp in milliseconds, only used
+        with max_workers.
+        :type end_str: str|int
+        :param max_workers: optional - Fetch pages of trades concurrently with this many workers, see
+        :class:`binance.backfill.AggregateTradesBackfill`. Requires start_str or last_id.
+        :type max_workers: int
         """
         if start_str is not None and last_id is not None:
             raise ValueError(
                 'start_time and last_id may not be simultaneously specified.')
 
+        if max_workers:
+            backfill = AggregateTradesBackfill(self, symbol, start_str, end_str, last_id, max_workers)
+            for t in backfill.trades_generator():
+                yield t
+            return
+
         # If there's no last_id, get one.
         if last_id is None:
             # Without a last_id, we actually need the first trade.  Normally,
@@ -734,6 +1246,50 @@ class Client(object):
         """
         return self._get('klines', data=params)
 
+    def get_klines_columns(self, **params):
+        """Kline/candlestick bars for a symbol as columns of NumPy arrays, requires numpy.
+
+        Takes the same parameters as :meth:`get_klines`
+
+        :returns: dict of column name to array
+
+        .. code-block:: python
+
+            {
+                "open_time": array([1499040000000], dtype=int64),
+                "open": array([0.01634790]),
+                "high": array([0.80000000]),
+                "low": array([0.01575800]),
+                "close": array([0.01577100]),
+                "volume": array([148976.11427815]),
+                "close_time": array([1499644799999], dtype=int64),
+                "quote_volume": array([2434.19055334]),
+                "trades": array([308], dtype=int32),
+                "taker_buy_base_volume": array([1756.87402397]),
+                "taker_buy_quote_volume": array([28.46694368])
+            }
+
+        :raises: BinanceRequestException, BinanceAPIException
+
+        """
+        from .columns import KlineColumnsBuilder
+
+        builder = KlineColumnsBuilder()
+        builder.append(self.get_klines(**params))
+        return builder.get_columns()
+
+    def get_kline_records(self, **params):
+        """Kline/candlestick bars for a symbol as records with parsed prices and volumes
+
+        Takes the same parameters as :meth:`get_klines`
+
+        :returns: list of :class:`binance.records.Kline`
+
+        :raises: BinanceRequestException, BinanceAPIException
+
+        """
+        return to_records(Kline, self.get_klines(**params))
+
     def _get_earliest_valid_timestamp(self, symbol, interval):
         """Get earliest valid open timestamp from Binance
 
@@ -779,65 +1335,39 @@ class Client(object):
         # init our list
         output_data = []
 
-        # setup the max limit
-        limit = limit
-
-        # convert interval to useful value in seconds
-        timeframe = interval_to_milliseconds(interval)
-
-        # convert our date strings to milliseconds
-        if type(start_str) == int:
-            start_ts = start_str
-        else:
-            start_ts = date_to_milliseconds(start_str)
-
-        # establish first available start timestamp
-        first_valid_ts = self._get_earliest_valid_timestamp(symbol, interval)
-        start_ts = max(start_ts, first_valid_ts)
+        for klines in self._historical_klines_pages(symbol, interval, start_str, end_str, limit):
+            # append this page of data to our output data
+            output_data += klines
 
-        # if an end time was passed convert it
-        end_ts = None
-        if end_str:
-            if type(end_str) == int:
-                end_ts = end_str
-            else:
-                end_ts = date_to_milliseconds(end_str)
-
-        idx = 0
-        while True:
-            # fetch the klines from start_ts up to max 500 entries or the end_ts if set
-            temp_data = self.get_klines(
-                symbol=symbol,
-                interval=interval,
-                limit=limit,
-                startTime=start_ts,
-                endTime=end_ts
-            )
+        return output_data
 
-            # handle the case where exactly the limit amount of data was returned last loop
-            if not len(temp_data):
-                break
+    def get_historical_klines_columns(self, symbol, interval, start_str, end_str=None, limit=1000):
+        """Get Historical Klines from Binance as columns of NumPy arrays
 
-            # append this loops data to our output data
-            output_data += temp_data
+        Each page is converted to arrays as it is fetched, requires numpy.
 
-            # set our start timestamp using the last value in the array
-            start_ts = temp_data[-1][0]
+        See dateparser docs for valid start and end string formats http://dateparser.readthedocs.io/en/latest/
 
-            idx += 1
-            # check if we received less than the required limit and exit the loop
-            if len(temp_data) < limit:
-                # exit the while loop
-                break
+        :param symbol: Name of symbol pair e.g BNBBTC
+        :type symbol: str
+        :param interval: Binance Kline interval
+        :type interval: str
+        :param start_str: Start date string in UTC format or timestamp in milliseconds
+        :type start_str: str|int
+        :param end_str: optional - end date string in UTC format or timestamp in milliseconds (default will fetch everything up to now)
+        :type end_str: str|int
+        :param limit: Default 1000; max 1000.
+        :type limit: int
 
-            # increment next call by our timeframe
-            start_ts += timeframe
+        :return: dict of column name to array, see :meth:`get_klines_columns`
 
-            # sleep after every 3rd call to be kind to the API
-            if idx % 3 == 0:
-                time.sleep(1)
+        """
+        from .columns import KlineColumnsBuilder
 
-        return output_data
+        builder = KlineColumnsBuilder()
+        for klines in self._historical_klines_pages(symbol, interval, start_str, end_str, limit):
+            builder.append(klines)
+        return builder.get_columns()
 
     def get_historical_klines_generator(self, symbol, interval, start_str, end_str=None):
         """Get Historical Klines from Binance
@@ -858,9 +1388,12 @@ class Client(object):
         :return: generator of OHLCV values
 
         """
+        for klines in self._historical_klines_pages(symbol, interval, start_str, end_str, 500):
+            # yield data
+            for o in klines:
+                yield o
 
-        # setup the max limit
-        limit = 500
+    def _historical_klines_pages(self, symbol, interval, start_str, end_str, limit):
 
         # convert interval to useful value in seconds
         timeframe = interval_to_milliseconds(interval)
@@ -885,7 +1418,7 @@ class Client(object):
 
         idx = 0
         while True:
-            # fetch the klines from start_ts up to max 500 entries or the end_ts if set
+            # fetch the klines from start_ts up to max limit entries or the end_ts if set
             output_data = self.get_klines(
                 symbol=symbol,
                 interval=interval,
@@ -898,9 +1431,7 @@ class Client(object):
             if not len(output_data):
                 break
 
-            # yield data
-            for o in output_data:
-                yield o
+            yield output_data
 
             # set our start timestamp using the last value in the array
             start_ts = output_data[-1][0]
@@ -1083,6 +1614,18 @@ class Client(object):
 
     # Account Endpoints
 
+    def get_orderbook_ticker_records(self, **params):
+        """Best price and quantity on the order book for a symbol or symbols as records
+
+        Takes the same parameters as :meth:`get_orderbook_ticker`
+
+        :returns: :class:`binance.records.BookTicker` or a list of them without a symbol
+
+        :raises: BinanceRequestException, BinanceAPIException
+
+        """
+        return to_records(BookTicker, self.get_orderbook_ticker(**params))
+
     def create_order(self, **params):
         """Send in a new order
 
@@ -1198,6 +1741,9 @@ class Client(object):
         :raises: BinanceRequestException, BinanceAPIException, BinanceOrderException, BinanceOrderMinAmountException, BinanceOrderMinPriceException, BinanceOrderMinTotalException, BinanceOrderUnknownSymbolException, BinanceOrderInactiveSymbolException
 
         """
+        if self._validate_orders:
+            self._refresh_exchange_info()
+            self._exchange_info_cache.validate_order(params)
         return self._post('order', True, data=params)
 
     def order_limit(self, timeInForce=TIME_IN_FORCE_GTC, **params):
@@ -1454,6 +2000,9 @@ class Client(object):
         :raises: BinanceRequestException, BinanceAPIException, BinanceOrderException, BinanceOrderMinAmountException, BinanceOrderMinPriceException, BinanceOrderMinTotalException, BinanceOrderUnknownSymbolException, BinanceOrderInactiveSymbolException
 
         """
+        if self._validate_orders:
+            self._refresh_exchange_info()
+            self._exchange_info_cache.validate_oco_order(params)
         return self._post('order/oco', True, data=params)
 
     def order_oco_buy(self, **params):
@@ -1658,6 +2207,32 @@ class Client(object):
         """
         return self._get('allOrders', True, data=params)
 
+    def all_orders_iter(self, symbol, limit=500, prefetch=False, **params):
+        """Iterate over the orders of a symbol from the first order, or from orderId or startTime
+
+        Pages of limit orders are fetched as they are consumed. With prefetch the next page is fetched
+        in the background while the current page is consumed.
+
+        :param symbol: required
+        :type symbol: str
+        :param limit: Number of orders per request, default 500; max 500.
+        :type limit: int
+        :param prefetch: optional - Fetch the next page while the current page is consumed
+        :type prefetch: bool
+        :param orderId: optional - Order id to start from
+        :type orderId: int
+        :param startTime: optional
+        :type startTime: int
+        :param endTime: optional
+        :type endTime: int
+
+        :returns: generator of orders, see :meth:`get_all_orders`
+
+        :raises: BinanceRequestException, BinanceAPIException
+
+        """
+        return self._id_cursor_iter(self.get_all_orders, 'orderId', 'orderId', symbol, limit, prefetch, params)
+
     def cancel_order(self, **params):
         """Cancel an active order. Either orderId or origClientOrderId must be sent.
 
@@ -1835,6 +2410,32 @@ class Client(object):
         """
         return self._get('myTrades', True, data=params)
 
+    def my_trades_iter(self, symbol, limit=500, prefetch=False, **params):
+        """Iterate over the account trades of a symbol from the first trade, or from fromId or startTime
+
+        Pages of limit trades are fetched as they are consumed. With prefetch the next page is fetched
+        in the background while the current page is consumed.
+
+        :param symbol: required
+        :type symbol: str
+        :param limit: Number of trades per request, default 500; max 500.
+        :type limit: int
+        :param prefetch: optional - Fetch the next page while the current page is consumed
+        :type prefetch: bool
+        :param fromId: optional - TradeId to start from
+        :type fromId: int
+        :param startTime: optional
+        :type startTime: int
+        :param endTime: optional
+        :type endTime: int
+
+        :returns: generator of trades, see :meth:`get_my_trades`
+
+        :raises: BinanceRequestException, BinanceAPIException
+
+        """
+        return self._id_cursor_iter(self.get_my_trades, 'fromId', 'id', symbol, limit, prefetch, params)
+
     def get_system_status(self):
         """Get system status detail.
 
@@ -2207,6 +2808,27 @@ class Client(object):
         """
         return self._request_withdraw_api('get', 'depositHistory.html', True, data=params)
 
+    def deposit_history_iter(self, start_str, end_str=None, prefetch=False, **params):
+        """Iterate over the deposits from start_str to end_str
+
+        The range is fetched in windows of HISTORY_WINDOW milliseconds as they are consumed.
+
+        :param start_str: Start date string in UTC format or timestamp in milliseconds
+        :type start_str: str|int
+        :param end_str: optional - end date string in UTC format or timestamp in milliseconds (default will fetch everything up to now)
+        :type end_str: str|int
+        :param prefetch: optional - Fetch the next window while the current window is consumed
+        :type prefetch: bool
+        :param asset: optional
+        :type asset: str
+
+        :returns: generator of deposits, see :meth:`get_deposit_history`
+
+        :raises: BinanceRequestException, BinanceAPIException
+
+        """
+        return self._time_window_iter(self.get_deposit_history, 'depositList', start_str, end_str, prefetch, params)
+
     def get_withdraw_history(self, **params):
         """Fetch withdraw history.
 
@@ -2253,6 +2875,27 @@ class Client(object):
         """
         return self._request_withdraw_api('get', 'withdrawHistory.html', True, data=params)
 
+    def withdraw_history_iter(self, start_str, end_str=None, prefetch=False, **params):
+        """Iterate over the withdrawals from start_str to end_str
+
+        The range is fetched in windows of HISTORY_WINDOW milliseconds as they are consumed.
+
+        :param start_str: Start date string in UTC format or timestamp in milliseconds
+        :type start_str: str|int
+        :param end_str: optional - end date string in UTC format or timestamp in milliseconds (default will fetch everything up to now)
+        :type end_str: str|int
+        :param prefetch: optional - Fetch the next window while the current window is consumed
+        :type prefetch: bool
+        :param asset: optional
+        :type asset: str
+
+        :returns: generator of withdrawals, see :meth:`get_withdraw_history`
+
+        :raises: BinanceRequestException, BinanceAPIException
+
+        """
+        return self._time_window_iter(self.get_withdraw_history, 'withdrawList', start_str, end_str, prefetch, params)
+
     def get_deposit_address(self, **params):
         """Fetch a deposit address for a symbol
 
@@ -2817,6 +3460,34 @@ class Client(object):
         """
         return self._request_margin_api('get', 'margin/loan', signed=True, data=params)
 
+    def margin_loan_details_iter(self, asset, size=100, prefetch=False, **params):
+        """Iterate over the loan records of an asset
+
+        txId or startTime must be sent.
+
+        Pages of size records are fetched as they are consumed. With prefetch the next page is fetched
+        in the background while the current page is consumed.
+
+        :param asset: required
+        :type asset: str
+        :param size: Number of records per request, default 100; max 100.
+        :type size: int
+        :param prefetch: optional - Fetch the next page while the current page is consumed
+        :type prefetch: bool
+        :param txId: the tranId of the loan
+        :type txId: str
+        :param startTime:
+        :type startTime: int
+        :param endTime:
+        :type endTime: int
+
+        :returns: generator of loan records, see :meth:`get_margin_loan_details`
+
+        :raises: BinanceRequestException, BinanceAPIException
+
+        """
+        return self._page_number_iter(self.get_margin_loan_details, asset, size, prefetch, params)
+
     def get_margin_repay_details(self, **params):
         """Query repay record
 
@@ -2865,6 +3536,34 @@ class Client(object):
         """
         return self._request_margin_api('get', 'margin/repay', signed=True, data=params)
 
+    def margin_repay_details_iter(self, asset, size=100, prefetch=False, **params):
+        """Iterate over the repay records of an asset
+
+        txId or startTime must be sent.
+
+        Pages of size records are fetched as they are consumed. With prefetch the next page is fetched
+        in the background while the current page is consumed.
+
+        :param asset: required
+        :type asset: str
+        :param size: Number of records per request, default 100; max 100.
+        :type size: int
+        :param prefetch: optional - Fetch the next page while the current page is consumed
+        :type prefetch: bool
+        :param txId: the tranId of the repay
+        :type txId: str
+        :param startTime:
+        :type startTime: int
+        :param endTime:
+        :type endTime: int
+
+        :returns: generator of repay records, see :meth:`get_margin_repay_details`
+
+        :raises: BinanceRequestException, BinanceAPIException
+
+        """
+        return self._page_number_iter(self.get_margin_repay_details, asset, size, prefetch, params)
+
     def get_margin_order(self, **params):
         """Query margin accounts order
 
@@ -3009,6 +3708,18 @@ class Client(object):
         """
         return self._request_margin_api('get', 'margin/allOrders', signed=True, data=params)
 
+    def all_margin_orders_iter(self, symbol, limit=500, prefetch=False, **params):
+        """Iterate over the margin orders of a symbol from the first order, or from orderId or startTime
+
+        See :meth:`all_orders_iter`
+
+        :returns: generator of orders, see :meth:`get_all_margin_orders`
+
+        :raises: BinanceRequestException, BinanceAPIException
+
+        """
+        return self._id_cursor_iter(self.get_all_margin_orders, 'orderId', 'orderId', symbol, limit, prefetch, params)
+
     def get_margin_trades(self, **params):
         """Query margin accounts trades
 
@@ -3065,6 +3776,18 @@ class Client(object):
         """
         return self._request_margin_api('get', 'margin/myTrades', signed=True, data=params)
 
+    def margin_trades_iter(self, symbol, limit=500, prefetch=False, **params):
+        """Iterate over the margin trades of a symbol from the first trade, or from fromId or startTime
+
+        See :meth:`my_trades_iter`
+
+        :returns: generator of trades, see :meth:`get_margin_trades`
+
+        :raises: BinanceRequestException, BinanceAPIException
+
+        """
+        return self._id_cursor_iter(self.get_margin_trades, 'fromId', 'id', symbol, limit, prefetch, params)
+
     def get_max_margin_loan(self, **params):
         """Query max borrow amount for an asset
 
@@ -3695,6 +4418,18 @@ class Client(object):
         """
         return self._request_futures_api('get', 'userTrades', True, data=params)
 
+    def futures_account_trades_iter(self, symbol, limit=1000, prefetch=False, **params):
+        """Iterate over the futures trades of a symbol from the first trade, or from fromId or startTime
+
+        See :meth:`my_trades_iter`, limit is at most 1000
+
+        :returns: generator of trades, see :meth:`futures_account_trades`
+
+        :raises: BinanceRequestException, BinanceAPIException
+
+        """
+        return self._id_cursor_iter(self.futures_account_trades, 'fromId', 'id', symbol, limit, prefetch, params)
+
     def futures_income_history(self, **params):
         """Get income history for authenticated account
 
@@ -3702,3 +4437,32 @@ class Client(object):
 
         """
         return self._request_futures_api('get', 'income', True, data=params)
+
+    def futures_income_history_iter(self, limit=1000, prefetch=False, **params):
+        """Iterate over the futures income history from the first record, or from startTime
+
+        Pages of limit records are fetched as they are consumed. With prefetch the next page is fetched
+        in the background while the current page is consumed.
+
+        :param limit: Number of records per request, default 1000; max 1000.
+        :type limit: int
+        :param prefetch: optional - Fetch the next page while the current page is consumed
+        :type prefetch: bool
+        :param symbol: optional
+        :type symbol: str
+        :param incomeType: optional
+        :type incomeType: str
+        :param startTime: optional
+        :type startTime: int
+        :param endTime: optional
+        :type endTime: int
+
+        :returns: generator of income records, see :meth:`futures_income_history`
+
+        :raises: BinanceRequestException, BinanceAPIException
+
+        """
+        params['limit'] = limit
+        params.setdefault('startTime', 0)
+        return self._paginate(self.futures_income_history, params, time_cursor('time', limit, max_limit=1000),
+                              prefetch=prefetch, id_key='tranId')
@@ -0,0 +1,104 @@
+# coding=utf-8
+
+import numpy as np
+
+# kline columns in the order of the API response, the last value of each kline is ignored
+KLINE_COLUMNS = [
+    ('open_time', np.int64),
+    ('open', np.float64),
+    ('high', np.float64),
+    ('low', np.float64),
+    ('close', np.float64),
+    ('volume', np.float64),
+    ('close_time', np.int64),
+    ('quote_volume', np.float64),
+    ('trades', np.int32),
+    ('taker_buy_base_volume', np.float64),
+    ('taker_buy_quote_volume', np.float64),
+]
+
+# record layout of a kline, little endian so files can be shared between machines
+KLINE_DTYPE = np.dtype([(name, np.dtype(dtype).newbyteorder('<')) for name, dtype in KLINE_COLUMNS])
+
+
+def klines_to_records(klines):
+    """Convert klines to an array of KLINE_DTYPE records
+
+    :param klines: get_klines response
+    :type klines: list
+
+    :return: numpy structured array
+
+    """
+    records = np.empty(len(klines), dtype=KLINE_DTYPE)
+    for i, (name, dtype) in enumerate(KLINE_COLUMNS):
+        records[name] = np.array([kline[i] for kline in klines], dtype=dtype)
+    return records
+
+
+# aggregate trade columns and the key of each in the API response
+AGG_TRADE_COLUMNS = [
+    ('id', 'a', np.int64),
+    ('price', 'p', np.float64),
+    ('quantity', 'q', np.float64),
+    ('first_trade_id', 'f', np.int64),
+    ('last_trade_id', 'l', np.int64),
+    ('time', 'T', np.int64),
+    ('is_buyer_maker', 'm', np.bool_),
+    ('is_best_match', 'M', np.bool_),
+]
+
+# record layout of an aggregate trade, little endian so files can be shared between machines
+AGG_TRADE_DTYPE = np.dtype([(name, np.dtype(dtype).newbyteorder('<')) for name, _, dtype in AGG_TRADE_COLUMNS])
+
+
+def agg_trades_to_records(trades):
+    """Convert aggregate trades to an array of AGG_TRADE_DTYPE records
+
+    :param trades: get_aggregate_trades response
+    :type trades: list
+
+    :return: numpy structured array
+
+    """
+    records = np.empty(len(trades), dtype=AGG_TRADE_DTYPE)
+    for name, key, dtype in AGG_TRADE_COLUMNS:
+        records[name] = np.array([trade[key] for trade in trades], dtype=dtype)
+    return records
+
+
+class KlineColumnsBuilder(object):
+
+    def __init__(self):
+        """Initialise the KlineColumnsBuilder
+
+        Converts pages of klines to typed arrays as they are fetched so the list of all klines is never
+        held in memory, the arrays of each column are joined by get_columns.
+
+        """
+        self._chunks = dict((name, []) for name, _ in KLINE_COLUMNS)
+
+    def append(self, klines):
+        """Convert a page of klines
+
+        :param klines: get_klines response
+        :type klines: list
+
+        """
+        if not klines:
+            return
+        for i, (name, dtype) in enumerate(KLINE_COLUMNS):
+            # numpy parses the price strings while building the array
+            self._chunks[name].append(np.array([kline[i] for kline in klines], dtype=dtype))
+
+    def get_columns(self):
+        """Get the converted klines
+
+        :return: dict of column name to array
+
+        """
+        columns = {}
+        for name, dtype in KLINE_COLUMNS:
+            chunks = self._chunks[name]
+            columns[name] = np.concatenate(chunks) if chunks else np.empty(0, dtype=dtype)
+        return columns
@@ -1,50 +1,248 @@
 # coding=utf-8
 
+from array import array
+from bisect import bisect_left
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from decimal import Decimal
 from operator import itemgetter
+import random
+import sys
+import threading
 import time
 
+from .exceptions import BinanceRequestException
 from .websockets import BinanceSocketManager
 
+# typecode of integer price arrays, long long arrays are not available on python 2
+_PRICE_TYPECODE = 'q' if sys.version_info[0] >= 3 else 'l'
+
+
+class DepthCacheSide(object):
+
+    def __init__(self, reverse=False, integer_prices=False, max_depth=None):
+        """Initialise one side of the order book
+
+        Prices are kept in ascending order next to their quantities, so updates cost a binary
+        search and reads need no sorting. The best price is the first price for asks and the
+        last price for bids.
+
+        :param reverse: True for bids, where the highest price is the best price
+        :type reverse: bool
+        :param integer_prices: True if prices are integer ticks, they are kept in compact arrays
+        :type integer_prices: bool
+        :param max_depth: optional - number of best price levels to keep, worse levels are dropped
+            and later updates of them ignored until the side is cleared, see is_truncated
+        :type max_depth: int
+
+        """
+        self._reverse = reverse
+        self._max_depth = max_depth
+        self._integer_prices = integer_prices
+        self.clear()
+
+    def __len__(self):
+        return len(self._prices)
+
+    def clear(self):
+        """Remove all price levels e.g. before applying a new snapshot
+
+        """
+        if self._integer_prices:
+            self._prices = array(_PRICE_TYPECODE)
+            self._quantities = array('d')
+        else:
+            self._prices = []
+            self._quantities = []
+        # best price which has been dropped, levels from it on are unknown
+        self._boundary = None
+
+    def _drop(self, price):
+        if self._boundary is None:
+            self._boundary = price
+        else:
+            self._boundary = max(self._boundary, price) if self._reverse else min(self._boundary, price)
+
+    def _is_dropped(self, price):
+        if self._boundary is None:
+            return False
+        return price <= self._boundary if self._reverse else price >= self._boundary
+
+    def is_truncated(self):
+        """Check if levels were dropped and fewer than max_depth levels are left
+
+        The levels beyond the kept levels are unknown until the side is cleared and refilled
+        from a snapshot.
+
+        :return: bool
+
+        """
+        return self._boundary is not None and len(self._prices) < self._max_depth
+
+    def set(self, price, quantity):
+        """Set the quantity of a price level
+
+        :param price: price level
+        :type price: float|int
+        :param quantity: quantity at the price level
+        :type quantity: float
+
+        """
+        if self._is_dropped(price):
+            # levels beyond a dropped level are not kept, a level between them would be a gap in the book
+            return
+        i = bisect_left(self._prices, price)
+        if i < len(self._prices) and self._prices[i] == price:
+            self._quantities[i] = quantity
+            return
+        full = self._max_depth and len(self._prices) >= self._max_depth
+        if full and i == (0 if self._reverse else len(self._prices)):
+            # worse than every kept level
+            self._drop(price)
+            return
+        self._prices.insert(i, price)
+        self._quantities.insert(i, quantity)
+        if full:
+            # drop the worst level
+            worst = 0 if self._reverse else -1
+            self._drop(self._prices[worst])
+            del self._prices[worst]
+            del self._quantities[worst]
+
+    def remove(self, price):
+        """Remove a price level if it is present
+
+        :param price: price level
+        :type price: float|int
+
+        """
+        i = bisect_left(self._prices, price)
+        if i < len(self._prices) and self._prices[i] == price:
+            del self._prices[i]
+            del self._quantities[i]
+
+    def best(self):
+        """Get the best price level
+
+        :return: [price, quantity] list or None if there are no price levels
+
+        """
+        if not self._prices:
+            return None
+        i = -1 if self._reverse else 0
+        return [self._prices[i], self._quantities[i]]
+
+    def get(self, limit=None):
+        """Get the price levels best price first
+
+        :param limit: optional - number of price levels to return
+        :type limit: int
+
+        :return: list of [price, quantity] lists
+
+        """
+        if self._reverse:
+            start = len(self._prices) - limit if limit else 0
+            indexes = range(len(self._prices) - 1, max(start, 0) - 1, -1)
+        else:
+            indexes = range(min(limit, len(self._prices)) if limit else len(self._prices))
+        return [[self._prices[i], self._quantities[i]] for i in indexes]
+
 
 class DepthCache(object):
 
-    def __init__(self, symbol):
+    def __init__(self, symbol, tick_size=None, max_depth=None):
         """Initialise the DepthCache
 
+        With a tick_size price levels are keyed by their integer number of ticks, so the same price
+        formatted differently by snapshots and updates is one level, and the book is kept in compact
+        arrays. Prices are returned as floats either way.
+
         :param symbol: Symbol to create depth cache for
         :type symbol: string
+        :param tick_size: optional - tickSize of the PRICE_FILTER of the symbol e.g. "0.00000100"
+        :type tick_size: str
+        :param max_depth: optional - number of best price levels to keep on each side, updates beyond them are
+            dropped so memory and update cost stay bounded. Updates of levels beyond a dropped level are
+            ignored until the next snapshot, so if the best levels are removed fewer than max_depth levels
+            are returned rather than a book with gaps, see is_truncated.
+        :type max_depth: int
 
         """
         self.symbol = symbol
-        self._bids = {}
-        self._asks = {}
+        self.tick_size = tick_size
+        self.max_depth = max_depth
+        self._ticks_per_unit = None
+        if tick_size:
+            tick = Decimal(str(tick_size)).normalize()
+            # tick size as a whole number of units of its last decimal place
+            self._unit_scale = float(10 ** max(0, -tick.as_tuple().exponent))
+            self._tick_units = int(tick * Decimal(self._unit_scale))
+            self._ticks_per_unit = self._unit_scale / self._tick_units
+        self._bids = DepthCacheSide(reverse=True, integer_prices=bool(tick_size), max_depth=max_depth)
+        self._asks = DepthCacheSide(integer_prices=bool(tick_size), max_depth=max_depth)
         self.update_time = None
 
+    def clear(self):
+        """Remove all bids and asks e.g. before applying a new snapshot
+
+        """
+        self._bids.clear()
+        self._asks.clear()
+
+    def is_truncated(self):
+        """Check if either side has fewer than max_depth levels after levels were dropped
+
+        The DepthCacheManager then fetches a new snapshot to refill the book.
+
+        :return: bool
+
+        """
+        return self._bids.is_truncated() or self._asks.is_truncated()
+
+    def _to_key(self, price):
+        if self._ticks_per_unit is None:
+            return float(price)
+        return int(round(float(price) * self._ticks_per_unit))
+
+    def _to_prices(self, levels):
+        if self._ticks_per_unit is not None:
+            for level in levels:
+                # an integer over a power of ten rounds to the float of the decimal price
+                level[0] = level[0] * self._tick_units / self._unit_scale
+        return levels
+
     def add_bid(self, bid):
-        """Add a bid to the cache
+        """Add a bid to the cache, a zero quantity removes the price level
 
-        :param bid:
-        :return:
+        :param bid: [price, quantity] as strings or numbers
+        :type bid: list
 
         """
-        self._bids[bid[0]] = float(bid[1])
-        if bid[1] == "0.00000000":
-            del self._bids[bid[0]]
+        quantity = float(bid[1])
+        if quantity == 0:
+            self._bids.remove(self._to_key(bid[0]))
+        else:
+            self._bids.set(self._to_key(bid[0]), quantity)
 
     def add_ask(self, ask):
-        """Add an ask to the cache
+        """Add an ask to the cache, a zero quantity removes the price level
 
-        :param ask:
-        :return:
+        :param ask: [price, quantity] as strings or numbers
+        :type ask: list
 
         """
-        self._asks[ask[0]] = float(ask[1])
-        if ask[1] == "0.00000000":
-            del self._asks[ask[0]]
+        quantity = float(ask[1])
+        if quantity == 0:
+            self._asks.remove(self._to_key(ask[0]))
+        else:
+            self._asks.set(self._to_key(ask[0]), quantity)
 
-    def get_bids(self):
+    def get_bids(self, limit=None):
         """Get the current bids
 
+        :param limit: optional - number of bids to return, best bid first
+        :type limit: int
+
         :return: list of bids with price and quantity as floats
 
         .. code-block:: python
@@ -73,11 +271,14 @@ class DepthCache(object):
             ]
 
         """
-        return DepthCache.sort_depth(self._bids, reverse=True)
+        return self._to_prices(self._bids.get(limit))
 
-    def get_asks(self):
+    def get_asks(self, limit=None):
         """Get the current asks
 
+        :param limit: optional - number of asks to return, best ask first
+        :type limit: int
+
         :return: list of asks with price and quantity as floats
 
         .. code-block:: python
@@ -106,7 +307,47 @@ class DepthCache(object):
             ]
 
         """
-        return DepthCache.sort_depth(self._asks, reverse=False)
+        return self._to_prices(self._asks.get(limit))
+
+    def best_bid(self):
+        """Get the highest bid
+
+        :return: [price, quantity] list of floats or None if there are no bids
+
+        """
+        bid = self._bids.best()
+        return bid and self._to_prices([bid])[0]
+
+    def best_ask(self):
+        """Get the lowest ask
+
+        :return: [price, quantity] list of floats or None if there are no asks
+
+        """
+        ask = self._asks.best()
+        return ask and self._to_prices([ask])[0]
+
+    def spread(self):
+        """Get the difference between the lowest ask and highest bid
+
+        :return: float or None if either side is empty
+
+        """
+        bid, ask = self.best_bid(), self.best_ask()
+        if bid is None or ask is None:
+            return None
+        return ask[0] - bid[0]
+
+    def mid_price(self):
+        """Get the price halfway between the highest bid and lowest ask
+
+        :return: float or None if either side is empty
+
+        """
+        bid, ask = self.best_bid(), self.best_ask()
+        if bid is None or ask is None:
+            return None
+        return (bid[0] + ask[0]) / 2
 
     @staticmethod
     def sort_depth(vals, reverse=False):
@@ -121,7 +362,8 @@ class DepthCacheManager(object):
 
     _default_refresh = 60 * 30  # 30 minutes
 
-    def __init__(self, client, symbol, callback=None, refresh_interval=_default_refresh, bm=None, limit=500):
+    def __init__(self, client, symbol, callback=None, refresh_interval=_default_refresh, bm=None, limit=500,
+                 blocking=True, tick_size=None, max_depth=None, depth_message_timeout=None):
         """Initialise the DepthCacheManager
 
         :param client: Binance API client
@@ -134,6 +376,17 @@ class DepthCacheManager(object):
         :type refresh_interval: int
         :param limit: Optional number of orders to get from orderbook
         :type limit: int
+        :param blocking: Optional, if False return immediately and initialise the depth cache in the background,
+            the ready future resolves to the depth cache once it is initialised
+        :type blocking: bool
+        :param tick_size: Optional tickSize to key price levels by, see DepthCache, or True to use the tickSize
+            of the symbol from the exchange info, looked up on start so it doesn't block with blocking False
+        :type tick_size: str|bool
+        :param max_depth: Optional number of best price levels to keep on each side, at most limit
+        :type max_depth: int
+        :param depth_message_timeout: Optional number of seconds to wait for the first depth message before
+            raising BinanceRequestException, default waits forever
+        :type depth_message_timeout: float
 
         """
         self._client = client
@@ -143,12 +396,49 @@ class DepthCacheManager(object):
         self._last_update_id = None
         self._depth_message_buffer = []
         self._bm = bm
-        self._depth_cache = DepthCache(self._symbol)
+        self._tick_size = tick_size
+        self._max_depth = max_depth
+        # with tick_size True the depth cache is created on start, once the tick size is looked up
+        self._depth_cache = None if tick_size is True else DepthCache(self._symbol, tick_size, max_depth)
         self._refresh_interval = refresh_interval
         self._conn_key = None
+        self._depth_message_event = threading.Event()
+        self._depth_message_timeout = depth_message_timeout
+        self.ready = Future()
 
+        if blocking:
+            self._start()
+        else:
+            t = threading.Thread(target=self._start_background)
+            t.daemon = True
+            t.start()
+
+    def _create_depth_cache(self):
+        if self._depth_cache is None:
+            self._depth_cache = DepthCache(self._symbol, self._get_tick_size(), self._max_depth)
+
+    def _get_tick_size(self):
+        symbol_info = self._client.get_symbol_info(self._symbol)
+        for symbol_filter in (symbol_info or {}).get('filters', []):
+            if symbol_filter['filterType'] == 'PRICE_FILTER':
+                return symbol_filter['tickSize']
+        return None
+
+    def _start(self):
+        """Start the socket and initialise the depth cache, resolving the ready future
+
+        :return:
+        """
+        self._create_depth_cache()
         self._start_socket()
         self._init_cache()
+        self.ready.set_result(self._depth_cache)
+
+    def _start_background(self):
+        try:
+            self._start()
+        except Exception as e:
+            self.ready.set_exception(e)
 
     def _init_cache(self):
         """Initialise the depth cache calling REST endpoint
@@ -159,6 +449,17 @@ class DepthCacheManager(object):
         self._depth_message_buffer = []
 
         res = self._client.get_order_book(symbol=self._symbol, limit=self._limit)
+        self._apply_snapshot(res)
+
+    def _apply_snapshot(self, res):
+        """Replace the depth cache with an order book snapshot and apply the buffered updates
+
+        :param res: order book response
+        :type res: dict
+        :return:
+        """
+        # the snapshot replaces the book, including levels dropped beyond max_depth
+        self._depth_cache.clear()
 
         # process bid and asks from the order book
         for bid in res['bids']:
@@ -171,14 +472,18 @@ class DepthCacheManager(object):
 
         # set a time to refresh the depth cache
         if self._refresh_interval:
-            self._refresh_time = int(time.time()) + self._refresh_interval
-
-        # Apply any updates from the websocket
-        for msg in self._depth_message_buffer:
+            self._refresh_time = int(time.time() + self._get_refresh_interval())
+
+        # Apply any updates from the websocket, clearing the depth buffer
+        buffer, self._depth_message_buffer = self._depth_message_buffer, []
+        for msg in buffer:
+            if self._last_update_id is None:
+                # a new snapshot was requested, later messages are older than it
+                break
             self._process_depth_message(msg, buffer=True)
 
-        # clear the depth buffer
-        self._depth_message_buffer = []
+    def _get_refresh_interval(self):
+        return self._refresh_interval
 
     def _start_socket(self):
         """Start the depth cache socket
@@ -192,9 +497,16 @@ class DepthCacheManager(object):
         if not self._bm.is_alive():
             self._bm.start()
 
-        # wait for some socket responses
-        while not len(self._depth_message_buffer):
-            time.sleep(1)
+        self._wait_for_depth_message()
+
+    def _wait_for_depth_message(self):
+        """Wait until the socket has delivered a depth message
+
+        :return:
+        """
+        if not self._depth_message_event.wait(self._depth_message_timeout):
+            raise BinanceRequestException('No depth message for {} within {} seconds'.format(
+                self._symbol, self._depth_message_timeout))
 
     def _depth_event(self, msg):
         """Handle a depth event
@@ -211,10 +523,12 @@ class DepthCacheManager(object):
             # notify the user by returning a None value
             if self._callback:
                 self._callback(None)
+            return
 
         if self._last_update_id is None:
             # Initial depth snapshot fetch not yet performed, buffer messages
             self._depth_message_buffer.append(msg)
+            self._depth_message_event.set()
         else:
             self._process_depth_message(msg)
 
@@ -229,10 +543,14 @@ class DepthCacheManager(object):
         if buffer and msg['u'] <= self._last_update_id:
             # ignore any updates before the initial update id
             return
-        elif msg['U'] != self._last_update_id + 1:
-            # if not buffered check we get sequential updates
-            # otherwise init cache again
+        elif msg['U'] > self._last_update_id + 1 or (not buffer and msg['U'] != self._last_update_id + 1):
+            # buffered updates may start before the snapshot update id, otherwise
+            # check we get sequential updates or init cache again
             self._init_cache()
+            if self._last_update_id is None:
+                # the snapshot is fetched in the background, buffer the message until it is applied
+                self._depth_message_buffer.append(msg)
+                return
 
         # add any bid or ask values
         for bid in msg['b']:
@@ -249,8 +567,9 @@ class DepthCacheManager(object):
 
         self._last_update_id = msg['u']
 
-        # after processing event see if we need to refresh the depth cache
-        if self._refresh_interval and int(time.time()) > self._refresh_time:
+        # after processing event see if we need to refresh the depth cache, or refill a side
+        # which lost levels after levels beyond it were dropped
+        if self._depth_cache.is_truncated() or (self._refresh_interval and int(time.time()) > self._refresh_time):
             self._init_cache()
 
     def get_depth_cache(self):
@@ -271,3 +590,260 @@ class DepthCacheManager(object):
             self._bm.close()
         time.sleep(1)
         self._depth_cache = None
+
+
+class _MultiplexedDepthCacheManager(DepthCacheManager):
+    """DepthCacheManager for one symbol of a MultiplexDepthCacheManager
+
+    Depth events are routed to it from the socket shared by the MultiplexDepthCacheManager. Snapshots
+    are fetched in the executor of the manager, so resyncs and refreshes don't hold up the events of
+    other symbols on the shared socket.
+
+    """
+
+    def __init__(self, manager, symbol):
+        self._manager = manager
+        self._lock = threading.Lock()
+        self._resync = None
+        super(_MultiplexedDepthCacheManager, self).__init__(
+            manager._client, symbol, callback=manager._callback, refresh_interval=manager._refresh_interval,
+            bm=manager._bm, limit=manager._limit, tick_size=manager._tick_size, max_depth=manager._max_depth,
+            depth_message_timeout=manager._depth_message_timeout
+        )
+
+    def _start(self):
+        """Start the socket and initialise the depth cache, resolving the ready future
+
+        :return:
+        """
+        # registered before waiting for events so the depth cache is available while it initialises
+        self._manager._register(self)
+        try:
+            self._create_depth_cache()
+            self._wait_for_depth_message()
+            self._fetch_snapshot()
+        except Exception:
+            self._manager._unregister(self)
+            raise
+        self.ready.set_result(self._depth_cache)
+
+    def _init_cache(self):
+        """Fetch a new snapshot in the executor of the manager, events are buffered until it is applied
+
+        :return:
+        """
+        self._last_update_id = None
+        self._depth_message_buffer = []
+        self._resync = self._manager._executor.submit(self._fetch_snapshot)
+
+    def _fetch_snapshot(self):
+        res = self._client.get_order_book(symbol=self._symbol, limit=self._limit)
+        with self._lock:
+            self._apply_snapshot(res)
+
+    def _get_refresh_interval(self):
+        # spread the refreshes of symbols started together over the second half of the interval
+        return self._refresh_interval * random.uniform(0.5, 1)
+
+    def _depth_event(self, msg):
+        """Handle a depth event routed from the shared socket
+
+        :param msg:
+        :return:
+
+        """
+        with self._lock:
+            super(_MultiplexedDepthCacheManager, self)._depth_event(msg)
+            if self._last_update_id is None and self._resync is not None and self._resync.done():
+                # the last snapshot failed, try again
+                self._init_cache()
+
+    def close(self, close_socket=False):
+        """Stop updating this depth cache, the shared socket is closed by the MultiplexDepthCacheManager
+
+        :return:
+        """
+        self._depth_cache = None
+
+
+class MultiplexDepthCacheManager(object):
+
+    _default_refresh = 60 * 30  # 30 minutes
+
+    DEFAULT_MAX_WORKERS = 10
+    DEFAULT_DEPTH_MESSAGE_TIMEOUT = 60
+    MAX_STREAMS_PER_SOCKET = 200
+
+    def __init__(self, client, symbols, callback=None, refresh_interval=_default_refresh, bm=None, limit=500,
+                 max_workers=DEFAULT_MAX_WORKERS, blocking=True, tick_size=None, max_depth=None,
+                 depth_message_timeout=DEFAULT_DEPTH_MESSAGE_TIMEOUT):
+        """Initialise the MultiplexDepthCacheManager
+
+        Maintains a DepthCache for each symbol over combined depth streams, so many symbols
+        share a few socket connections. Order book snapshots are fetched concurrently.
+
+        :param client: Binance API client
+        :type client: binance.Client
+        :param symbols: Symbols to create depth caches for
+        :type symbols: list
+        :param callback: Optional function to receive depth cache updates
+        :type callback: function
+        :param refresh_interval: Optional number of seconds between cache refresh, use 0 or None to disable
+        :type refresh_interval: int
+        :param limit: Optional number of orders to get from orderbook
+        :type limit: int
+        :param max_workers: Optional number of order book snapshots to fetch concurrently
+        :type max_workers: int
+        :param blocking: Optional, if False return immediately and initialise the depth caches in the background,
+            see wait_ready
+        :type blocking: bool
+        :param tick_size: Optional True to key the price levels of each symbol by its tickSize from the
+            exchange info, see DepthCache
+        :type tick_size: bool
+        :param max_depth: Optional number of best price levels to keep on each side, at most limit
+        :type max_depth: int
+        :param depth_message_timeout: Optional number of seconds to wait for the first depth message of a symbol,
+            so symbols without updates don't hold a worker forever. The future of the symbol then raises
+            BinanceRequestException. Use None to wait forever.
+        :type depth_message_timeout: float
+
+        """
+        self._client = client
+        self._callback = callback
+        self._refresh_interval = refresh_interval
+        self._bm = bm
+        self._limit = limit
+        self._max_workers = max_workers
+        self._tick_size = tick_size
+        self._max_depth = max_depth
+        self._depth_message_timeout = depth_message_timeout
+        self._managers = {}
+        self._ready = {}
+        self._conn_keys = []
+        self._executor = ThreadPoolExecutor(max_workers=self._max_workers)
+
+        if self._bm is None:
+            self._bm = BinanceSocketManager(self._client)
+
+        self.add_symbols(symbols, blocking=blocking)
+
+    @staticmethod
+    def _get_stream_name(symbol):
+        return symbol.lower() + '@depth'
+
+    def add_symbols(self, symbols, blocking=True):
+        """Start maintaining depth caches for more symbols
+
+        New symbols are added over new combined streams. Symbols which failed to initialise e.g. after
+        depth_message_timeout are started again on their existing streams.
+
+        :param symbols: Symbols to create depth caches for
+        :type symbols: list
+        :param blocking: Optional, if False return without waiting for the depth caches to be initialised
+        :type blocking: bool
+
+        :return: dict of symbol to a future resolving to its DepthCache once it is initialised
+        """
+        new_symbols = [s for s in symbols if s not in self._ready]
+        symbols = [s for s in symbols if s not in self._ready or self._is_failed(s)]
+
+        streams = [self._get_stream_name(s) for s in new_symbols]
+        for i in range(0, len(streams), self.MAX_STREAMS_PER_SOCKET):
+            conn_key = self._bm.start_multiplex_socket(streams[i:i + self.MAX_STREAMS_PER_SOCKET], self._depth_event)
+            self._conn_keys.append(conn_key)
+        if not self._bm.is_alive():
+            self._bm.start()
+
+        futures = {}
+        for symbol in symbols:
+            future = self._executor.submit(self._start_symbol, symbol)
+            self._ready[symbol] = future
+            futures[symbol] = future
+
+        if blocking:
+            for future in futures.values():
+                future.result()
+
+        return futures
+
+    def _is_failed(self, symbol):
+        future = self._ready[symbol]
+        return future.done() and future.exception() is not None
+
+    def _start_symbol(self, symbol):
+        return _MultiplexedDepthCacheManager(self, symbol).get_depth_cache()
+
+    def _register(self, manager):
+        self._managers[self._get_stream_name(manager._symbol)] = manager
+
+    def _unregister(self, manager):
+        self._managers.pop(self._get_stream_name(manager._symbol), None)
+
+    def _depth_event(self, msg):
+        """Route a combined stream event to the manager for its symbol
+
+        :param msg:
+        :return:
+
+        """
+        if 'e' in msg and msg['e'] == 'error':
+            # the socket is shared so notify every symbol
+            for manager in list(self._managers.values()):
+                manager._depth_event(msg)
+            return
+
+        manager = self._managers.get(msg['stream'])
+        if manager:
+            manager._depth_event(msg['data'])
+
+    def get_depth_cache(self, symbol):
+        """Get the current depth cache for a symbol
+
+        :param symbol: Symbol to get the depth cache for
+        :type symbol: string
+
+        :return: DepthCache object or None if the symbol is not tracked
+
+        """
+        manager = self._managers.get(self._get_stream_name(symbol))
+        if manager is None:
+            return None
+        return manager.get_depth_cache()
+
+    def wait_ready(self, timeout=None):
+        """Wait for the depth caches of all added symbols to be initialised
+
+        :param timeout: Optional number of seconds to wait
+        :type timeout: float
+
+        :return: True if all depth caches are initialised, False if the timeout expired
+
+        """
+        done, not_done = wait(list(self._ready.values()), timeout=timeout)
+        for future in done:
+            # raise any error initialising a depth cache
+            future.result()
+        return not not_done
+
+    def get_symbols(self):
+        """Get the symbols depth caches are maintained for, without symbols which failed to initialise
+
+        :return: list of symbols
+
+        """
+        return [s for s in self._ready if not self._is_failed(s)]
+
+    def close(self, close_socket=False):
+        """Close the open sockets for this manager
+
+        :return:
+        """
+        for conn_key in self._conn_keys:
+            self._bm.stop_socket(conn_key)
+        if close_socket:
+            self._bm.close()
+        time.sleep(1)
+        for manager in self._managers.values():
+            manager.close()
+        self._conn_keys = []
+        self._executor.shutdown(wait=False)
@@ -1,18 +1,22 @@
 # coding=utf-8
 
+import json
+
 
 class BinanceAPIException(Exception):
 
-    def __init__(self, response):
+    def __init__(self, response, status_code=None, text=None):
         self.code = 0
+        if text is None:
+            text = response.text
         try:
-            json_res = response.json()
+            json_res = json.loads(text)
         except ValueError:
-            self.message = 'Invalid JSON error message from Binance: {}'.format(response.text)
+            self.message = 'Invalid JSON error message from Binance: {}'.format(text)
         else:
             self.code = json_res['code']
             self.message = json_res['msg']
-        self.status_code = response.status_code
+        self.status_code = response.status_code if status_code is None else status_code
         self.response = response
         self.request = getattr(response, 'request', None)
 
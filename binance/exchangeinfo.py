@@ -0,0 +1,211 @@
+# coding=utf-8
+
+from decimal import Decimal
+import threading
+import time
+
+from .exceptions import BinanceOrderException, BinanceOrderMinAmountException, BinanceOrderMinPriceException, \
+    BinanceOrderMinTotalException, BinanceOrderUnknownSymbolException, BinanceOrderInactiveSymbolException
+
+
+def _to_decimal(value):
+    if value is None:
+        return None
+    return value if isinstance(value, Decimal) else Decimal(str(value))
+
+
+def _is_multiple(value, minimum, step):
+    return (value - minimum) % step == 0
+
+
+class ExchangeInfoCache(object):
+
+    DEFAULT_TTL = 5 * 60  # 5 minutes
+
+    def __init__(self, ttl=DEFAULT_TTL):
+        """Initialise the ExchangeInfoCache
+
+        Holds the get_exchange_info response with its symbols indexed by name. It may be
+        shared between threads, only one of them refreshes an expired cache.
+
+        :param ttl: Number of seconds the exchange info is used for before it is refreshed,
+            use 0 or None to refresh on every call
+        :type ttl: int
+
+        """
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._exchange_info = None
+        self._symbols = {}
+        self._filters = {}
+        self._update_time = None
+
+    def is_valid(self):
+        """Check if the cached exchange info can be used
+
+        :return: bool
+
+        """
+        if self._exchange_info is None or not self._ttl:
+            return False
+        return time.time() - self._update_time < self._ttl
+
+    def update(self, exchange_info):
+        """Replace the cached exchange info
+
+        :param exchange_info: get_exchange_info response
+        :type exchange_info: dict
+
+        """
+        symbols = dict((item['symbol'], item) for item in exchange_info['symbols'])
+        filters = dict(
+            (item['symbol'], dict((f['filterType'], f) for f in item.get('filters', [])))
+            for item in exchange_info['symbols']
+        )
+        self._symbols = symbols
+        self._filters = filters
+        self._exchange_info = exchange_info
+        self._update_time = time.time()
+
+    def refresh(self, fetch):
+        """Refresh the cached exchange info if it has expired
+
+        :param fetch: function returning the current exchange info e.g. client.get_exchange_info
+        :type fetch: function
+
+        """
+        if self.is_valid():
+            return
+        with self._lock:
+            # another thread may have refreshed while we waited for the lock
+            if not self.is_valid():
+                self.update(fetch())
+
+    def invalidate(self):
+        """Refresh the exchange info on the next lookup
+
+        """
+        self._exchange_info = None
+
+    def get_exchange_info(self):
+        """Get the cached exchange info
+
+        :return: dict or None if nothing is cached
+
+        """
+        return self._exchange_info
+
+    def get_symbol(self, symbol):
+        """Get a symbol from the cached exchange info
+
+        :param symbol: e.g BNBBTC
+        :type symbol: str
+
+        :return: Dict if found, None if not
+
+        """
+        return self._symbols.get(symbol.upper())
+
+    def get_symbol_filters(self, symbol):
+        """Get the filters of a symbol from the cached exchange info
+
+        :param symbol: e.g BNBBTC
+        :type symbol: str
+
+        :return: Dict of filterType to filter, None if the symbol is not found
+
+        """
+        return self._filters.get(symbol.upper())
+
+    def _get_trading_filters(self, symbol):
+        if not symbol or symbol.upper() not in self._symbols:
+            raise BinanceOrderUnknownSymbolException(symbol)
+        if self._symbols[symbol.upper()]['status'] != 'TRADING':
+            raise BinanceOrderInactiveSymbolException(symbol)
+        return self._filters[symbol.upper()]
+
+    @staticmethod
+    def _check_price(filters, price):
+        price_filter = filters.get('PRICE_FILTER')
+        if price is None or not price_filter:
+            return
+        min_price = Decimal(price_filter['minPrice'])
+        max_price = Decimal(price_filter['maxPrice'])
+        tick_size = Decimal(price_filter['tickSize'])
+        if min_price and price < min_price:
+            raise BinanceOrderMinPriceException(price_filter['minPrice'])
+        if max_price and price > max_price:
+            raise BinanceOrderException(-1013, "Price must be at most %s" % price_filter['maxPrice'])
+        if tick_size and not _is_multiple(price, min_price, tick_size):
+            raise BinanceOrderException(-1013, "Price must be a multiple of %s" % price_filter['tickSize'])
+
+    @staticmethod
+    def _check_quantity(filters, quantity, market=False):
+        lot_size = filters.get('LOT_SIZE')
+        # market orders use MARKET_LOT_SIZE where it is set
+        if market and Decimal(filters.get('MARKET_LOT_SIZE', {}).get('stepSize', 0)):
+            lot_size = filters['MARKET_LOT_SIZE']
+        if quantity is None or not lot_size:
+            return
+        min_qty = Decimal(lot_size['minQty'])
+        max_qty = Decimal(lot_size['maxQty'])
+        step_size = Decimal(lot_size['stepSize'])
+        if quantity < min_qty:
+            raise BinanceOrderException(-1013, "Amount must be at least %s" % lot_size['minQty'])
+        if max_qty and quantity > max_qty:
+            raise BinanceOrderException(-1013, "Amount must be at most %s" % lot_size['maxQty'])
+        if step_size and not _is_multiple(quantity, min_qty, step_size):
+            raise BinanceOrderMinAmountException(lot_size['stepSize'])
+
+    @staticmethod
+    def _check_notional(filters, total):
+        min_notional = filters.get('MIN_NOTIONAL')
+        if total is None or not min_notional:
+            return
+        if total < Decimal(min_notional['minNotional']):
+            raise BinanceOrderMinTotalException(min_notional['minNotional'])
+
+    def validate_order(self, params):
+        """Check order parameters against the cached symbol filters
+
+        Checks the PRICE_FILTER, LOT_SIZE, MARKET_LOT_SIZE and MIN_NOTIONAL filters. The notional
+        value of market orders is only checked when quoteOrderQty is passed.
+
+        :param params: create_order parameters
+        :type params: dict
+
+        :raises: BinanceOrderException, BinanceOrderMinAmountException, BinanceOrderMinPriceException, BinanceOrderMinTotalException, BinanceOrderUnknownSymbolException, BinanceOrderInactiveSymbolException
+
+        """
+        filters = self._get_trading_filters(params.get('symbol'))
+        market = params.get('type') == 'MARKET'
+        price = _to_decimal(params.get('price'))
+        quantity = _to_decimal(params.get('quantity'))
+
+        self._check_price(filters, price)
+        self._check_price(filters, _to_decimal(params.get('stopPrice')))
+        self._check_quantity(filters, quantity, market)
+
+        if market:
+            self._check_notional(filters, _to_decimal(params.get('quoteOrderQty')))
+        elif price is not None and quantity is not None:
+            self._check_notional(filters, price * quantity)
+
+    def validate_oco_order(self, params):
+        """Check OCO order parameters against the cached symbol filters
+
+        :param params: create_oco_order parameters
+        :type params: dict
+
+        :raises: BinanceOrderException, BinanceOrderMinAmountException, BinanceOrderMinPriceException, BinanceOrderMinTotalException, BinanceOrderUnknownSymbolException, BinanceOrderInactiveSymbolException
+
+        """
+        filters = self._get_trading_filters(params.get('symbol'))
+        quantity = _to_decimal(params.get('quantity'))
+
+        self._check_quantity(filters, quantity)
+        for key in ('price', 'stopPrice', 'stopLimitPrice'):
+            price = _to_decimal(params.get(key))
+            self._check_price(filters, price)
+            if price is not None and quantity is not None:
+                self._check_notional(filters, price * quantity)
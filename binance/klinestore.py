@@ -0,0 +1,122 @@
+# coding=utf-8
+
+import time
+
+from .columns import KLINE_DTYPE, klines_to_records
+from .helpers import date_to_milliseconds
+from .store import RecordStore
+
+
+class KlineStore(RecordStore):
+
+    DTYPE = KLINE_DTYPE
+    EXTENSION = 'klines'
+
+    def __init__(self, path):
+        """Initialise the KlineStore
+
+        Closed klines are kept in one file per symbol and interval under path, as fixed size
+        KLINE_DTYPE records in open time order. New klines are appended by sync and reads
+        return memory mapped arrays, so a store can be read by many processes.
+
+        .. code:: python
+
+            store = KlineStore('/data/klines')
+            store.sync(client, 'BNBBTC', Client.KLINE_INTERVAL_1MINUTE, '1 Jan, 2020')
+            klines = store.read('BNBBTC', Client.KLINE_INTERVAL_1MINUTE, '1 Mar, 2020')
+            print(klines['close'].mean())
+
+        :param path: directory to keep the kline files in, created if it doesn't exist
+        :type path: str
+
+        """
+        super(KlineStore, self).__init__(path)
+
+    @staticmethod
+    def _get_name(symbol, interval):
+        # 1m and 1M are different intervals on case insensitive file systems too
+        interval_name = interval.replace('M', 'mo') if interval.endswith('M') else interval
+        return '{}-{}'.format(symbol.upper(), interval_name)
+
+    def get_last_open_time(self, symbol, interval):
+        """Get the open time of the last stored kline
+
+        :param symbol: Name of symbol pair e.g BNBBTC
+        :type symbol: str
+        :param interval: Binance Kline interval
+        :type interval: str
+
+        :return: int timestamp in milliseconds or None if nothing is stored
+
+        """
+        records = self._open(self._get_name(symbol, interval))
+        return int(records['open_time'][-1]) if len(records) else None
+
+    def sync(self, client, symbol, interval, start_str=None, limit=1000):
+        """Fetch the klines closed since the last stored kline and append them
+
+        The first sync fetches from start_str, later syncs only fetch the gap after the last stored kline.
+
+        :param client: Binance API client
+        :type client: binance.Client
+        :param symbol: Name of symbol pair e.g BNBBTC
+        :type symbol: str
+        :param interval: Binance Kline interval
+        :type interval: str
+        :param start_str: optional - Start date string in UTC format or timestamp in milliseconds for an empty store,
+            default starts at the first available kline
+        :type start_str: str|int
+        :param limit: Number of klines per request, default 1000; max 1000.
+        :type limit: int
+
+        :return: number of klines added
+
+        """
+        last_open_time = self.get_last_open_time(symbol, interval)
+        if last_open_time is not None:
+            start_ts = last_open_time + 1
+        elif start_str is None:
+            start_ts = 0
+        elif type(start_str) == int:
+            start_ts = start_str
+        else:
+            start_ts = date_to_milliseconds(start_str)
+
+        added = 0
+        with self._append(self._get_name(symbol, interval)) as f:
+            while True:
+                klines = client.get_klines(symbol=symbol, interval=interval, limit=limit, startTime=start_ts)
+                # the current kline is still open, it is stored once closed
+                now = int(time.time() * 1000)
+                closed = [kline for kline in klines if kline[6] < now]
+                if closed:
+                    f.write(klines_to_records(closed).tobytes())
+                    f.flush()
+                    added += len(closed)
+                    start_ts = closed[-1][0] + 1
+                if len(klines) < limit or len(closed) < len(klines):
+                    break
+        return added
+
+    def read(self, symbol, interval, start_str=None, end_str=None):
+        """Read stored klines by open time
+
+        :param symbol: Name of symbol pair e.g BNBBTC
+        :type symbol: str
+        :param interval: Binance Kline interval
+        :type interval: str
+        :param start_str: optional - Start date string in UTC format or timestamp in milliseconds
+        :type start_str: str|int
+        :param end_str: optional - end date string in UTC format or timestamp in milliseconds, inclusive
+        :type end_str: str|int
+
+        :return: memory mapped array of KLINE_DTYPE records, use records['close'] etc for a column
+
+        """
+        start_ts = None
+        if start_str is not None:
+            start_ts = start_str if type(start_str) == int else date_to_milliseconds(start_str)
+        end_ts = None
+        if end_str is not None:
+            end_ts = end_str if type(end_str) == int else date_to_milliseconds(end_str)
+        return self._search(self._open(self._get_name(symbol, interval)), 'open_time', start_ts, end_ts)
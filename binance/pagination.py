@@ -0,0 +1,98 @@
+# coding=utf-8
+
+# Cursors for walking paginated history endpoints. Each returns a function taking the params of a page
+# and its response, returning the params of the next page or None after the last page.
+
+
+def id_cursor(cursor_param, id_key, limit):
+    """Cursor for endpoints returning items from an id onwards e.g. fromId, orderId
+
+    Time bounds are only sent with the first page, later pages are selected by id alone.
+
+    :param cursor_param: name of the id param e.g. fromId
+    :type cursor_param: str
+    :param id_key: key of the id in each item
+    :type id_key: str
+    :param limit: page size, a shorter page is the last
+    :type limit: int
+
+    """
+    def next_params(params, page):
+        if len(page) < limit:
+            return None
+        params = dict(params)
+        params.pop('startTime', None)
+        params.pop('endTime', None)
+        params[cursor_param] = page[-1][id_key] + 1
+        return params
+    return next_params
+
+
+def time_cursor(time_key, limit, max_limit=None):
+    """Cursor for endpoints returning items from startTime onwards
+
+    Many items may have the same time, so the next page starts at the time of the last item and the
+    items already returned are skipped by id, see the id_key of Client._paginate. A page of items which
+    all have the same time is fetched again with a larger limit, up to max_limit, after which the rest
+    of the items with that time are skipped.
+
+    :param time_key: key of the time in each item
+    :type time_key: str
+    :param limit: page size, a shorter page is the last
+    :type limit: int
+    :param max_limit: optional - largest page size of the endpoint
+    :type max_limit: int
+
+    """
+    def next_params(params, page):
+        page_limit = params.get('limit', limit)
+        if len(page) < page_limit:
+            return None
+        params = dict(params)
+        last_time = page[-1][time_key]
+        if page[0][time_key] != last_time:
+            params['limit'] = limit
+        elif max_limit and page_limit < max_limit:
+            # fetch more of the items with this time
+            params['limit'] = min(page_limit * 2, max_limit)
+        else:
+            last_time += 1
+        params['startTime'] = last_time
+        return params
+    return next_params
+
+
+def page_number_cursor(size):
+    """Cursor for endpoints returning numbered pages of rows with a total e.g. margin loan records
+
+    :param size: page size
+    :type size: int
+
+    """
+    def next_params(params, page):
+        current = params.get('current', 1)
+        if not page.get('rows') or current * size >= page.get('total', 0):
+            return None
+        params = dict(params)
+        params['current'] = current + 1
+        return params
+    return next_params
+
+
+def time_window_cursor(window, end_ts):
+    """Cursor for endpoints returning everything between startTime and endTime in windows of limited length
+
+    :param window: window length in milliseconds
+    :type window: int
+    :param end_ts: end of the last window in milliseconds
+    :type end_ts: int
+
+    """
+    def next_params(params, page):
+        if params['endTime'] >= end_ts:
+            return None
+        params = dict(params)
+        params['startTime'] = params['endTime'] + 1
+        params['endTime'] = min(params['startTime'] + window - 1, end_ts)
+        return params
+    return next_params
@@ -0,0 +1,277 @@
+# coding=utf-8
+
+import re
+import threading
+import time
+
+try:
+    from urllib.parse import urlparse
+except ImportError:  # pragma: no cover
+    from urlparse import urlparse
+
+
+RATE_LIMIT_REQUEST_WEIGHT = 'REQUEST_WEIGHT'
+RATE_LIMIT_ORDERS = 'ORDERS'
+
+_INTERVAL_SECONDS = {
+    'SECOND': 1,
+    'MINUTE': 60,
+    'HOUR': 60 * 60,
+    'DAY': 24 * 60 * 60,
+}
+
+_HEADER_UNIT_SECONDS = {
+    's': 1,
+    'm': 60,
+    'h': 60 * 60,
+    'd': 24 * 60 * 60,
+}
+
+# used weight and order count headers look like X-MBX-USED-WEIGHT-1M and X-MBX-ORDER-COUNT-10S
+_HEADER_RE = re.compile(r'^x-mbx-(used-weight|order-count)(?:-(\d+)([smhd]))?$')
+
+# default limits, replaced by the rateLimits block of get_exchange_info() with load_exchange_info()
+DEFAULT_RATE_LIMITS = [
+    {'rateLimitType': RATE_LIMIT_REQUEST_WEIGHT, 'interval': 'MINUTE', 'intervalNum': 1, 'limit': 1200},
+    {'rateLimitType': RATE_LIMIT_ORDERS, 'interval': 'SECOND', 'intervalNum': 1, 'limit': 10},
+    {'rateLimitType': RATE_LIMIT_ORDERS, 'interval': 'DAY', 'intervalNum': 1, 'limit': 100000},
+]
+
+# endpoint weights, endpoints not listed here have a weight of 1
+ENDPOINT_WEIGHTS = {
+    'historicalTrades': 5,
+    'ticker/allPrices': 2,
+    'ticker/allBookTickers': 2,
+    'allOrders': 5,
+    'allOrderList': 10,
+    'openOrderList': 2,
+    'account': 5,
+    'myTrades': 5,
+}
+
+# endpoints whose weight depends on whether a symbol is passed, as (with symbol, without symbol)
+SYMBOL_ENDPOINT_WEIGHTS = {
+    'ticker/24hr': (1, 40),
+    'ticker/price': (1, 2),
+    'ticker/bookTicker': (1, 2),
+    'openOrders': (1, 40),
+}
+
+# order book weights by limit, as (max limit, weight)
+DEPTH_WEIGHTS = [
+    (100, 1),
+    (500, 5),
+    (1000, 10),
+    (5000, 50),
+]
+
+# endpoints which count towards the ORDERS rate limits when posted to
+ORDER_ENDPOINTS = {'order', 'order/oco', 'margin/order', 'batchOrders'}
+
+
+def get_endpoint(uri):
+    """Get the endpoint name from a request uri
+
+    e.g. https://api.binance.com/api/v3/order returns order
+
+    :param uri: full request uri
+    :type uri: str
+
+    :return: tuple of host and endpoint name
+
+    """
+    parsed = urlparse(uri)
+    # drop the leading api prefix and version e.g. /api/v3/ or /sapi/v1/
+    return parsed.netloc, parsed.path.strip('/').split('/', 2)[-1]
+
+
+def get_request_weight(endpoint, params=None):
+    """Get the request weight of an endpoint call
+
+    :param endpoint: endpoint name e.g. depth, ticker/24hr
+    :type endpoint: str
+    :param params: request parameters
+    :type params: dict
+
+    :return: int weight
+
+    """
+    params = params or {}
+    if endpoint == 'depth':
+        limit = int(params.get('limit') or 100)
+        for max_limit, weight in DEPTH_WEIGHTS:
+            if limit <= max_limit:
+                return weight
+        return DEPTH_WEIGHTS[-1][1]
+    if endpoint in SYMBOL_ENDPOINT_WEIGHTS:
+        with_symbol, without_symbol = SYMBOL_ENDPOINT_WEIGHTS[endpoint]
+        return with_symbol if params.get('symbol') else without_symbol
+    return ENDPOINT_WEIGHTS.get(endpoint, 1)
+
+
+class TokenBucket(object):
+
+    def __init__(self, limit, interval):
+        """Initialise the TokenBucket
+
+        Tokens refill continuously at limit per interval. Reservations may take the bucket
+        below zero, later reservations then wait for the deficit to refill.
+
+        :param limit: number of tokens available per interval
+        :type limit: int
+        :param interval: interval length in seconds
+        :type interval: int
+
+        """
+        self.limit = limit
+        self.interval = interval
+        self._rate = float(limit) / interval
+        self._tokens = float(limit)
+        self._updated = time.time()
+
+    def _refill(self, now):
+        if now > self._updated:
+            self._tokens = min(self.limit, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+
+    def reserve(self, tokens, now):
+        """Take tokens from the bucket
+
+        :return: seconds to wait before the tokens are available
+
+        """
+        self._refill(now)
+        self._tokens -= tokens
+        if self._tokens >= 0:
+            return 0
+        return -self._tokens / self._rate
+
+    def set_used(self, used, now):
+        """Apply the usage reported by the server for the current interval"""
+        self._refill(now)
+        self._tokens = min(self._tokens, self.limit - used)
+
+
+class RateLimiter(object):
+
+    def __init__(self, rate_limits=None):
+        """Initialise the RateLimiter
+
+        Thread safe client side limiter for the REQUEST_WEIGHT and ORDERS rate limits. Usage reported
+        by the X-MBX-USED-WEIGHT-* and X-MBX-ORDER-COUNT-* response headers is applied after every
+        response, and calls are held back after a 429 or 418 response for the Retry-After period.
+
+        :param rate_limits: optional - rateLimits list as returned by get_exchange_info
+        :type rate_limits: list
+
+        """
+        self._lock = threading.Lock()
+        self._rate_limits = []
+        self._buckets = {}
+        self._blocked_until = {}
+        self.load_rate_limits(rate_limits or DEFAULT_RATE_LIMITS)
+
+    def load_rate_limits(self, rate_limits):
+        """Replace the limits in use
+
+        :param rate_limits: rateLimits list as returned by get_exchange_info
+        :type rate_limits: list
+
+        """
+        limits = []
+        for rate_limit in rate_limits:
+            limit_type = rate_limit['rateLimitType']
+            # older exchangeInfo responses named the weight limit REQUESTS
+            if limit_type == 'REQUESTS':
+                limit_type = RATE_LIMIT_REQUEST_WEIGHT
+            if limit_type not in (RATE_LIMIT_REQUEST_WEIGHT, RATE_LIMIT_ORDERS):
+                continue
+            interval = _INTERVAL_SECONDS[rate_limit['interval']] * rate_limit.get('intervalNum', 1)
+            limits.append((limit_type, interval, rate_limit['limit']))
+        with self._lock:
+            self._rate_limits = limits
+            self._buckets = {}
+
+    def load_exchange_info(self, exchange_info):
+        """Replace the limits in use with those from get_exchange_info
+
+        :param exchange_info: get_exchange_info response
+        :type exchange_info: dict
+
+        """
+        self.load_rate_limits(exchange_info['rateLimits'])
+
+    def _get_buckets(self, host):
+        if host not in self._buckets:
+            self._buckets[host] = [
+                (limit_type, TokenBucket(limit, interval)) for limit_type, interval, limit in self._rate_limits
+            ]
+        return self._buckets[host]
+
+    def reserve(self, method, uri, params=None):
+        """Reserve capacity for a request
+
+        :param method: http method
+        :type method: str
+        :param uri: full request uri
+        :type uri: str
+        :param params: request parameters
+        :type params: dict
+
+        :return: seconds to wait before sending the request
+
+        """
+        host, endpoint = get_endpoint(uri)
+        costs = {
+            RATE_LIMIT_REQUEST_WEIGHT: get_request_weight(endpoint, params),
+            RATE_LIMIT_ORDERS: 1 if method == 'post' and endpoint in ORDER_ENDPOINTS else 0,
+        }
+        now = time.time()
+        with self._lock:
+            wait = self._blocked_until.get(host, now) - now
+            for limit_type, bucket in self._get_buckets(host):
+                if costs[limit_type]:
+                    wait = max(wait, bucket.reserve(costs[limit_type], now))
+        return max(wait, 0)
+
+    def acquire(self, method, uri, params=None):
+        """Block until a request is within the rate limits
+
+        See :meth:`reserve` for parameters
+
+        """
+        wait = self.reserve(method, uri, params)
+        if wait:
+            time.sleep(wait)
+
+    def update(self, uri, status_code, headers):
+        """Apply the rate limit state reported by a response
+
+        :param uri: full request uri
+        :type uri: str
+        :param status_code: response status code
+        :type status_code: int
+        :param headers: response headers
+        :type headers: dict
+
+        """
+        host, _ = get_endpoint(uri)
+        now = time.time()
+        with self._lock:
+            buckets = self._get_buckets(host)
+            for name, value in headers.items():
+                match = _HEADER_RE.match(name.lower())
+                if not match:
+                    continue
+                header_type, num, unit = match.groups()
+                limit_type = RATE_LIMIT_REQUEST_WEIGHT if header_type == 'used-weight' else RATE_LIMIT_ORDERS
+                # the legacy X-MBX-USED-WEIGHT header has no interval and reports the minute window
+                interval = int(num) * _HEADER_UNIT_SECONDS[unit] if num else 60
+                for bucket_type, bucket in buckets:
+                    if bucket_type == limit_type and bucket.interval == interval:
+                        bucket.set_used(int(value), now)
+
+            if status_code in (418, 429):
+                retry_after = headers.get('Retry-After')
+                retry_after = int(retry_after) if retry_after else 60
+                self._blocked_until[host] = max(self._blocked_until.get(host, now), now + retry_after)
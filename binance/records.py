@@ -0,0 +1,196 @@
+# coding=utf-8
+
+# Compact typed records of market data. Prices and quantities are parsed to floats and fields are stored
+# in __slots__, so a record takes a fraction of the memory of the response dict or list it replaces.
+
+
+class Record(object):
+
+    __slots__ = ()
+
+    def __eq__(self, other):
+        return type(self) is type(other) and all(getattr(self, f) == getattr(other, f) for f in self.__slots__)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return '{}({})'.format(type(self).__name__, ', '.join(
+            '{}={!r}'.format(f, getattr(self, f)) for f in self.__slots__))
+
+    def to_dict(self):
+        """Get the fields of the record
+
+        :return: dict of field name to value
+
+        """
+        return dict((f, getattr(self, f)) for f in self.__slots__)
+
+
+class Kline(Record):
+
+    __slots__ = ('open_time', 'open', 'high', 'low', 'close', 'volume', 'close_time', 'quote_volume', 'trades',
+                 'taker_buy_base_volume', 'taker_buy_quote_volume', 'is_closed')
+
+    def __init__(self, open_time, open, high, low, close, volume, close_time, quote_volume, trades,
+                 taker_buy_base_volume, taker_buy_quote_volume, is_closed=None):
+        self.open_time = open_time
+        self.open = open
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+        self.close_time = close_time
+        self.quote_volume = quote_volume
+        self.trades = trades
+        self.taker_buy_base_volume = taker_buy_base_volume
+        self.taker_buy_quote_volume = taker_buy_quote_volume
+        # None for REST klines, the last kline of a response may still be open
+        self.is_closed = is_closed
+
+    @classmethod
+    def from_rest(cls, data):
+        return cls(data[0], float(data[1]), float(data[2]), float(data[3]), float(data[4]), float(data[5]),
+                   data[6], float(data[7]), data[8], float(data[9]), float(data[10]))
+
+    @classmethod
+    def from_event(cls, msg):
+        k = msg['k']
+        return cls(k['t'], float(k['o']), float(k['h']), float(k['l']), float(k['c']), float(k['v']),
+                   k['T'], float(k['q']), k['n'], float(k['V']), float(k['Q']), k['x'])
+
+
+class AggTrade(Record):
+
+    __slots__ = ('id', 'price', 'quantity', 'first_trade_id', 'last_trade_id', 'time', 'is_buyer_maker',
+                 'is_best_match')
+
+    def __init__(self, id, price, quantity, first_trade_id, last_trade_id, time, is_buyer_maker, is_best_match):
+        self.id = id
+        self.price = price
+        self.quantity = quantity
+        self.first_trade_id = first_trade_id
+        self.last_trade_id = last_trade_id
+        self.time = time
+        self.is_buyer_maker = is_buyer_maker
+        self.is_best_match = is_best_match
+
+    @classmethod
+    def from_rest(cls, data):
+        return cls(data['a'], float(data['p']), float(data['q']), data['f'], data['l'], data['T'], data['m'],
+                   data['M'])
+
+    # websocket messages use the keys of the REST response
+    from_event = from_rest
+
+
+class Trade(Record):
+
+    __slots__ = ('id', 'price', 'quantity', 'time', 'is_buyer_maker', 'is_best_match')
+
+    def __init__(self, id, price, quantity, time, is_buyer_maker, is_best_match):
+        self.id = id
+        self.price = price
+        self.quantity = quantity
+        self.time = time
+        self.is_buyer_maker = is_buyer_maker
+        self.is_best_match = is_best_match
+
+    @classmethod
+    def from_rest(cls, data):
+        return cls(data['id'], float(data['price']), float(data['qty']), data['time'], data['isBuyerMaker'],
+                   data['isBestMatch'])
+
+    @classmethod
+    def from_event(cls, msg):
+        return cls(msg['t'], float(msg['p']), float(msg['q']), msg['T'], msg['m'], msg['M'])
+
+
+class BookTicker(Record):
+
+    __slots__ = ('symbol', 'bid_price', 'bid_quantity', 'ask_price', 'ask_quantity', 'update_id')
+
+    def __init__(self, symbol, bid_price, bid_quantity, ask_price, ask_quantity, update_id=None):
+        self.symbol = symbol
+        self.bid_price = bid_price
+        self.bid_quantity = bid_quantity
+        self.ask_price = ask_price
+        self.ask_quantity = ask_quantity
+        # None for REST tickers
+        self.update_id = update_id
+
+    @classmethod
+    def from_rest(cls, data):
+        return cls(data['symbol'], float(data['bidPrice']), float(data['bidQty']), float(data['askPrice']),
+                   float(data['askQty']))
+
+    @classmethod
+    def from_event(cls, msg):
+        return cls(msg['s'], float(msg['b']), float(msg['B']), float(msg['a']), float(msg['A']), msg['u'])
+
+
+def _parse_levels(levels):
+    return [(float(level[0]), float(level[1])) for level in levels]
+
+
+class DepthUpdate(Record):
+
+    __slots__ = ('symbol', 'first_update_id', 'last_update_id', 'bids', 'asks')
+
+    def __init__(self, symbol, first_update_id, last_update_id, bids, asks):
+        self.symbol = symbol
+        self.first_update_id = first_update_id
+        self.last_update_id = last_update_id
+        # lists of (price, quantity) tuples
+        self.bids = bids
+        self.asks = asks
+
+    @classmethod
+    def from_rest(cls, data):
+        """Create a record from an order book or a partial book depth message"""
+        return cls(None, data['lastUpdateId'], data['lastUpdateId'], _parse_levels(data['bids']),
+                   _parse_levels(data['asks']))
+
+    @classmethod
+    def from_event(cls, msg):
+        if 'lastUpdateId' in msg:
+            # partial book depth streams send order book snapshots
+            return cls.from_rest(msg)
+        return cls(msg['s'], msg['U'], msg['u'], _parse_levels(msg['b']), _parse_levels(msg['a']))
+
+
+def to_records(record_class, res):
+    """Convert a REST API response to records
+
+    :param record_class: Record class e.g. Kline
+    :type record_class: class
+    :param res: API response, a list of items or a single item
+    :type res: list|dict
+
+    :return: list of records or a record
+
+    """
+    if isinstance(res, list):
+        return [record_class.from_rest(data) for data in res]
+    return record_class.from_rest(res)
+
+
+def record_callback(record_class, callback):
+    """Wrap a websocket callback to be called with records instead of messages
+
+    Error messages from the socket manager are passed on unchanged.
+
+    :param record_class: Record class e.g. Kline
+    :type record_class: class
+    :param callback: callback function to handle records
+    :type callback: function
+
+    :return: callback function to handle messages
+
+    """
+    def convert(msg):
+        if isinstance(msg, dict) and msg.get('e') == 'error':
+            callback(msg)
+        else:
+            callback(record_class.from_event(msg))
+    return convert
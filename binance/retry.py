@@ -0,0 +1,183 @@
+# coding=utf-8
+
+import random
+import uuid
+
+from .ratelimiter import get_endpoint
+
+# methods which can be sent again without side effects
+IDEMPOTENT_METHODS = {'get', 'put', 'delete'}
+
+# order endpoints and the client id param an order is looked up by before it is sent again
+CLIENT_ORDER_ID_PARAMS = {
+    'order': 'newClientOrderId',
+    'order/oco': 'listClientOrderId',
+    'margin/order': 'newClientOrderId',
+}
+
+# endpoints to query an order by origClientOrderId, and the order params to send with it
+ORDER_QUERY_ENDPOINTS = {
+    'order': ('order', ('symbol',)),
+    'order/oco': ('orderList', ()),
+    'margin/order': ('margin/order', ('symbol', 'isIsolated')),
+}
+
+# error code of a query for an order which does not exist
+ORDER_NOT_FOUND_CODE = -2013
+
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+class RetryPolicy(object):
+
+    def __init__(self, max_retries=3, backoff_factor=0.5, max_backoff=30, status_codes=RETRY_STATUS_CODES,
+                 retry_timeouts=True, hooks=None):
+        """Initialise the RetryPolicy
+
+        Failed calls are retried after an exponentially increasing wait with full jitter, a random wait
+        between 0 and backoff_factor * 2 ** attempt seconds. The Retry-After header of a 429 response
+        is used as the minimum wait.
+
+        GET, PUT and DELETE calls are retried. Orders are retried after a 429 response, which Binance
+        rejected without placing the order. After a timeout or a 5xx response the order may have been
+        placed, so it is first queried by its newClientOrderId, generated if not set, and only sent again
+        if it does not exist. If it exists the query response is returned instead, if it can't be queried
+        the original error is raised. Binance only rejects a repeated client order id while the first order
+        is open, so the id alone does not stop a filled order being placed twice. Other POST calls,
+        e.g. withdraw, are never retried.
+
+        .. code:: python
+
+            def log_retry(attempt, wait, method, uri, exception):
+                print('retry {} of {} {} in {:.2f}s: {}'.format(attempt, method, uri, wait, exception))
+
+            client = Client(api_key, api_secret, retry_policy=RetryPolicy(max_retries=5, hooks=[log_retry]))
+
+        :param max_retries: Number of times a call is retried
+        :type max_retries: int
+        :param backoff_factor: Seconds to base the wait before a retry on
+        :type backoff_factor: float
+        :param max_backoff: Maximum number of seconds to wait before a retry, Retry-After may be longer
+        :type max_backoff: float
+        :param status_codes: Response status codes to retry
+        :type status_codes: tuple
+        :param retry_timeouts: Retry calls which timed out or failed to connect
+        :type retry_timeouts: bool
+        :param hooks: optional - Functions called before each retry with the attempt number, the wait in
+            seconds, the request method and uri and the exception of the failed attempt
+        :type hooks: list
+
+        """
+        self._max_retries = max_retries
+        self._backoff_factor = backoff_factor
+        self._max_backoff = max_backoff
+        self._status_codes = status_codes
+        self._retry_timeouts = retry_timeouts
+        self._hooks = list(hooks or [])
+
+    def add_hook(self, hook):
+        """Add a function to call before each retry
+
+        :param hook: function taking attempt, wait, method, uri and exception
+        :type hook: function
+
+        """
+        self._hooks.append(hook)
+
+    def prepare(self, method, uri, params):
+        """Check if a call may be retried, setting a client order id on orders
+
+        :param method: request method
+        :type method: str
+        :param uri: full request uri
+        :type uri: str
+        :param params: request params, updated with a generated client order id if required
+        :type params: dict
+
+        :return: bool
+
+        """
+        if method in IDEMPOTENT_METHODS:
+            return True
+        if method != 'post' or params is None:
+            return False
+        _, endpoint = get_endpoint(uri)
+        id_param = CLIENT_ORDER_ID_PARAMS.get(endpoint)
+        if id_param is None:
+            return False
+        if not params.get(id_param):
+            params[id_param] = uuid.uuid4().hex
+        return True
+
+    def get_order_query(self, method, uri, params):
+        """Get the call to look up an order before it is sent again
+
+        :param method: request method
+        :type method: str
+        :param uri: full request uri
+        :type uri: str
+        :param params: request params, after prepare set the client order id
+        :type params: dict
+
+        :return: tuple of query uri and params or None if the call is not an order
+
+        """
+        if method != 'post' or params is None:
+            return None
+        _, endpoint = get_endpoint(uri)
+        if endpoint not in ORDER_QUERY_ENDPOINTS:
+            return None
+        query_endpoint, order_params = ORDER_QUERY_ENDPOINTS[endpoint]
+        query_params = {'origClientOrderId': params[CLIENT_ORDER_ID_PARAMS[endpoint]]}
+        for param in order_params:
+            if param in params:
+                query_params[param] = params[param]
+        return uri[:len(uri) - len(endpoint)] + query_endpoint, query_params
+
+    @staticmethod
+    def is_order_unknown(status_code):
+        """Check if an order may have been placed by a failed call
+
+        :param status_code: Response status code, None if the call timed out or failed to connect
+        :type status_code: int
+
+        :return: bool
+
+        """
+        return status_code is None or status_code >= 500
+
+    def get_wait(self, attempt, status_code=None, retry_after=None):
+        """Get the number of seconds to wait before retrying a failed call
+
+        :param attempt: Number of the retry, starting at 1
+        :type attempt: int
+        :param status_code: Response status code, None if the call timed out or failed to connect
+        :type status_code: int
+        :param retry_after: optional - Retry-After header of the response
+        :type retry_after: str
+
+        :return: float seconds or None if the call should not be retried
+
+        """
+        if attempt > self._max_retries:
+            return None
+        if status_code is None:
+            if not self._retry_timeouts:
+                return None
+        elif status_code not in self._status_codes:
+            return None
+
+        wait = random.uniform(0, min(self._max_backoff, self._backoff_factor * 2 ** (attempt - 1)))
+        if retry_after:
+            try:
+                wait = max(wait, float(retry_after))
+            except ValueError:
+                pass
+        return wait
+
+    def notify(self, attempt, wait, method, uri, exception):
+        """Call the retry hooks
+
+        """
+        for hook in self._hooks:
+            hook(attempt, wait, method, uri, exception)
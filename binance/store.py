@@ -0,0 +1,66 @@
+# coding=utf-8
+
+import os
+import threading
+from contextlib import contextmanager
+
+import numpy as np
+
+
+class RecordStore(object):
+
+    # numpy dtype of the records, set by subclasses
+    DTYPE = None
+    # file extension of the record files, set by subclasses
+    EXTENSION = None
+
+    def __init__(self, path):
+        """Initialise the RecordStore
+
+        Records are kept in append only files of fixed size DTYPE records under path and read as
+        memory mapped arrays, so a store can be read by many processes.
+
+        :param path: directory to keep the record files in, created if it doesn't exist
+        :type path: str
+
+        """
+        self._path = path
+        self._lock = threading.Lock()
+        if not os.path.isdir(path):
+            os.makedirs(path)
+
+    def _get_file(self, name):
+        return os.path.join(self._path, '{}.{}'.format(name, self.EXTENSION))
+
+    def _get_count(self, filename):
+        if not os.path.exists(filename):
+            return 0
+        # ignore a partially written last record from an interrupted sync
+        return os.path.getsize(filename) // self.DTYPE.itemsize
+
+    def _open(self, name):
+        filename = self._get_file(name)
+        count = self._get_count(filename)
+        if not count:
+            return np.empty(0, dtype=self.DTYPE)
+        return np.memmap(filename, dtype=self.DTYPE, mode='r', shape=(count,))
+
+    @contextmanager
+    def _append(self, name):
+        """Open a record file to append records to, one writer at a time"""
+        with self._lock:
+            filename = self._get_file(name)
+            count = self._get_count(filename)
+            with open(filename, 'r+b' if os.path.exists(filename) else 'wb') as f:
+                # drop a partially written last record
+                f.truncate(count * self.DTYPE.itemsize)
+                f.seek(0, os.SEEK_END)
+                yield f
+
+    @staticmethod
+    def _search(records, field, start=None, end=None):
+        """Slice records sorted by field to those with start <= field <= end"""
+        values = records[field]
+        first = 0 if start is None else np.searchsorted(values, start, side='left')
+        last = len(records) if end is None else np.searchsorted(values, end, side='right')
+        return records[first:last]
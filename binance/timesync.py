@@ -0,0 +1,146 @@
+# coding=utf-8
+
+import logging
+import threading
+import time
+
+
+class ServerTimeSync(object):
+
+    DEFAULT_SMOOTHING = 0.2
+    DEFAULT_RESYNC_INTERVAL = 60  # seconds
+
+    def __init__(self, smoothing=DEFAULT_SMOOTHING, resync_interval=DEFAULT_RESYNC_INTERVAL):
+        """Initialise the ServerTimeSync
+
+        Tracks the offset between the local clock and the Binance server clock so signed requests
+        are timestamped with server time. Pass it to the client as time_sync.
+
+        .. code:: python
+
+            client = Client(api_key, api_secret, time_sync=ServerTimeSync())
+
+        :param smoothing: Weight of a new measurement in the smoothed offset and round trip time,
+            between 0 and 1, 1 uses the latest measurement only
+        :type smoothing: float
+        :param resync_interval: Number of seconds between measurements in the background
+        :type resync_interval: int
+
+        """
+        self._smoothing = smoothing
+        self._resync_interval = resync_interval
+        self._lock = threading.Lock()
+        self._offset = 0.0
+        self._rtt = None
+        self._sync_time = None
+        self._thread = None
+        self._stop = threading.Event()
+        self._log = logging.getLogger(__name__)
+
+    @property
+    def offset(self):
+        """Smoothed offset of the server clock in milliseconds, positive if it is ahead of the local clock"""
+        return self._offset
+
+    @property
+    def rtt(self):
+        """Smoothed round trip time of the server time call in milliseconds, None before the first measurement"""
+        return self._rtt
+
+    @property
+    def resync_interval(self):
+        """Number of seconds between measurements in the background"""
+        return self._resync_interval
+
+    @property
+    def sync_time(self):
+        """Local time of the last measurement, None before the first measurement"""
+        return self._sync_time
+
+    def timestamp(self):
+        """Get the current server time
+
+        :return: int timestamp in milliseconds
+
+        """
+        return int(time.time() * 1000 + self._offset)
+
+    def update(self, sent, received, server_time):
+        """Add a measurement of the server clock
+
+        The server time is taken to be read half way through the round trip.
+
+        :param sent: Local time in seconds the request was sent
+        :type sent: float
+        :param received: Local time in seconds the response was received
+        :type received: float
+        :param server_time: serverTime of the response in milliseconds
+        :type server_time: int
+
+        """
+        rtt = (received - sent) * 1000
+        offset = server_time - (sent + received) * 500
+        with self._lock:
+            if self._rtt is None:
+                self._offset = offset
+                self._rtt = rtt
+            else:
+                self._offset += self._smoothing * (offset - self._offset)
+                self._rtt += self._smoothing * (rtt - self._rtt)
+            self._sync_time = received
+
+    def sync(self, get_server_time, samples=3):
+        """Measure the server clock
+
+        Of the samples only the one with the shortest round trip is used, being the most accurate.
+
+        :param get_server_time: function returning the server time response e.g. client.get_server_time
+            or client.futures_time
+        :type get_server_time: function
+        :param samples: Number of calls to make
+        :type samples: int
+
+        :raises: BinanceRequestException, BinanceAPIException
+
+        """
+        measurements = []
+        for _ in range(samples):
+            sent = time.time()
+            server_time = get_server_time()['serverTime']
+            measurements.append((sent, time.time(), server_time))
+        self.update(*min(measurements, key=lambda m: m[1] - m[0]))
+
+    def start(self, get_server_time, samples=3):
+        """Measure the server clock every resync_interval seconds in a background thread
+
+        :param get_server_time: function returning the server time response e.g. client.get_server_time
+        :type get_server_time: function
+        :param samples: Number of calls to make for each measurement
+        :type samples: int
+
+        """
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(get_server_time, samples))
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _run(self, get_server_time, samples):
+        while True:
+            # skip the first measurement if the clock was just measured
+            if self._sync_time is None or time.time() - self._sync_time >= self._resync_interval:
+                try:
+                    self.sync(get_server_time, samples)
+                except Exception:
+                    # keep the previous offset and try again at the next interval
+                    self._log.warning('Failed to sync server time', exc_info=True)
+            if self._stop.wait(self._resync_interval):
+                break
+
+    def stop(self):
+        """Stop the background measurements
+
+        """
+        self._stop.set()
+        self._thread = None
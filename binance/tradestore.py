@@ -0,0 +1,129 @@
+# coding=utf-8
+
+from .columns import AGG_TRADE_DTYPE, agg_trades_to_records
+from .helpers import date_to_milliseconds
+from .store import RecordStore
+
+
+class AggTradeStore(RecordStore):
+
+    DTYPE = AGG_TRADE_DTYPE
+    EXTENSION = 'aggtrades'
+
+    def __init__(self, path):
+        """Initialise the AggTradeStore
+
+        Aggregate trades are kept in one file per symbol under path, as fixed size AGG_TRADE_DTYPE
+        records in id order. New trades are appended by sync and reads return memory mapped arrays,
+        found by binary search on the trade time or id, so trades can be replayed without parsing JSON.
+
+        .. code:: python
+
+            store = AggTradeStore('/data/aggtrades')
+            store.sync(client, 'BNBBTC', '1 Jan, 2020', max_workers=4)
+            trades = store.read('BNBBTC', '1 Mar, 2020', '2 Mar, 2020')
+            print((trades['price'] * trades['quantity']).sum())
+
+        :param path: directory to keep the trade files in, created if it doesn't exist
+        :type path: str
+
+        """
+        super(AggTradeStore, self).__init__(path)
+
+    @staticmethod
+    def _get_name(symbol):
+        return symbol.upper()
+
+    def get_last_id(self, symbol):
+        """Get the id of the last stored aggregate trade
+
+        :param symbol: Name of symbol pair e.g BNBBTC
+        :type symbol: str
+
+        :return: int aggregate trade id or None if nothing is stored
+
+        """
+        records = self._open(self._get_name(symbol))
+        return int(records['id'][-1]) if len(records) else None
+
+    def sync(self, client, symbol, start_str=None, end_str=None, max_workers=None, batch_size=10000):
+        """Fetch the aggregate trades after the last stored trade and append them
+
+        The first sync fetches from start_str, later syncs resume after the last stored trade id.
+        Trades are written in batches, an interrupted sync keeps the batches written so far.
+
+        :param client: Binance API client
+        :type client: binance.Client
+        :param symbol: Name of symbol pair e.g BNBBTC
+        :type symbol: str
+        :param start_str: optional - Start date string in UTC format or timestamp in milliseconds for an empty store,
+            default starts at the first trade
+        :type start_str: str|int
+        :param end_str: optional - end date string in UTC format or timestamp in milliseconds, only used
+            with max_workers
+        :type end_str: str|int
+        :param max_workers: optional - Fetch pages of trades concurrently with this many workers, see
+            :meth:`binance.client.Client.aggregate_trade_iter`
+        :type max_workers: int
+        :param batch_size: Number of trades to write at a time
+        :type batch_size: int
+
+        :return: number of trades added
+
+        """
+        last_id = self.get_last_id(symbol)
+        if last_id is not None:
+            start_str = None
+
+        added = 0
+        batch = []
+        with self._append(self._get_name(symbol)) as f:
+            trades = client.aggregate_trade_iter(symbol, start_str=start_str, last_id=last_id, end_str=end_str,
+                                                 max_workers=max_workers)
+            for trade in trades:
+                batch.append(trade)
+                if len(batch) >= batch_size:
+                    f.write(agg_trades_to_records(batch).tobytes())
+                    f.flush()
+                    added += len(batch)
+                    batch = []
+            if batch:
+                f.write(agg_trades_to_records(batch).tobytes())
+                added += len(batch)
+        return added
+
+    def read(self, symbol, start_str=None, end_str=None):
+        """Read stored aggregate trades by trade time
+
+        :param symbol: Name of symbol pair e.g BNBBTC
+        :type symbol: str
+        :param start_str: optional - Start date string in UTC format or timestamp in milliseconds
+        :type start_str: str|int
+        :param end_str: optional - end date string in UTC format or timestamp in milliseconds, inclusive
+        :type end_str: str|int
+
+        :return: memory mapped array of AGG_TRADE_DTYPE records, use records['price'] etc for a column
+
+        """
+        start_ts = None
+        if start_str is not None:
+            start_ts = start_str if type(start_str) == int else date_to_milliseconds(start_str)
+        end_ts = None
+        if end_str is not None:
+            end_ts = end_str if type(end_str) == int else date_to_milliseconds(end_str)
+        return self._search(self._open(self._get_name(symbol)), 'time', start_ts, end_ts)
+
+    def read_ids(self, symbol, first_id=None, last_id=None):
+        """Read stored aggregate trades by aggregate trade id
+
+        :param symbol: Name of symbol pair e.g BNBBTC
+        :type symbol: str
+        :param first_id: optional - first aggregate trade id
+        :type first_id: int
+        :param last_id: optional - last aggregate trade id, inclusive
+        :type last_id: int
+
+        :return: memory mapped array of AGG_TRADE_DTYPE records
+
+        """
+        return self._search(self._open(self._get_name(symbol)), 'id', first_id, last_id)
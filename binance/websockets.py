@@ -11,6 +11,7 @@ from twisted.internet.protocol import ReconnectingClientFactory
 from twisted.internet.error import ReactorAlreadyRunning
 
 from binance.client import Client
+from binance.records import AggTrade, BookTicker, DepthUpdate, Kline, Trade, record_callback
 
 
 class BinanceClientProtocol(WebSocketClientProtocol):
@@ -25,7 +26,11 @@ class BinanceClientProtocol(WebSocketClientProtocol):
     def onMessage(self, payload, isBinary):
         if not isBinary:
             try:
-                payload_obj = json.loads(payload.decode('utf8'))
+                if self.factory.json_loads:
+                    # decode straight from bytes
+                    payload_obj = self.factory.json_loads(payload)
+                else:
+                    payload_obj = json.loads(payload.decode('utf8'))
             except ValueError:
                 pass
             else:
@@ -45,6 +50,7 @@ class BinanceReconnectingClientFactory(ReconnectingClientFactory):
 class BinanceClientFactory(WebSocketClientFactory, BinanceReconnectingClientFactory):
 
     protocol = BinanceClientProtocol
+    json_loads = None
     _reconnect_error_payload = {
         'e': 'error',
         'm': 'Max reconnect retries reached'
@@ -72,19 +78,23 @@ class BinanceSocketManager(threading.Thread):
 
     DEFAULT_USER_TIMEOUT = 30 * 60  # 30 minutes
 
-    def __init__(self, client, user_timeout=DEFAULT_USER_TIMEOUT):
+    def __init__(self, client, user_timeout=DEFAULT_USER_TIMEOUT, json_loads=None):
         """Initialise the BinanceSocketManager
 
         :param client: Binance API client
         :type client: binance.Client
         :param user_timeout: Custom websocket timeout
         :type user_timeout: int
+        :param json_loads: optional - Function to decode messages with, e.g. orjson.loads. It is passed the
+            message bytes and should raise a ValueError for invalid JSON
+        :type json_loads: function
 
         """
         threading.Thread.__init__(self)
         self._conns = {}
         self._client = client
         self._user_timeout = user_timeout
+        self._json_loads = json_loads
         self._timers = {'user': None, 'margin': None}
         self._listen_keys = {'user': None, 'margin': None}
         self._account_callbacks = {'user': None, 'margin': None}
@@ -97,6 +107,7 @@ class BinanceSocketManager(threading.Thread):
         factory = BinanceClientFactory(factory_url)
         factory.protocol = BinanceClientProtocol
         factory.callback = callback
+        factory.json_loads = self._json_loads
         factory.reconnect = True
         context_factory = ssl.ClientContextFactory()
 
@@ -112,13 +123,14 @@ class BinanceSocketManager(threading.Thread):
         factory = BinanceClientFactory(factory_url)
         factory.protocol = BinanceClientProtocol
         factory.callback = callback
+        factory.json_loads = self._json_loads
         factory.reconnect = True
         context_factory = ssl.ClientContextFactory()
 
         self._conns[path] = connectWS(factory, context_factory)
         return path
 
-    def start_depth_socket(self, symbol, callback, depth=None):
+    def start_depth_socket(self, symbol, callback, depth=None, records=False):
         """Start a websocket for symbol market depth returning either a diff or a partial book
 
         https://github.com/binance-exchange/binance-official-api-docs/blob/master/web-socket-streams.md#partial-book-depth-streams
@@ -129,6 +141,8 @@ class BinanceSocketManager(threading.Thread):
         :type callback: function
         :param depth: optional Number of depth entries to return, default None. If passed returns a partial book instead of a diff
         :type depth: str
+        :param records: optional - Call callback with :class:`binance.records.DepthUpdate` records instead of messages
+        :type records: bool
 
         :returns: connection key string if successful, False otherwise
 
@@ -185,9 +199,11 @@ class BinanceSocketManager(threading.Thread):
         socket_name = symbol.lower() + '@depth'
         if depth and depth != '1':
             socket_name = '{}{}'.format(socket_name, depth)
+        if records:
+            callback = record_callback(DepthUpdate, callback)
         return self._start_socket(socket_name, callback)
 
-    def start_kline_socket(self, symbol, callback, interval=Client.KLINE_INTERVAL_1MINUTE):
+    def start_kline_socket(self, symbol, callback, interval=Client.KLINE_INTERVAL_1MINUTE, records=False):
         """Start a websocket for symbol kline data
 
         https://github.com/binance-exchange/binance-official-api-docs/blob/master/web-socket-streams.md#klinecandlestick-streams
@@ -198,6 +214,8 @@ class BinanceSocketManager(threading.Thread):
         :type callback: function
         :param interval: Kline interval, default KLINE_INTERVAL_1MINUTE
         :type interval: str
+        :param records: optional - Call callback with :class:`binance.records.Kline` records instead of messages
+        :type records: bool
 
         :returns: connection key string if successful, False otherwise
 
@@ -231,6 +249,8 @@ class BinanceSocketManager(threading.Thread):
             }
         """
         socket_name = '{}@kline_{}'.format(symbol.lower(), interval)
+        if records:
+            callback = record_callback(Kline, callback)
         return self._start_socket(socket_name, callback)
 
     def start_miniticker_socket(self, callback, update_time=1000):
@@ -267,7 +287,7 @@ class BinanceSocketManager(threading.Thread):
 
         return self._start_socket('!miniTicker@arr@{}ms'.format(update_time), callback)
 
-    def start_trade_socket(self, symbol, callback):
+    def start_trade_socket(self, symbol, callback, records=False):
         """Start a websocket for symbol trade data
 
         https://github.com/binance-exchange/binance-official-api-docs/blob/master/web-socket-streams.md#trade-streams
@@ -276,6 +296,8 @@ class BinanceSocketManager(threading.Thread):
         :type symbol: str
         :param callback: callback function to handle messages
         :type callback: function
+        :param records: optional - Call callback with :class:`binance.records.Trade` records instead of messages
+        :type records: bool
 
         :returns: connection key string if successful, False otherwise
 
@@ -298,9 +320,11 @@ class BinanceSocketManager(threading.Thread):
             }
 
         """
+        if records:
+            callback = record_callback(Trade, callback)
         return self._start_socket(symbol.lower() + '@trade', callback)
 
-    def start_aggtrade_socket(self, symbol, callback):
+    def start_aggtrade_socket(self, symbol, callback, records=False):
         """Start a websocket for symbol trade data
 
         https://github.com/binance-exchange/binance-official-api-docs/blob/master/web-socket-streams.md#aggregate-trade-streams
@@ -309,6 +333,8 @@ class BinanceSocketManager(threading.Thread):
         :type symbol: str
         :param callback: callback function to handle messages
         :type callback: function
+        :param records: optional - Call callback with :class:`binance.records.AggTrade` records instead of messages
+        :type records: bool
 
         :returns: connection key string if successful, False otherwise
 
@@ -331,6 +357,8 @@ class BinanceSocketManager(threading.Thread):
             }
 
         """
+        if records:
+            callback = record_callback(AggTrade, callback)
         return self._start_socket(symbol.lower() + '@aggTrade', callback)
 
     def start_symbol_ticker_socket(self, symbol, callback):
@@ -484,7 +512,7 @@ class BinanceSocketManager(threading.Thread):
 
         return self._start_futures_socket(symbol.lower() + '@bookTicker', callback)
 
-    def start_symbol_book_ticker_socket(self, symbol, callback):
+    def start_symbol_book_ticker_socket(self, symbol, callback, records=False):
         """Start a websocket for the best bid or ask's price or quantity for a specified symbol.
 
         https://github.com/binance-exchange/binance-official-api-docs/blob/master/web-socket-streams.md#individual-symbol-book-ticker-streams
@@ -493,6 +521,8 @@ class BinanceSocketManager(threading.Thread):
         :type symbol: str
         :param callback: callback function to handle messages
         :type callback: function
+        :param records: optional - Call callback with :class:`binance.records.BookTicker` records instead of messages
+        :type records: bool
 
         :returns: connection key string if successful, False otherwise
 
@@ -510,15 +540,19 @@ class BinanceSocketManager(threading.Thread):
             }
 
         """
+        if records:
+            callback = record_callback(BookTicker, callback)
         return self._start_socket(symbol.lower() + '@bookTicker', callback)
 
-    def start_book_ticker_socket(self, callback):
+    def start_book_ticker_socket(self, callback, records=False):
         """Start a websocket for the best bid or ask's price or quantity for all symbols.
 
         https://github.com/binance-exchange/binance-official-api-docs/blob/master/web-socket-streams.md#all-book-tickers-stream
 
         :param callback: callback function to handle messages
         :type callback: function
+        :param records: optional - Call callback with :class:`binance.records.BookTicker` records instead of messages
+        :type records: bool
 
         :returns: connection key string if successful, False otherwise
 
@@ -531,6 +565,8 @@ class BinanceSocketManager(threading.Thread):
             }
 
         """
+        if records:
+            callback = record_callback(BookTicker, callback)
         return self._start_socket('!bookTicker', callback)
 
     def start_multiplex_socket(self, streams, callback):
@@ -0,0 +1,56 @@
+"""Measure the CPU cost of preparing a signed order request
+
+Compares keying a new HMAC for every signature with copying the pre-keyed HMAC the client
+keeps, and times the full request preparation for a limit order. No requests are sent.
+
+    python examples/benchmark_signing.py
+
+"""
+import hashlib
+import hmac
+import timeit
+
+from binance.client import Client
+
+NUMBER = 100000
+
+ORDER_PARAMS = {
+    'symbol': 'BNBBTC',
+    'side': Client.SIDE_BUY,
+    'type': Client.ORDER_TYPE_LIMIT,
+    'timeInForce': Client.TIME_IN_FORCE_GTC,
+    'quantity': '100',
+    'price': '0.00001',
+    'newClientOrderId': 'my_order_id_1',
+}
+
+
+class BenchmarkClient(Client):
+
+    def ping(self):
+        # skip the connectivity check, nothing is sent
+        return {}
+
+
+def report(name, seconds):
+    print('{:<32} {:8.2f} us/order'.format(name, seconds / NUMBER * 1e6))
+
+
+def main():
+    client = BenchmarkClient('api_key', 'x' * 64)
+    query_string = '&'.join('%s=%s' % (key, value) for key, value in sorted(ORDER_PARAMS.items()))
+    secret = client.API_SECRET
+
+    report('hmac.new per signature', timeit.timeit(
+        lambda: hmac.new(secret.encode('utf-8'), query_string.encode('utf-8'), hashlib.sha256).hexdigest(),
+        number=NUMBER))
+    report('pre-keyed hmac copy', timeit.timeit(
+        lambda: client._sign(query_string),
+        number=NUMBER))
+    report('signed request kwargs', timeit.timeit(
+        lambda: client._get_request_kwargs('post', True, data=dict(ORDER_PARAMS)),
+        number=NUMBER))
+
+
+if __name__ == '__main__':
+    main()
@@ -10,7 +10,12 @@ setup(
     author='Sam McHardy',
     license='MIT',
     author_email='',
-    install_requires=['requests', 'six', 'Twisted', 'pyOpenSSL', 'autobahn', 'service-identity', 'dateparser', 'urllib3', 'certifi', 'cryptography', ],
+    install_requires=['requests', 'six', 'Twisted', 'pyOpenSSL', 'autobahn', 'service-identity', 'dateparser', 'urllib3', 'certifi', 'cryptography',
+                      'futures; python_version < "3.2"', ],
+    extras_require={
+        'async': ['aiohttp'],
+        'numpy': ['numpy'],
+    },
     keywords='binance exchange rest api bitcoin ethereum btc eth neo',
     classifiers=[
         'Intended Audience :: Developers',
@@ -0,0 +1,26 @@
+# coding=utf-8
+
+from binance.client import Client
+import pytest
+import re
+import sys
+
+collect_ignore = []
+if sys.version_info < (3, 6):
+    # async generators are a syntax error before 3.6, the module can't be imported to be skipped
+    collect_ignore.append('test_async_client.py')
+
+KLINES_URI = re.compile(r'https://api.binance.com/api/v1/klines')
+
+START_TS = 1519862400000
+MINUTE = 60 * 1000
+
+
+def kline(open_time):
+    return [open_time, "0.00099400", "0.00099810", "0.00099400", "0.00099810", "4806.04000000",
+            open_time + MINUTE - 1, "4.78553253", 154, "1785.14000000", "1.77837524", "0"]
+
+
+@pytest.fixture
+def client():
+    return Client('api_key', 'api_secret', ping=False)
@@ -1,8 +1,14 @@
 #!/usr/bin/env python
 # coding=utf-8
 
+import json
+import socket
+import time
+
 from binance.client import Client
-from binance.exceptions import BinanceAPIException, BinanceRequestException, BinanceWithdrawException
+from binance.exceptions import BinanceAPIException, BinanceRequestException, BinanceWithdrawException, \
+    BinanceOrderException, BinanceOrderMinAmountException, BinanceOrderMinPriceException, \
+    BinanceOrderMinTotalException, BinanceOrderUnknownSymbolException, BinanceOrderInactiveSymbolException
 import pytest
 import requests_mock
 
@@ -48,3 +54,199 @@ def test_withdraw_api_exception():
             json_obj = {"success": False, "msg": "Insufficient funds"}
             m.register_uri('POST', requests_mock.ANY, json=json_obj, status_code=200)
             client.withdraw(asset='BTC', address='BTCADDRESS', amount=100)
+
+
+def test_custom_json_loads():
+    """Test responses are decoded from bytes with a custom decoder"""
+    payloads = []
+
+    def json_loads(payload):
+        payloads.append(payload)
+        return json.loads(payload)
+
+    with requests_mock.mock() as m:
+        m.get('https://api.binance.com/api/v1/ping', json={})
+        m.get('https://api.binance.com/api/v1/time', json={"serverTime": 1499827319559})
+        json_client = Client('api_key', 'api_secret', json_loads=json_loads)
+        assert json_client.get_server_time() == {"serverTime": 1499827319559}
+
+    assert payloads[-1] == b'{"serverTime": 1499827319559}'
+
+
+def test_symbol_info_cached():
+    """Test symbol info is looked up from cached exchange info"""
+    exchange_info = {"rateLimits": [], "symbols": [{"symbol": "BNBBTC", "status": "TRADING"}]}
+
+    with requests_mock.mock() as m:
+        m.get('https://api.binance.com/api/v1/ping', json={})
+        m.get('https://api.binance.com/api/v1/exchangeInfo', json=exchange_info)
+        cached_client = Client('api_key', 'api_secret')
+
+        assert cached_client.get_symbol_info('bnbbtc') == {"symbol": "BNBBTC", "status": "TRADING"}
+        assert cached_client.get_symbol_info('ETHBTC') is None
+        assert m.call_count == 2
+
+        cached_client.invalidate_exchange_info()
+        cached_client.get_symbol_info('BNBBTC')
+        assert m.call_count == 3
+
+
+ORDER_EXCHANGE_INFO = {"rateLimits": [], "symbols": [
+    {"symbol": "BNBBTC", "status": "TRADING", "filters": [
+        {"filterType": "PRICE_FILTER", "minPrice": "0.00000010", "maxPrice": "100000.00000000",
+         "tickSize": "0.00000010"},
+        {"filterType": "LOT_SIZE", "minQty": "0.01000000", "maxQty": "100000.00000000", "stepSize": "0.01000000"},
+        {"filterType": "MIN_NOTIONAL", "minNotional": "0.00010000", "applyToMarket": True, "avgPriceMins": 5},
+    ]},
+    {"symbol": "ETHBTC", "status": "BREAK", "filters": []},
+]}
+
+
+@pytest.mark.parametrize('params, exception', [
+    ({'symbol': 'XXXBTC', 'quantity': 1}, BinanceOrderUnknownSymbolException),
+    ({'symbol': 'ETHBTC', 'quantity': 1}, BinanceOrderInactiveSymbolException),
+    ({'symbol': 'BNBBTC', 'quantity': 1, 'price': '0.00000001'}, BinanceOrderMinPriceException),
+    ({'symbol': 'BNBBTC', 'quantity': 1, 'price': '0.00100005'}, BinanceOrderException),
+    ({'symbol': 'BNBBTC', 'quantity': '1.005', 'price': '0.001'}, BinanceOrderMinAmountException),
+    ({'symbol': 'BNBBTC', 'quantity': '0.1', 'price': '0.0001'}, BinanceOrderMinTotalException),
+])
+def test_validate_order(params, exception):
+    """Test orders breaking the symbol filters are rejected before they are sent"""
+    with requests_mock.mock() as m:
+        m.get('https://api.binance.com/api/v1/ping', json={})
+        m.get('https://api.binance.com/api/v1/exchangeInfo', json=ORDER_EXCHANGE_INFO)
+        order_post = m.post('https://api.binance.com/api/v3/order', json={})
+        validating_client = Client('api_key', 'api_secret', validate_orders=True)
+
+        with pytest.raises(exception):
+            validating_client.order_limit_buy(**params)
+        assert not order_post.called
+
+        validating_client.order_limit_buy(symbol='BNBBTC', quantity='1.01', price='0.0010001')
+        assert order_post.called
+
+
+def test_signed_body_sent_as_signed():
+    """Test signed post requests send the body the signature was generated over"""
+    with requests_mock.mock() as m:
+        order_post = m.post('https://api.binance.com/api/v3/order', json={})
+        client.create_order(symbol='BNBBTC', side='BUY', type='MARKET', quantity=1, newClientOrderId=None)
+
+    request = order_post.last_request
+    body, signature = request.text.rsplit('&signature=', 1)
+    assert request.headers['Content-Type'] == Client.FORM_CONTENT_TYPE
+    assert body.startswith('quantity=1&side=BUY&symbol=BNBBTC&timestamp=')
+    assert signature == client._generate_signature(dict(p.split('=') for p in body.split('&')))
+
+
+def test_connection_pools():
+    """Test each host gets its own sized connection pool"""
+    with requests_mock.mock() as m:
+        m.get('https://api.binance.com/api/v1/ping', json={})
+        pooled_client = Client('api_key', 'api_secret', pool_maxsize=32, pool_block=True, tcp_keepalive=True)
+
+    adapters = dict((url, pooled_client.session.get_adapter(url)) for url in (
+        'https://api.binance.com/api/v3/order', 'https://api.binance.com/sapi/v1/margin/order',
+        'https://fapi.binance.com/fapi/v1/order'))
+    assert adapters['https://api.binance.com/api/v3/order'] is adapters['https://api.binance.com/sapi/v1/margin/order']
+    assert adapters['https://api.binance.com/api/v3/order'] is not adapters['https://fapi.binance.com/fapi/v1/order']
+
+    pool = adapters['https://api.binance.com/api/v3/order'].poolmanager.connection_from_url('https://api.binance.com/')
+    assert pool.pool.maxsize == 32
+    assert pool.block
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in pool.conn_kw['socket_options']
+    assert pooled_client.get_pool_stats()['api.binance.com'] == {
+        'requests': 0, 'connections': 0, 'hits': 0, 'misses': 0, 'idle': 0}
+
+    # a connection returned to the pool is idle, the rest of the pool is not open yet
+    pool._put_conn(pool._get_conn())
+    stats = pooled_client.get_pool_stats()['api.binance.com']
+    assert (stats['connections'], stats['idle']) == (1, 1)
+
+
+def test_lazy_client():
+    """Test the client connects on warmup instead of on construction"""
+    with requests_mock.mock() as m:
+        lazy_client = Client('api_key', 'api_secret', ping=False)
+        assert m.call_count == 0
+
+        spot_ping = m.get('https://api.binance.com/api/v1/ping', json={})
+        futures_ping = m.get('https://fapi.binance.com/fapi/v1/ping', json={})
+        lazy_client.warmup(connections=2)
+
+    assert spot_ping.call_count == 2
+    assert futures_ping.call_count == 2
+
+
+def test_map_requests():
+    """Test concurrent calls return results and exceptions in order"""
+    def order_response(request, context):
+        order_id = int(request.qs['orderid'][0])
+        if order_id == 3:
+            context.status_code = 400
+            return {"code": -2013, "msg": "Order does not exist."}
+        return {"orderId": order_id}
+
+    with requests_mock.mock() as m:
+        m.get('https://api.binance.com/api/v3/order', json=order_response)
+        results = client.map_requests([
+            ('get_order', {'symbol': 'BNBBTC', 'orderId': order_id}) for order_id in range(10)
+        ], max_workers=4)
+
+    assert [r['orderId'] for i, r in enumerate(results) if i != 3] == [0, 1, 2, 4, 5, 6, 7, 8, 9]
+    assert isinstance(results[3], BinanceAPIException)
+    assert results[3].code == -2013
+
+    with pytest.raises(BinanceAPIException):
+        with requests_mock.mock() as m:
+            m.get('https://api.binance.com/api/v3/order', json=order_response)
+            client.map_requests([(client.get_order, {'symbol': 'BNBBTC', 'orderId': 3})], return_exceptions=False)
+
+
+def test_map_requests_decodes_own_response():
+    """Test concurrent calls decode their own response, not the last response of the client"""
+    class SlowDecodeClient(Client):
+        def _handle_response(self, response):
+            # give other calls time to receive their response first
+            time.sleep(0.001)
+            return super(SlowDecodeClient, self)._handle_response(response)
+
+    def order_response(request, context):
+        return {"orderId": int(request.qs['orderid'][0])}
+
+    with requests_mock.mock() as m:
+        m.get('https://api.binance.com/api/v1/ping', json={})
+        m.get('https://api.binance.com/api/v3/order', json=order_response)
+        slow_client = SlowDecodeClient('api_key', 'api_secret')
+        results = slow_client.map_requests([
+            ('get_order', {'symbol': 'BNBBTC', 'orderId': order_id}) for order_id in range(50)
+        ], max_workers=8)
+
+    assert [r['orderId'] for r in results] == list(range(50))
+
+
+def test_request_hooks():
+    """Test request hooks receive the stats of each request"""
+    requests_stats = []
+
+    with requests_mock.mock() as m:
+        m.get('https://api.binance.com/api/v1/ping', json={})
+        hooked_client = Client('api_key', 'api_secret', request_hooks=[requests_stats.append])
+        m.get('https://api.binance.com/api/v1/depth', json={"lastUpdateId": 1, "bids": [], "asks": []})
+        m.get('https://api.binance.com/api/v3/order', status_code=400, json={"code": -2013, "msg": "Order does not exist."})
+        hooked_client.get_order_book(symbol='BNBBTC', limit=500)
+        with pytest.raises(BinanceAPIException):
+            hooked_client.get_order(symbol='BNBBTC', orderId=1)
+
+    ping_stats, depth_stats, order_stats = requests_stats
+    assert ping_stats['endpoint'] == 'ping'
+    assert depth_stats['endpoint'] == 'depth'
+    assert depth_stats['weight'] == 5
+    assert depth_stats['status_code'] == 200
+    assert depth_stats['bytes'] == len(b'{"lastUpdateId": 1, "bids": [], "asks": []}')
+    for key in ('prepare_time', 'ttfb', 'transfer_time', 'decode_time'):
+        assert 0 <= depth_stats[key] <= depth_stats['total_time']
+    assert order_stats['status_code'] == 400
+
+    hooked_client.remove_request_hook(requests_stats.append)
+    assert not hooked_client._request_hooks
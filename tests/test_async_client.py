@@ -0,0 +1,266 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+import asyncio
+import json
+import sys
+
+import pytest
+
+# the async client and these tests use async generators, collection is skipped by conftest.py before 3.6
+if sys.version_info < (3, 6):
+    pytest.skip('the async client requires Python 3.6+', allow_module_level=True)
+pytest.importorskip('aiohttp')
+
+from aiohttp import web  # noqa: E402
+from aiohttp.test_utils import TestServer  # noqa: E402
+from binance.async_client import AsyncClient  # noqa: E402
+from binance.exceptions import BinanceAPIException  # noqa: E402
+
+
+def run_with_server(handler, test):
+    """Serve handler on a local port and run test(client) against it"""
+
+    async def runner():
+        app = web.Application()
+        app.router.add_route('*', '/{tail:.*}', handler)
+        server = TestServer(app)
+        await server.start_server()
+        client = AsyncClient('api_key', 'api_secret')
+        client.API_URL = str(server.make_url('/api'))
+        client.FUTURES_URL = str(server.make_url('/fapi'))
+        try:
+            return await test(client)
+        finally:
+            await client.close_connection()
+            await server.close()
+
+    # asyncio.run is only available from 3.7
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        return loop.run_until_complete(runner())
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+
+
+def test_get_klines():
+    """Test endpoint methods are awaitable and params are sent in order"""
+    seen = {}
+
+    async def handler(request):
+        seen['path'] = request.path
+        seen['query'] = request.query_string
+        return web.json_response([[1519892340000, "0.00099400"]])
+
+    async def test(client):
+        return await client.get_klines(symbol='BNBBTC', interval=AsyncClient.KLINE_INTERVAL_1MINUTE, limit=1)
+
+    res = run_with_server(handler, test)
+
+    assert res == [[1519892340000, "0.00099400"]]
+    assert seen['path'] == '/api/v1/klines'
+    assert seen['query'] == 'interval=1m&limit=1&symbol=BNBBTC'
+
+
+def test_pool_stats():
+    """Test pool stats count requests over reused connections"""
+
+    async def handler(request):
+        return web.json_response({})
+
+    async def test(client):
+        assert client.get_pool_stats() == {}
+        await client.ping()
+        await client.ping()
+        return client.get_pool_stats()
+
+    stats = run_with_server(handler, test)
+
+    assert list(stats.values()) == [{'requests': 2, 'connections': 1, 'hits': 1, 'misses': 1, 'idle': 1}]
+
+
+def test_signed_request():
+    """Test signed requests share signing with the sync client"""
+    seen = {}
+
+    async def handler(request):
+        seen['api_key'] = request.headers.get('X-MBX-APIKEY')
+        seen['query'] = request.query_string
+        return web.json_response({'orderId': 1})
+
+    async def test(client):
+        return await client.get_order(symbol='BNBBTC', orderId=1)
+
+    run_with_server(handler, test)
+
+    params = dict(p.split('=') for p in seen['query'].split('&'))
+    signature = params.pop('signature')
+    client = AsyncClient('api_key', 'api_secret')
+    assert seen['api_key'] == 'api_key'
+    assert signature == client._generate_signature(params)
+
+
+def test_warmup():
+    """Test warmup pings the spot and futures hosts"""
+    paths = []
+
+    async def handler(request):
+        paths.append(request.path)
+        return web.json_response({})
+
+    async def test(client):
+        return await client.warmup(connections=2)
+
+    run_with_server(handler, test)
+
+    assert sorted(paths) == ['/api/v1/ping', '/api/v1/ping', '/fapi/v1/ping', '/fapi/v1/ping']
+
+
+def test_map_requests():
+    """Test concurrent calls return results and exceptions in order"""
+
+    async def handler(request):
+        if request.query['symbol'] == 'XXXBTC':
+            return web.json_response({"code": -1121, "msg": "Invalid symbol."}, status=400)
+        return web.json_response([[1519892340000, request.query['symbol']]])
+
+    async def test(client):
+        return await client.map_requests([
+            ('get_klines', {'symbol': symbol, 'interval': AsyncClient.KLINE_INTERVAL_1MINUTE})
+            for symbol in ('BNBBTC', 'XXXBTC', 'ETHBTC')
+        ], max_workers=2)
+
+    results = run_with_server(handler, test)
+
+    assert results[0] == [[1519892340000, 'BNBBTC']]
+    assert isinstance(results[1], BinanceAPIException)
+    assert results[2] == [[1519892340000, 'ETHBTC']]
+
+
+def test_request_hooks():
+    """Test request hooks receive the stats of each request"""
+    requests_stats = []
+
+    async def handler(request):
+        return web.json_response({"serverTime": 1499827319559})
+
+    async def test(client):
+        client.add_request_hook(requests_stats.append)
+        return await client.get_server_time()
+
+    run_with_server(handler, test)
+
+    stats, = requests_stats
+    assert stats['endpoint'] == 'time'
+    assert stats['status_code'] == 200
+    assert stats['bytes'] == len(b'{"serverTime": 1499827319559}')
+    assert stats['ttfb'] <= stats['total_time']
+
+
+def test_map_requests_with_hooks():
+    """Test concurrent calls with request hooks decode their own response"""
+    requests_stats = []
+
+    async def handler(request):
+        # send the body in parts so responses of concurrent calls overlap
+        body = json.dumps([[1519892340000, request.query['symbol']]] * 100).encode()
+        response = web.StreamResponse(headers={'Content-Type': 'application/json'})
+        await response.prepare(request)
+        for i in range(0, len(body), 1000):
+            await response.write(body[i:i + 1000])
+            await asyncio.sleep(0.001)
+        await response.write_eof()
+        return response
+
+    async def test(client):
+        client.add_request_hook(requests_stats.append)
+        return await client.map_requests([
+            ('get_klines', {'symbol': 'S{}'.format(i), 'interval': AsyncClient.KLINE_INTERVAL_1MINUTE})
+            for i in range(50)
+        ], max_workers=10)
+
+    results = run_with_server(handler, test)
+
+    assert [r[0][1] for r in results] == ['S{}'.format(i) for i in range(50)]
+    assert len(requests_stats) == 50
+
+
+def test_history_iterator():
+    """Test history iterators walk the pages asynchronously"""
+    trades = [{"id": i, "time": 1000 + i} for i in range(5)]
+
+    async def handler(request):
+        from_id, limit = int(request.query['fromId']), int(request.query['limit'])
+        return web.json_response([t for t in trades if t['id'] >= from_id][:limit])
+
+    async def test(client):
+        return [t async for t in client.my_trades_iter('BNBBTC', limit=2, prefetch=True)]
+
+    assert run_with_server(handler, test) == trades
+
+
+def test_aggregate_trades_sharded():
+    """Test sharded aggregate trades are fetched concurrently and returned in order"""
+    start_ts = 1519862400000
+    trades = [{"a": i, "p": "0.01633102", "q": "4.70443515", "T": start_ts + i * 100} for i in range(2500)]
+
+    async def handler(request):
+        params = request.query
+        limit = int(params.get('limit', '500'))
+        if 'fromId' in params:
+            return web.json_response([t for t in trades if t['a'] >= int(params['fromId'])][:limit])
+        if 'startTime' in params:
+            start, end = int(params['startTime']), int(params['endTime'])
+            return web.json_response([t for t in trades if start <= t['T'] <= end][:limit])
+        return web.json_response(trades[-limit:])
+
+    async def test(client):
+        return [t['a'] async for t in client.aggregate_trade_iter(
+            'BNBBTC', start_ts + 150, end_str=start_ts + 220000, max_workers=2)]
+
+    assert run_with_server(handler, test) == list(range(2, 2201))
+
+
+def test_api_exception():
+    """Test API response Exception"""
+
+    async def handler(request):
+        return web.json_response({"code": 1002, "msg": "Invalid API call"}, status=400)
+
+    async def test(client):
+        return await client.get_server_time()
+
+    with pytest.raises(BinanceAPIException) as e:
+        run_with_server(handler, test)
+    assert e.value.code == 1002
+    assert e.value.status_code == 400
+
+
+def test_historical_klines_columns():
+    """Test klines columns are fetched asynchronously"""
+    np = pytest.importorskip('numpy')
+    minute = 60 * 1000
+
+    def kline(open_time):
+        return [open_time, "0.00099400", "0.00099810", "0.00099400", "0.00099810", "4806.04000000",
+                open_time + minute - 1, "4.78553253", 154, "1785.14000000", "1.77837524", "0"]
+
+    async def handler(request):
+        start, limit = int(request.query['startTime']), int(request.query['limit'])
+        first = max(start, 1519862400000)
+        return web.json_response([kline(t) for t in range(first, 1519862400000 + 5 * minute, minute)][:limit])
+
+    async def test(client):
+        columns = await client.get_historical_klines_columns('BNBBTC', AsyncClient.KLINE_INTERVAL_1MINUTE,
+                                                             1519862400000, limit=2)
+        page = await client.get_klines_columns(symbol='BNBBTC', interval=AsyncClient.KLINE_INTERVAL_1MINUTE,
+                                               startTime=1519862400000, limit=3)
+        return columns, page
+
+    columns, page = run_with_server(handler, test)
+
+    assert list(columns['open_time']) == [1519862400000 + i * minute for i in range(5)]
+    assert columns['trades'].dtype == np.int32
+    assert len(page['close']) == 3
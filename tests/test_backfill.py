@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+from binance.backfill import KlinesBackfill
+from binance.client import Client
+from binance.exceptions import BinanceAPIException
+import json
+import pytest
+import re
+import requests_mock
+import time
+
+from .conftest import KLINES_URI, MINUTE, START_TS, kline
+
+
+def klines_response(request, context):
+    params = request.qs
+    if params['limit'] == ['1']:
+        return [kline(1500004800000)]
+    start, end = int(params['starttime'][0]), int(params['endtime'][0])
+    return [kline(ts) for ts in range(start, end + 1, MINUTE)]
+
+
+def test_pages(client):
+    """Test the range is split into pages of limit klines"""
+    backfill = KlinesBackfill(client, 'BNBBTC', Client.KLINE_INTERVAL_1MINUTE, START_TS,
+                              START_TS + 25 * MINUTE - 1, limit=10)
+
+    with requests_mock.mock() as m:
+        m.get(KLINES_URI, json=klines_response)
+        pages = backfill.get_pages()
+
+    assert pages == [
+        (START_TS, START_TS + 10 * MINUTE - 1),
+        (START_TS + 10 * MINUTE, START_TS + 20 * MINUTE - 1),
+        (START_TS + 20 * MINUTE, START_TS + 25 * MINUTE - 1),
+    ]
+
+
+def test_klines_in_order(client):
+    """Test concurrently fetched pages are returned in order"""
+    backfill = KlinesBackfill(client, 'BNBBTC', Client.KLINE_INTERVAL_1MINUTE, START_TS,
+                              START_TS + 100 * MINUTE - 1, limit=10, max_workers=4)
+
+    with requests_mock.mock() as m:
+        m.get(KLINES_URI, json=klines_response)
+        klines = backfill.get_klines()
+
+    assert [k[0] for k in klines] == list(range(START_TS, START_TS + 100 * MINUTE, MINUTE))
+
+
+def test_resume_from_checkpoint(client, tmpdir):
+    """Test an interrupted backfill resumes from the checkpoint file"""
+    checkpoint_file = str(tmpdir.join('checkpoint'))
+    backfill = KlinesBackfill(client, 'BNBBTC', Client.KLINE_INTERVAL_1MINUTE, START_TS,
+                              START_TS + 30 * MINUTE - 1, limit=10, max_workers=1,
+                              checkpoint_file=checkpoint_file)
+
+    def failing_response(request, context):
+        if int(request.qs['starttime'][0]) == START_TS + 20 * MINUTE:
+            context.status_code = 500
+            return {"code": -1000, "msg": "An unknown error occurred"}
+        return klines_response(request, context)
+
+    with requests_mock.mock() as m:
+        m.get(KLINES_URI, json=failing_response)
+        with pytest.raises(BinanceAPIException):
+            backfill.get_klines()
+
+    with requests_mock.mock() as m:
+        m.get(KLINES_URI, json=klines_response)
+        klines = backfill.get_klines()
+        # only the earliest timestamp and the missing page are requested
+        assert m.call_count == 2
+
+    assert [k[0] for k in klines] == list(range(START_TS, START_TS + 30 * MINUTE, MINUTE))
+
+
+def test_checkpoint_open_page(client, tmpdir):
+    """Test the page which is still open is not recorded in the checkpoint file"""
+    checkpoint_file = str(tmpdir.join('checkpoint'))
+    now = int(time.time() * 1000)
+    start_ts = now - now % MINUTE - 15 * MINUTE
+    backfill = KlinesBackfill(client, 'BNBBTC', Client.KLINE_INTERVAL_1MINUTE, start_ts, limit=10,
+                              checkpoint_file=checkpoint_file)
+
+    with requests_mock.mock() as m:
+        m.get(KLINES_URI, json=klines_response)
+        backfill.get_klines()
+
+    with open(checkpoint_file) as f:
+        pages = [json.loads(line) for line in f]
+    assert [(p['symbol'], p['interval'], p['start']) for p in pages] == [('BNBBTC', '1m', start_ts)]
+
+    other = KlinesBackfill(client, 'ETHBTC', Client.KLINE_INTERVAL_1MINUTE, start_ts, limit=10,
+                           checkpoint_file=checkpoint_file)
+    with pytest.raises(ValueError):
+        other.get_klines()
+
+
+AGG_TRADES_URI = re.compile(r'https://api.binance.com/api/v1/aggTrades')
+AGG_TRADES = [{"a": i, "p": "0.01633102", "q": "4.70443515", "T": START_TS + i * 100} for i in range(3500)]
+
+
+def agg_trades_response(request, context):
+    params = request.qs
+    limit = int(params.get('limit', ['500'])[0])
+    if 'fromid' in params:
+        trades = [t for t in AGG_TRADES if t['a'] >= int(params['fromid'][0])]
+    elif 'starttime' in params:
+        start, end = int(params['starttime'][0]), int(params['endtime'][0])
+        trades = [t for t in AGG_TRADES if start <= t['T'] <= end]
+        # a time range returns the first trades in the range
+        return trades[:limit]
+    else:
+        return AGG_TRADES[-limit:]
+    return trades[:limit]
+
+
+@pytest.mark.parametrize('start_str, end_str, expected', [
+    (START_TS + 150, START_TS + 300000, range(2, 3001)),
+    (START_TS - 2 * 60 * 60 * 1000, None, range(0, 3500)),
+])
+def test_aggregate_trades_sharded(client, start_str, end_str, expected):
+    """Test sharded aggregate trades are returned in order without duplicates"""
+    with requests_mock.mock() as m:
+        m.get(AGG_TRADES_URI, json=agg_trades_response)
+        trades = list(client.aggregate_trade_iter('BNBBTC', start_str, end_str=end_str, max_workers=3))
+
+    assert [t['a'] for t in trades] == list(expected)
+
+
+def test_aggregate_trades_sharded_last_id(client):
+    """Test sharded aggregate trades start after last_id"""
+    with requests_mock.mock() as m:
+        m.get(AGG_TRADES_URI, json=agg_trades_response)
+        trades = list(client.aggregate_trade_iter('BNBBTC', last_id=3200, max_workers=2))
+
+    assert [t['a'] for t in trades] == list(range(3201, 3500))
@@ -1,5 +1,11 @@
-from binance.depthcache import DepthCache
+from binance.client import Client
+from binance.depthcache import DepthCache, DepthCacheManager, MultiplexDepthCacheManager
+from binance.exceptions import BinanceRequestException
 import pytest
+import re
+import requests_mock
+import threading
+import time
 
 TEST_SYMBOL = "BNBBTC"
 
@@ -40,3 +46,406 @@ def test_add_asks(fresh_cache):
 
     # Lowest ask price should be first (ascending order)
     assert asks == sorted(asks)
+
+
+def test_remove_levels(fresh_cache):
+    """Verify a zero quantity removes the price level"""
+    fresh_cache.add_bid(["0.00100000", "10.00000000"])
+    fresh_cache.add_bid(["0.00200000", "20.00000000"])
+    fresh_cache.add_ask(["0.00300000", "30.00000000"])
+
+    fresh_cache.add_bid(["0.00200000", "0.00000000"])
+    fresh_cache.add_ask(["0.00300000", "0.00000000"])
+    # removing a level that is not in the cache is ignored
+    fresh_cache.add_ask(["0.00400000", "0.00000000"])
+
+    assert fresh_cache.get_bids() == [[0.001, 10.0]]
+    assert fresh_cache.get_asks() == []
+
+
+def test_get_limit(fresh_cache):
+    """Verify the best price levels are returned when passing a limit"""
+    for price in range(1, 11):
+        fresh_cache.add_bid([str(price), "1.00000000"])
+        fresh_cache.add_ask([str(price + 10), "1.00000000"])
+
+    # updating an existing level keeps its position
+    fresh_cache.add_bid(["10", "5.00000000"])
+
+    assert fresh_cache.get_bids(3) == [[10.0, 5.0], [9.0, 1.0], [8.0, 1.0]]
+    assert fresh_cache.get_asks(3) == [[11.0, 1.0], [12.0, 1.0], [13.0, 1.0]]
+    assert len(fresh_cache.get_bids()) == 10
+
+
+def test_top_of_book(fresh_cache):
+    """Verify the best bid and ask follow updates"""
+    assert fresh_cache.best_bid() is None
+    assert fresh_cache.spread() is None
+    assert fresh_cache.mid_price() is None
+
+    fresh_cache.add_bid(["0.00100000", "10.00000000"])
+    fresh_cache.add_bid(["0.00200000", "20.00000000"])
+    fresh_cache.add_ask(["0.00400000", "40.00000000"])
+    fresh_cache.add_ask(["0.00300000", "30.00000000"])
+
+    assert fresh_cache.best_bid() == [0.002, 20.0]
+    assert fresh_cache.best_ask() == [0.003, 30.0]
+    assert fresh_cache.spread() == pytest.approx(0.001)
+    assert fresh_cache.mid_price() == pytest.approx(0.0025)
+
+    fresh_cache.add_bid(["0.00200000", "0.00000000"])
+
+    assert fresh_cache.best_bid() == [0.001, 10.0]
+
+
+def test_tick_size_levels():
+    """Verify prices formatted differently are one level when keyed by ticks"""
+    depth_cache = DepthCache(TEST_SYMBOL, tick_size="0.00000100")
+    depth_cache.add_bid(["0.00194600", "10.00000000"])
+    depth_cache.add_bid(["0.001946", "12.0"])
+    depth_cache.add_bid(["0.00194500", "5.00000000"])
+    depth_cache.add_ask(["0.0019470", "3.0"])
+    # a zero quantity in any format removes the level
+    depth_cache.add_bid(["0.00194500", "0.000"])
+    depth_cache.add_ask(["0.00194700", "0"])
+
+    assert depth_cache.get_bids() == [[0.001946, 12.0]]
+    assert depth_cache.get_asks() == []
+    assert depth_cache.best_bid() == [0.001946, 12.0]
+    assert isinstance(depth_cache._bids._prices[0], int)
+
+
+def test_tick_size_not_power_of_ten():
+    """Verify prices are exact for tick sizes which are not a power of ten"""
+    depth_cache = DepthCache(TEST_SYMBOL, tick_size="0.05")
+    for price in ["1.35", "1.40", "1.3500", "12.05"]:
+        depth_cache.add_ask([price, "1"])
+
+    assert depth_cache.get_asks() == [[1.35, 1.0], [1.4, 1.0], [12.05, 1.0]]
+
+
+@pytest.mark.parametrize('tick_size', [None, "0.00000100"])
+def test_max_depth(tick_size):
+    """Verify levels beyond the best max_depth levels are dropped"""
+    depth_cache = DepthCache(TEST_SYMBOL, tick_size=tick_size, max_depth=3)
+    for price in ["0.00000500", "0.00000100", "0.00000300", "0.00000400", "0.00000200"]:
+        depth_cache.add_bid([price, "1.0"])
+        depth_cache.add_ask([price, "1.0"])
+
+    assert [price for price, _ in depth_cache.get_bids()] == [0.000005, 0.000004, 0.000003]
+    assert [price for price, _ in depth_cache.get_asks()] == [0.000001, 0.000002, 0.000003]
+
+    # levels worse than every kept level are ignored, better levels push out the worst
+    depth_cache.add_bid(["0.00000100", "1.0"])
+    depth_cache.add_bid(["0.00000600", "2.0"])
+    depth_cache.add_ask(["0.00000400", "1.0"])
+
+    assert depth_cache.get_bids() == [[0.000006, 2.0], [0.000005, 1.0], [0.000004, 1.0]]
+    assert len(depth_cache.get_asks()) == 3
+
+
+def test_max_depth_no_gaps():
+    """Verify levels beyond dropped levels are ignored until the book is cleared"""
+    depth_cache = DepthCache(TEST_SYMBOL, max_depth=3)
+    for price in ["10", "9", "8", "7", "6"]:
+        depth_cache.add_bid([price, "1"])
+
+    depth_cache.add_bid(["10", "0"])
+    depth_cache.add_bid(["9", "0"])
+    # 7 and 6 were dropped, so 5 can't be placed next to 8
+    depth_cache.add_bid(["5", "2"])
+    depth_cache.add_bid(["8.5", "3"])
+
+    assert depth_cache.get_bids() == [[8.5, 3.0], [8.0, 1.0]]
+    assert depth_cache.is_truncated()
+
+    depth_cache.clear()
+    depth_cache.add_bid(["5", "2"])
+    assert depth_cache.get_bids() == [[5.0, 2.0]]
+
+
+class FakeSocketManager(object):
+    """Socket manager sending a depth event for every stream every few milliseconds"""
+
+    def __init__(self):
+        self.sockets = {}
+        self.update_id = 95
+        # streams which never send an event
+        self.silent = set()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._send_events)
+        self._thread.daemon = True
+
+    def start_multiplex_socket(self, streams, callback):
+        conn_key = '/'.join(streams)
+        self.sockets[conn_key] = (streams, callback)
+        return conn_key
+
+    def start_depth_socket(self, symbol, callback):
+        stream = symbol.lower() + '@depth'
+
+        def stream_callback(msg):
+            callback(msg['data'])
+
+        self.sockets[stream] = ([stream], stream_callback)
+        return stream
+
+    def is_alive(self):
+        return self._thread.is_alive()
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def order_book(self, request, context):
+        """Order book snapshot at the last update id sent"""
+        return dict(ORDER_BOOK, lastUpdateId=self.update_id)
+
+    def _send_events(self):
+        while not self._stop.wait(0.01):
+            self.update_id += 1
+            for streams, callback in list(self.sockets.values()):
+                for stream in streams:
+                    if stream in self.silent:
+                        continue
+                    callback({'stream': stream, 'data': {
+                        'e': 'depthUpdate', 'E': 123456789, 's': stream.split('@')[0].upper(),
+                        'U': self.update_id, 'u': self.update_id,
+                        'b': [["0.00100000", "1.00000000"]], 'a': []
+                    }})
+
+
+ORDER_BOOK = {
+    'lastUpdateId': 100,
+    'bids': [["0.00100000", "431.00000000", []]],
+    'asks': [["0.00200000", "12.00000000", []]],
+}
+
+
+def test_depth_cache_manager_non_blocking():
+    """Verify the depth cache manager can initialise in the background"""
+    bm = FakeSocketManager()
+
+    with requests_mock.mock() as m:
+        m.get('https://api.binance.com/api/v1/ping', json={})
+        m.get(re.compile('https://api.binance.com/api/v1/depth'), json=bm.order_book)
+        client = Client('api_key', 'api_secret')
+        try:
+            dcm = DepthCacheManager(client, 'BNBBTC', bm=bm, blocking=False)
+            depth_cache = dcm.ready.result(timeout=5)
+        finally:
+            bm.stop()
+
+    assert depth_cache is dcm.get_depth_cache()
+    assert depth_cache.best_ask() == [0.002, 12.0]
+
+
+def test_multiplex_depth_cache_manager():
+    """Verify depth caches for many symbols are maintained over one combined stream"""
+    bm = FakeSocketManager()
+
+    with requests_mock.mock() as m:
+        m.get('https://api.binance.com/api/v1/ping', json={})
+        m.get(re.compile('https://api.binance.com/api/v1/depth'), json=bm.order_book)
+        client = Client('api_key', 'api_secret')
+        try:
+            dcm = MultiplexDepthCacheManager(client, ['BNBBTC', 'ETHBTC'], bm=bm)
+            futures = dcm.add_symbols(['LTCBTC'], blocking=False)
+            assert dcm.wait_ready(timeout=5)
+        finally:
+            bm.stop()
+
+    assert list(bm.sockets) == ['bnbbtc@depth/ethbtc@depth', 'ltcbtc@depth']
+    assert sorted(dcm.get_symbols()) == ['BNBBTC', 'ETHBTC', 'LTCBTC']
+    assert futures['LTCBTC'].result() is dcm.get_depth_cache('LTCBTC')
+    assert dcm.get_depth_cache('NEOBTC') is None
+    for symbol in ['BNBBTC', 'ETHBTC', 'LTCBTC']:
+        depth_cache = dcm.get_depth_cache(symbol)
+        assert depth_cache.symbol == symbol
+        assert depth_cache.best_ask() == [0.002, 12.0]
+
+
+def test_multiplex_depth_message_timeout():
+    """Verify a symbol without depth events doesn't hold a worker forever and can be added again"""
+    bm = FakeSocketManager()
+    bm.silent.add('ethbtc@depth')
+
+    with requests_mock.mock() as m:
+        m.get('https://api.binance.com/api/v1/ping', json={})
+        m.get(re.compile('https://api.binance.com/api/v1/depth'), json=bm.order_book)
+        client = Client('api_key', 'api_secret')
+        try:
+            dcm = MultiplexDepthCacheManager(client, [], bm=bm, max_workers=1, depth_message_timeout=0.2)
+            futures = dcm.add_symbols(['ETHBTC', 'BNBBTC'], blocking=False)
+            with pytest.raises(BinanceRequestException):
+                futures['ETHBTC'].result(timeout=5)
+            assert futures['BNBBTC'].result(timeout=5).best_ask() == [0.002, 12.0]
+            with pytest.raises(BinanceRequestException):
+                dcm.wait_ready(timeout=5)
+            assert dcm.get_depth_cache('ETHBTC') is None
+            assert dcm.get_symbols() == ['BNBBTC']
+
+            # a failed symbol is started again on its existing stream
+            bm.silent.clear()
+            dcm.add_symbols(['ETHBTC', 'BNBBTC'])
+            assert dcm.wait_ready(timeout=5)
+        finally:
+            bm.stop()
+
+    assert list(bm.sockets) == ['ethbtc@depth/bnbbtc@depth']
+    assert sorted(dcm.get_symbols()) == ['BNBBTC', 'ETHBTC']
+    assert dcm.get_depth_cache('ETHBTC').best_ask() == [0.002, 12.0]
+
+
+class ManualSocketManager(object):
+    """Socket manager sending depth events when the test calls send"""
+
+    def __init__(self):
+        self.callback = None
+
+    def start_depth_socket(self, symbol, callback):
+        self.callback = callback
+        return symbol.lower() + '@depth'
+
+    def is_alive(self):
+        return True
+
+    def send(self, update_id, bids):
+        self.callback({'e': 'depthUpdate', 'E': 123456789, 's': 'BNBBTC', 'U': update_id, 'u': update_id,
+                       'b': bids, 'a': []})
+
+
+class ManualMultiplexSocketManager(ManualSocketManager):
+    """Socket manager sending combined stream depth events when the test calls send"""
+
+    def start_multiplex_socket(self, streams, callback):
+        self.callback = callback
+        return '/'.join(streams)
+
+    def send(self, update_id, bids):
+        self.callback({'stream': 'bnbbtc@depth', 'data': {
+            'e': 'depthUpdate', 'E': 123456789, 's': 'BNBBTC', 'U': update_id, 'u': update_id, 'b': bids, 'a': []
+        }})
+
+
+def test_multiplex_resync_in_executor():
+    """Verify a gap is resynced off the shared socket thread with the events buffered meanwhile"""
+    bm = ManualMultiplexSocketManager()
+    release = threading.Event()
+    fetch_threads = []
+
+    def order_book(request, context):
+        fetch_threads.append(threading.current_thread())
+        if len(fetch_threads) == 1:
+            return {'lastUpdateId': 100, 'bids': [["1", "1"]], 'asks': []}
+        release.wait(5)
+        return {'lastUpdateId': 110, 'bids': [["2", "1"]], 'asks': []}
+
+    with requests_mock.mock() as m:
+        m.get('https://api.binance.com/api/v1/ping', json={})
+        m.get(re.compile('https://api.binance.com/api/v1/depth'), json=order_book)
+        client = Client('api_key', 'api_secret')
+        dcm = MultiplexDepthCacheManager(client, [], bm=bm)
+        future = dcm.add_symbols(['BNBBTC'], blocking=False)['BNBBTC']
+        while not future.done():
+            bm.send(100, [])
+            time.sleep(0.01)
+        depth_cache = future.result()
+        bm.send(101, [["1.5", "1"]])
+        assert depth_cache.get_bids() == [[1.5, 1.0], [1.0, 1.0]]
+
+        # the gap starts a snapshot in the executor, the socket thread goes on buffering events
+        bm.send(105, [["1.6", "1"]])
+        bm.send(111, [["3", "1"]])
+        assert depth_cache.get_bids() == [[1.5, 1.0], [1.0, 1.0]]
+        release.set()
+        for _ in range(500):
+            if depth_cache.best_bid() == [3.0, 1.0]:
+                break
+            time.sleep(0.01)
+
+    assert depth_cache.get_bids() == [[3.0, 1.0], [2.0, 1.0]]
+    assert len(fetch_threads) == 2
+    assert threading.current_thread() not in fetch_threads
+
+
+def test_depth_cache_manager_refills_max_depth():
+    """Verify a new snapshot is fetched when the price moves through the kept levels"""
+    bm = ManualSocketManager()
+    asks = [["11", "1"]]
+
+    with requests_mock.mock() as m:
+        m.get('https://api.binance.com/api/v1/ping', json={})
+        depth = m.get(re.compile('https://api.binance.com/api/v1/depth'), [
+            {'json': {'lastUpdateId': 100, 'bids': [[str(p), "1"] for p in range(10, 4, -1)], 'asks': asks}},
+            {'json': {'lastUpdateId': 110, 'bids': [[str(p), "1"] for p in range(7, 1, -1)], 'asks': asks}},
+        ])
+        client = Client('api_key', 'api_secret')
+        dcm = DepthCacheManager(client, 'BNBBTC', bm=bm, max_depth=3, blocking=False)
+        while bm.callback is None:
+            time.sleep(0.01)
+        bm.send(100, [])
+        depth_cache = dcm.ready.result(timeout=5)
+        assert [price for price, _ in depth_cache.get_bids()] == [10.0, 9.0, 8.0]
+
+        # the best bids are taken, 7 and below were dropped so the side is refilled from a snapshot
+        bm.send(101, [["10", "0"], ["9", "0"], ["8", "0"]])
+        assert depth.call_count == 2
+
+    assert [price for price, _ in depth_cache.get_bids()] == [7.0, 6.0, 5.0]
+    assert depth_cache.best_ask() == [11.0, 1.0]
+    assert not depth_cache.is_truncated()
+
+
+def test_depth_cache_manager_tick_size():
+    """Verify the tick size of the symbol is looked up in the exchange info"""
+    bm = FakeSocketManager()
+    exchange_info = {'symbols': [{'symbol': 'BNBBTC', 'status': 'TRADING', 'filters': [
+        {'filterType': 'PRICE_FILTER', 'minPrice': '0.00000100', 'maxPrice': '100000.00000000',
+         'tickSize': '0.00000100'}
+    ]}]}
+
+    with requests_mock.mock() as m:
+        m.get('https://api.binance.com/api/v1/ping', json={})
+        m.get('https://api.binance.com/api/v1/exchangeInfo', json=exchange_info)
+        m.get(re.compile('https://api.binance.com/api/v1/depth'), json=bm.order_book)
+        client = Client('api_key', 'api_secret')
+        try:
+            dcm = DepthCacheManager(client, 'BNBBTC', bm=bm, tick_size=True)
+        finally:
+            bm.stop()
+
+    depth_cache = dcm.get_depth_cache()
+    assert depth_cache.tick_size == '0.00000100'
+    assert depth_cache.best_ask() == [0.002, 12.0]
+
+
+def test_depth_cache_manager_tick_size_non_blocking():
+    """Verify the tick size is looked up in the background without blocking"""
+    bm = FakeSocketManager()
+    release = threading.Event()
+
+    def exchange_info(request, context):
+        release.wait(5)
+        return {'symbols': [{'symbol': 'BNBBTC', 'status': 'TRADING', 'filters': [
+            {'filterType': 'PRICE_FILTER', 'tickSize': '0.00000100'}
+        ]}]}
+
+    with requests_mock.mock() as m:
+        m.get('https://api.binance.com/api/v1/ping', json={})
+        m.get('https://api.binance.com/api/v1/exchangeInfo', json=exchange_info)
+        m.get(re.compile('https://api.binance.com/api/v1/depth'), json=bm.order_book)
+        client = Client('api_key', 'api_secret')
+        try:
+            dcm = DepthCacheManager(client, 'BNBBTC', bm=bm, tick_size=True, blocking=False)
+            assert not dcm.ready.done()
+            release.set()
+            depth_cache = dcm.ready.result(timeout=5)
+        finally:
+            bm.stop()
+
+    assert depth_cache.tick_size == '0.00000100'
+    assert depth_cache.best_ask() == [0.002, 12.0]
@@ -2,7 +2,9 @@
 # coding=utf-8
 
 from binance.client import Client
+import numpy as np
 import pytest
+import re
 import requests_mock
 
 
@@ -245,3 +247,30 @@ def test_historical_kline_generator_empty_response():
 
         with pytest.raises(StopIteration):
             next(klines)
+
+
+def test_historical_klines_columns():
+    """Test historical klines are returned as typed columns"""
+
+    def klines_response(request, context):
+        start = int(request.qs['starttime'][0])
+        if request.qs['limit'] == ['1']:
+            return [[1500004800000, "0.00005000", "0.00005300", "0.00001000", "0.00004790", "663152.00000000", 1500004859999, "30.55108144", 43, "559224.00000000", "25.65468144", "0"]]
+        return [[ts, "0.00099400", "0.00099810", "0.00099300", "0.00099810", "4806.04000000", ts + 59999, "4.78553253", 154, "1785.14000000", "1.77837524", "0"]
+                for ts in range(start, min(start + 3 * 60000, 1519862400000 + 7 * 60000), 60000)]
+
+    with requests_mock.mock() as m:
+        m.get(re.compile(r'https://api.binance.com/api/v1/klines'), json=klines_response)
+        columns = client.get_historical_klines_columns(
+            symbol="BNBBTC",
+            interval=Client.KLINE_INTERVAL_1MINUTE,
+            start_str=1519862400000,
+            limit=3
+        )
+
+    assert list(columns['open_time']) == list(range(1519862400000, 1519862400000 + 7 * 60000, 60000))
+    assert columns['open_time'].dtype == np.int64
+    assert columns['low'].dtype == np.float64
+    assert columns['low'][0] == 0.000993
+    assert columns['trades'].dtype == np.int32
+    assert columns['trades'].sum() == 7 * 154
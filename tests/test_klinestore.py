@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+from binance.client import Client
+from binance.klinestore import KlineStore
+import numpy as np
+import requests_mock
+
+from .conftest import KLINES_URI, MINUTE, START_TS, kline
+
+
+def make_klines_response(count):
+    """Klines from START_TS, the last one still open"""
+    def klines_response(request, context):
+        start, limit = int(request.qs['starttime'][0]), int(request.qs['limit'][0])
+        first = max(0, (start - START_TS + MINUTE - 1) // MINUTE)
+        klines = [kline(START_TS + i * MINUTE) for i in range(first, min(count, first + limit))]
+        if klines and first + len(klines) == count:
+            # the current kline closes in the future
+            klines[-1][6] = 2 ** 62
+        return klines
+    return klines_response
+
+
+def test_incremental_sync(client, tmpdir):
+    """Test only closed klines after the last stored kline are fetched"""
+    store = KlineStore(str(tmpdir))
+
+    with requests_mock.mock() as m:
+        klines = m.get(KLINES_URI, json=make_klines_response(8))
+        assert store.sync(client, 'BNBBTC', Client.KLINE_INTERVAL_1MINUTE, START_TS, limit=3) == 7
+        assert klines.call_count == 3
+
+    with requests_mock.mock() as m:
+        klines = m.get(KLINES_URI, json=make_klines_response(12))
+        assert store.sync(client, 'BNBBTC', Client.KLINE_INTERVAL_1MINUTE, limit=3) == 4
+        assert klines.request_history[0].qs['starttime'] == [str(START_TS + 6 * MINUTE + 1)]
+
+    records = store.read('BNBBTC', Client.KLINE_INTERVAL_1MINUTE)
+    assert isinstance(records, np.memmap)
+    assert list(records['open_time']) == [START_TS + i * MINUTE for i in range(11)]
+    assert records['close'][0] == 0.0009981
+    assert records['trades'].dtype == np.int32
+    assert store.get_last_open_time('BNBBTC', Client.KLINE_INTERVAL_1MINUTE) == START_TS + 10 * MINUTE
+
+
+def test_read_range(client, tmpdir):
+    """Test reads are limited to the open time range"""
+    store = KlineStore(str(tmpdir))
+
+    with requests_mock.mock() as m:
+        m.get(KLINES_URI, json=make_klines_response(11))
+        store.sync(client, 'BNBBTC', Client.KLINE_INTERVAL_1MINUTE, START_TS)
+
+    records = store.read('BNBBTC', Client.KLINE_INTERVAL_1MINUTE, START_TS + 2 * MINUTE, START_TS + 4 * MINUTE)
+    assert list(records['open_time']) == [START_TS + 2 * MINUTE, START_TS + 3 * MINUTE, START_TS + 4 * MINUTE]
+    assert len(store.read('ETHBTC', Client.KLINE_INTERVAL_1MINUTE)) == 0
+
+
+def test_partial_record(client, tmpdir):
+    """Test a partially written record from an interrupted sync is dropped"""
+    store = KlineStore(str(tmpdir))
+
+    with requests_mock.mock() as m:
+        m.get(KLINES_URI, json=make_klines_response(4))
+        store.sync(client, 'BNBBTC', Client.KLINE_INTERVAL_1MINUTE, START_TS)
+
+    with open(str(tmpdir.join('BNBBTC-1m.klines')), 'ab') as f:
+        f.write(b'\0' * 10)
+    assert len(store.read('BNBBTC', Client.KLINE_INTERVAL_1MINUTE)) == 3
+
+    with requests_mock.mock() as m:
+        m.get(KLINES_URI, json=make_klines_response(6))
+        assert store.sync(client, 'BNBBTC', Client.KLINE_INTERVAL_1MINUTE) == 2
+
+    assert list(store.read('BNBBTC', Client.KLINE_INTERVAL_1MINUTE)['open_time']) == \
+        [START_TS + i * MINUTE for i in range(5)]
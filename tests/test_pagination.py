@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+from binance.client import Client
+import pytest
+import requests_mock
+
+TRADES = [{"id": i, "time": 1000 + i} for i in range(8)]
+
+
+def trades_response(request, context):
+    from_id = int(request.qs['fromid'][0])
+    limit = int(request.qs['limit'][0])
+    return [t for t in TRADES if t['id'] >= from_id][:limit]
+
+
+@pytest.mark.parametrize('prefetch', [False, True])
+def test_id_cursor(client, prefetch):
+    """Test pages are walked by id from the first item"""
+    with requests_mock.mock() as m:
+        trades = m.get('https://api.binance.com/api/v3/myTrades', json=trades_response)
+        assert list(client.my_trades_iter('BNBBTC', limit=3, prefetch=prefetch)) == TRADES
+
+    assert [r.qs['fromid'] for r in trades.request_history] == [['0'], ['3'], ['6']]
+
+
+def test_id_cursor_end_time(client):
+    """Test items after endTime are not returned"""
+    with requests_mock.mock() as m:
+        m.get('https://api.binance.com/api/v3/myTrades', json=trades_response)
+        trades = list(client.my_trades_iter('BNBBTC', limit=3, fromId=0, endTime=1004))
+
+    assert trades == TRADES[:5]
+
+
+def test_time_window_cursor(client):
+    """Test the deposit history is fetched in time windows"""
+    window = Client.HISTORY_WINDOW
+
+    def deposits_response(request, context):
+        return {"depositList": [{"insertTime": int(request.qs['starttime'][0])}], "success": True}
+
+    with requests_mock.mock() as m:
+        m.get('https://api.binance.com/wapi/v3/depositHistory.html', json=deposits_response)
+        deposits = list(client.deposit_history_iter(0, 2 * window + 10))
+
+    assert [d['insertTime'] for d in deposits] == [0, window, 2 * window]
+
+
+def test_page_number_cursor(client):
+    """Test margin loan records are walked by page number"""
+    def loans_response(request, context):
+        current = int(request.qs['current'][0])
+        return {"rows": [{"txId": current * 10 + i} for i in range(2 if current < 3 else 1)], "total": 5}
+
+    with requests_mock.mock() as m:
+        m.get('https://api.binance.com/sapi/v1/margin/loan', json=loans_response)
+        loans = list(client.margin_loan_details_iter('BNB', size=2, startTime=0))
+
+    assert [loan['txId'] for loan in loans] == [10, 11, 20, 21, 30]
+
+
+def test_time_cursor(client):
+    """Test futures income history is walked by time"""
+    def income_response(request, context):
+        start = int(request.qs['starttime'][0])
+        return [{"time": t, "tranId": t} for t in range(start, min(start + 2, 5))]
+
+    with requests_mock.mock() as m:
+        m.get('https://fapi.binance.com/fapi/v1/income', json=income_response)
+        income = list(client.futures_income_history_iter(limit=2, prefetch=True))
+
+    assert [i['time'] for i in income] == [0, 1, 2, 3, 4]
+
+
+def test_time_cursor_same_time(client):
+    """Test items with the same time are not skipped at page boundaries"""
+    records = [{"time": 0, "tranId": 1}] + [{"time": 5, "tranId": i} for i in range(2, 7)] + \
+        [{"time": 6, "tranId": 7}]
+
+    def income_response(request, context):
+        start, limit = int(request.qs['starttime'][0]), int(request.qs['limit'][0])
+        return [r for r in records if r['time'] >= start][:limit]
+
+    with requests_mock.mock() as m:
+        income = m.get('https://fapi.binance.com/fapi/v1/income', json=income_response)
+        records_iter = list(client.futures_income_history_iter(limit=2))
+
+    assert [r['tranId'] for r in records_iter] == list(range(1, 8))
+    assert [r.qs['limit'][0] for r in income.request_history][:4] == ['2', '2', '4', '8']
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+from binance.ratelimiter import RateLimiter, get_endpoint, get_request_weight
+import pytest
+
+API_URI = 'https://api.binance.com/api/v3/'
+
+
+def test_get_endpoint():
+    """Test endpoint names are taken from the uri after the version"""
+    assert get_endpoint(API_URI + 'order') == ('api.binance.com', 'order')
+    assert get_endpoint('https://api.binance.com/sapi/v1/margin/order') == ('api.binance.com', 'margin/order')
+    assert get_endpoint('https://fapi.binance.com/fapi/v1/ticker/24hr') == ('fapi.binance.com', 'ticker/24hr')
+
+
+def test_request_weight():
+    """Test request weights depend on the endpoint and parameters"""
+    assert get_request_weight('klines', {'symbol': 'BNBBTC'}) == 1
+    assert get_request_weight('depth', {'symbol': 'BNBBTC'}) == 1
+    assert get_request_weight('depth', {'symbol': 'BNBBTC', 'limit': 1000}) == 10
+    assert get_request_weight('ticker/24hr', {'symbol': 'BNBBTC'}) == 1
+    assert get_request_weight('ticker/24hr') == 40
+    assert get_request_weight('account') == 5
+
+
+def test_reserve_weight():
+    """Test calls wait once the weight limit is used up"""
+    limiter = RateLimiter([{'rateLimitType': 'REQUEST_WEIGHT', 'interval': 'MINUTE', 'intervalNum': 1, 'limit': 60}])
+
+    assert limiter.reserve('get', API_URI + 'ticker/24hr') == 0
+    assert limiter.reserve('get', API_URI + 'ticker/24hr') == pytest.approx(20, abs=0.1)
+    # the limits of other hosts are tracked separately
+    assert limiter.reserve('get', 'https://fapi.binance.com/fapi/v1/ticker/24hr') == 0
+
+
+def test_reserve_orders():
+    """Test only order placement counts towards the order limits"""
+    limiter = RateLimiter([{'rateLimitType': 'ORDERS', 'interval': 'SECOND', 'intervalNum': 1, 'limit': 1}])
+
+    assert limiter.reserve('post', API_URI + 'order') == 0
+    assert limiter.reserve('get', API_URI + 'order') == 0
+    assert limiter.reserve('post', API_URI + 'order/test') == 0
+    assert limiter.reserve('post', API_URI + 'order') == pytest.approx(1, abs=0.1)
+
+
+def test_update_from_headers():
+    """Test the used weight reported by the server is applied"""
+    limiter = RateLimiter()
+
+    limiter.update(API_URI + 'klines', 200, {'X-MBX-USED-WEIGHT-1M': '1200'})
+
+    assert limiter.reserve('get', API_URI + 'klines') == pytest.approx(0.05, abs=0.01)
+
+
+def test_retry_after():
+    """Test calls are held back after a 429 response"""
+    limiter = RateLimiter()
+
+    limiter.update(API_URI + 'klines', 429, {'Retry-After': '30'})
+
+    assert limiter.reserve('get', API_URI + 'klines') == pytest.approx(30, abs=0.1)
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+from binance.client import Client
+from binance.records import AggTrade, BookTicker, DepthUpdate, Kline, Trade, record_callback
+import requests_mock
+
+
+def test_kline_records(client):
+    """Test klines are parsed to records without a __dict__"""
+    with requests_mock.mock() as m:
+        m.get('https://api.binance.com/api/v1/klines', json=[
+            [1499040000000, "0.01634790", "0.80000000", "0.01575800", "0.01577100", "148976.11427815",
+             1499644799999, "2434.19055334", 308, "1756.87402397", "28.46694368", "17928899.62484339"]
+        ])
+        klines = client.get_kline_records(symbol='BNBBTC', interval=Client.KLINE_INTERVAL_1MINUTE)
+
+    assert klines == [Kline(1499040000000, 0.0163479, 0.8, 0.015758, 0.015771, 148976.11427815, 1499644799999,
+                            2434.19055334, 308, 1756.87402397, 28.46694368)]
+    assert not hasattr(klines[0], '__dict__')
+    assert klines[0].to_dict()['close'] == 0.015771
+
+
+def test_trade_and_ticker_records(client):
+    """Test REST responses of a list or a single item are converted"""
+    with requests_mock.mock() as m:
+        m.get('https://api.binance.com/api/v1/trades', json=[
+            {"id": 28457, "price": "4.00000100", "qty": "12.00000000", "quoteQty": "48.000012",
+             "time": 1499865549590, "isBuyerMaker": True, "isBestMatch": True}
+        ])
+        m.get('https://api.binance.com/api/v1/aggTrades', json=[
+            {"a": 26129, "p": "0.01633102", "q": "4.70443515", "f": 27781, "l": 27781, "T": 1498793709153,
+             "m": True, "M": True}
+        ])
+        m.get('https://api.binance.com/api/v3/ticker/bookTicker', json={
+            "symbol": "LTCBTC", "bidPrice": "4.00000000", "bidQty": "431.00000000", "askPrice": "4.00000200",
+            "askQty": "9.00000000"
+        })
+        m.get('https://api.binance.com/api/v1/depth', json={
+            "lastUpdateId": 1027024, "bids": [["4.00000000", "431.00000000", []]], "asks": [["4.00000200", "12.0"]]
+        })
+        assert client.get_recent_trade_records(symbol='BNBBTC') == [
+            Trade(28457, 4.000001, 12.0, 1499865549590, True, True)]
+        assert client.get_aggregate_trade_records(symbol='BNBBTC')[0].price == 0.01633102
+        assert client.get_orderbook_ticker_records(symbol='LTCBTC') == BookTicker('LTCBTC', 4.0, 431.0, 4.000002, 9.0)
+        depth = client.get_order_book_record(symbol='BNBBTC')
+
+    assert depth.last_update_id == 1027024
+    assert depth.bids == [(4.0, 431.0)]
+    assert depth.asks == [(4.000002, 12.0)]
+
+
+def test_record_callback():
+    """Test socket messages are converted and error messages passed on"""
+    received = []
+    callback = record_callback(AggTrade, received.append)
+
+    callback({"e": "aggTrade", "E": 1499405254326, "s": "ETHBTC", "a": 70232, "p": "0.10281118",
+              "q": "8.15632997", "f": 77489, "l": 77489, "T": 1499405254324, "m": False, "M": True})
+    callback({'e': 'error', 'm': 'Max reconnect retries reached'})
+
+    assert received == [AggTrade(70232, 0.10281118, 8.15632997, 77489, 77489, 1499405254324, False, True),
+                        {'e': 'error', 'm': 'Max reconnect retries reached'}]
+
+    received = []
+    callback = record_callback(DepthUpdate, received.append)
+    callback({"e": "depthUpdate", "E": 123456789, "s": "BNBBTC", "U": 157, "u": 160,
+              "b": [["0.0024", "10"]], "a": [["0.0026", "0"]]})
+    assert received == [DepthUpdate('BNBBTC', 157, 160, [(0.0024, 10.0)], [(0.0026, 0.0)])]
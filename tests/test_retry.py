@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+from binance.client import Client
+from binance.exceptions import BinanceAPIException
+from binance.retry import RetryPolicy
+import pytest
+import requests
+import requests_mock
+
+API_URI = 'https://api.binance.com/api/v3/'
+
+
+def make_client(retry_policy):
+    with requests_mock.mock() as m:
+        m.get('https://api.binance.com/api/v1/ping', json={})
+        return Client('api_key', 'api_secret', retry_policy=retry_policy)
+
+
+def test_get_wait():
+    """Test retries back off with jitter and honour Retry-After"""
+    policy = RetryPolicy(max_retries=3, backoff_factor=1, max_backoff=3)
+
+    assert 0 <= policy.get_wait(1, 500) <= 1
+    assert 0 <= policy.get_wait(3, 503) <= 3
+    assert policy.get_wait(1, 429, '20') >= 20
+    assert 0 <= policy.get_wait(1) <= 1
+    assert policy.get_wait(4, 500) is None
+    assert policy.get_wait(1, 400) is None
+    assert RetryPolicy(retry_timeouts=False).get_wait(1) is None
+
+
+def test_prepare():
+    """Test only idempotent calls and orders with a client id are retried"""
+    policy = RetryPolicy()
+    params = {'symbol': 'BNBBTC'}
+
+    assert policy.prepare('get', API_URI + 'order', None)
+    assert policy.prepare('post', API_URI + 'order', params)
+    assert params['newClientOrderId']
+    assert policy.prepare('post', API_URI + 'order', {'newClientOrderId': 'my_id'})
+    assert not policy.prepare('post', 'https://api.binance.com/wapi/v3/withdraw.html', {'asset': 'BTC'})
+
+
+def test_retry_order():
+    """Test a failed order is sent again with the same client order id"""
+    retries = []
+    client = make_client(RetryPolicy(backoff_factor=0, hooks=[lambda *args: retries.append(args)]))
+
+    with requests_mock.mock() as m:
+        order_post = m.post(API_URI + 'order', [
+            {'status_code': 503, 'text': 'Service Unavailable'},
+            {'exc': requests.exceptions.ConnectTimeout},
+            {'json': {'orderId': 1}},
+        ])
+        order_get = m.get(API_URI + 'order', status_code=400, json={"code": -2013, "msg": "Order does not exist."})
+        assert client.create_order(symbol='BNBBTC', side='BUY', type='MARKET', quantity=1) == {'orderId': 1}
+
+    client_order_ids = set(request.text.split('newClientOrderId=')[1].split('&')[0]
+                           for request in order_post.request_history)
+    assert order_post.call_count == 3
+    assert len(client_order_ids) == 1
+    # the order is looked up before each retry
+    assert order_get.call_count == 2
+    assert order_get.last_request.qs['origclientorderid'] == [client_order_ids.pop().lower()]
+    assert order_get.last_request.qs['symbol'] == ['bnbbtc']
+    assert [r[0] for r in retries] == [1, 2]
+    assert isinstance(retries[0][4], BinanceAPIException)
+
+
+def test_retry_placed_order():
+    """Test an order placed by a call which timed out is returned instead of being sent again"""
+    client = make_client(RetryPolicy(backoff_factor=0))
+
+    with requests_mock.mock() as m:
+        order_post = m.post(API_URI + 'order', exc=requests.exceptions.ReadTimeout)
+        m.get(API_URI + 'order', json={'orderId': 1, 'status': 'FILLED'})
+        assert client.create_order(symbol='BNBBTC', side='BUY', type='MARKET', quantity=1) == \
+            {'orderId': 1, 'status': 'FILLED'}
+
+    assert order_post.call_count == 1
+
+    with requests_mock.mock() as m:
+        order_post = m.post(API_URI + 'order', status_code=502, text='Bad Gateway')
+        m.get(API_URI + 'order', status_code=400, json={"code": -1021, "msg": "Timestamp outside of recvWindow."})
+        with pytest.raises(BinanceAPIException) as e:
+            client.create_order(symbol='BNBBTC', side='BUY', type='MARKET', quantity=1)
+
+    # the order status is unknown so the original error is raised
+    assert e.value.status_code == 502
+    assert order_post.call_count == 1
+
+
+def test_get_order_query():
+    """Test orders are looked up by their client order id"""
+    policy = RetryPolicy()
+
+    assert policy.get_order_query('post', API_URI + 'order', {'symbol': 'BNBBTC', 'newClientOrderId': 'a'}) == \
+        (API_URI + 'order', {'symbol': 'BNBBTC', 'origClientOrderId': 'a'})
+    assert policy.get_order_query('post', API_URI + 'order/oco', {'symbol': 'BNBBTC', 'listClientOrderId': 'b'}) == \
+        (API_URI + 'orderList', {'origClientOrderId': 'b'})
+    assert policy.get_order_query('get', API_URI + 'order', {'symbol': 'BNBBTC'}) is None
+    assert not policy.is_order_unknown(429)
+    assert policy.is_order_unknown(None)
+
+
+def test_no_retry():
+    """Test client errors and non idempotent calls are not retried"""
+    client = make_client(RetryPolicy(backoff_factor=0))
+
+    with requests_mock.mock() as m:
+        order_get = m.get(API_URI + 'order', status_code=400, json={"code": -2013, "msg": "Order does not exist."})
+        with pytest.raises(BinanceAPIException):
+            client.get_order(symbol='BNBBTC', orderId=1)
+        assert order_get.call_count == 1
+
+        withdraw = m.post('https://api.binance.com/wapi/v3/withdraw.html', status_code=500, text='error')
+        with pytest.raises(BinanceAPIException):
+            client.withdraw(asset='BTC', address='BTCADDRESS', amount=100)
+        assert withdraw.call_count == 1
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+from binance.client import Client
+from binance.timesync import ServerTimeSync
+import pytest
+import requests_mock
+import time
+
+
+def test_update():
+    """Test the offset is measured from the middle of the round trip and smoothed"""
+    time_sync = ServerTimeSync(smoothing=0.5)
+
+    time_sync.update(100.0, 100.2, 102100)
+    assert time_sync.offset == pytest.approx(2000)
+    assert time_sync.rtt == pytest.approx(200)
+
+    time_sync.update(200.0, 200.1, 201050)
+    assert time_sync.offset == pytest.approx(1500)
+    assert time_sync.rtt == pytest.approx(150)
+
+
+def test_sync_uses_shortest_round_trip():
+    """Test only the most accurate sample of a measurement is used"""
+    time_sync = ServerTimeSync()
+    server_times = iter([{'serverTime': 0}, {'serverTime': 1}])
+
+    time_sync.sync(lambda: next(server_times), samples=2)
+
+    assert time_sync.rtt is not None
+    assert time_sync.sync_time is not None
+
+
+def test_signed_timestamp_offset():
+    """Test signed requests are timestamped with the server time"""
+    time_sync = ServerTimeSync()
+    time_sync.update(100.0, 100.0, 100000 + 5000000)
+
+    with requests_mock.mock() as m:
+        m.get('https://api.binance.com/api/v1/ping', json={})
+        m.get('https://api.binance.com/api/v1/time', json={"serverTime": 1499827319559})
+        order = m.get('https://api.binance.com/api/v3/order', json={})
+        client = Client('api_key', 'api_secret', time_sync=time_sync)
+        time_sync.stop()
+        client.get_order(symbol='BNBBTC', orderId=1)
+
+    timestamp = int(order.last_request.qs['timestamp'][0])
+    assert timestamp == pytest.approx(time_sync.timestamp(), abs=1000)
+    assert abs(timestamp - time.time() * 1000) > 1000000
+
+
+def test_background_sync_session():
+    """Test the background sync uses its own session, leaving the last response of the client alone"""
+    with requests_mock.mock() as m:
+        m.get('https://api.binance.com/api/v1/ping', json={})
+        m.get('https://api.binance.com/api/v1/time', json={"serverTime": 1499827319559})
+        client = Client('api_key', 'api_secret', ping=False, time_sync=ServerTimeSync())
+        client._time_sync.stop()
+        client.ping()
+        last_response = client.response
+
+        assert client._get_sync_server_time() == {"serverTime": 1499827319559}
+
+    assert client.response is last_response
+    assert client._time_sync_session is not client.session
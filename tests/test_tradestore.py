@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+from binance.tradestore import AggTradeStore
+import numpy as np
+import re
+import requests_mock
+
+from .conftest import START_TS
+
+AGG_TRADES_URI = re.compile(r'https://api.binance.com/api/v1/aggTrades')
+
+SECOND = 1000
+
+
+def agg_trade(agg_id):
+    return {"a": agg_id, "p": "0.01633102", "q": "4.70443515", "f": agg_id * 2, "l": agg_id * 2 + 1,
+            "T": START_TS + agg_id * SECOND, "m": agg_id % 2 == 0, "M": True}
+
+
+def make_agg_trades_response(count):
+    """Pages of 5 trades from fromId"""
+    def agg_trades_response(request, context):
+        from_id = int(request.qs['fromid'][0])
+        return [agg_trade(i) for i in range(from_id, min(count, from_id + 5))]
+    return agg_trades_response
+
+
+def test_incremental_sync(client, tmpdir):
+    """Test a sync resumes after the last stored trade id"""
+    store = AggTradeStore(str(tmpdir))
+
+    with requests_mock.mock() as m:
+        m.get(AGG_TRADES_URI, json=make_agg_trades_response(12))
+        assert store.sync(client, 'BNBBTC', batch_size=5) == 12
+
+    with requests_mock.mock() as m:
+        trades = m.get(AGG_TRADES_URI, json=make_agg_trades_response(15))
+        assert store.sync(client, 'BNBBTC') == 3
+        assert trades.request_history[0].qs['fromid'] == ['11']
+
+    records = store.read('BNBBTC')
+    assert isinstance(records, np.memmap)
+    assert list(records['id']) == list(range(15))
+    assert records['price'][0] == 0.01633102
+    assert list(records['is_buyer_maker'][:3]) == [True, False, True]
+    assert records['last_trade_id'][14] == 29
+    assert store.get_last_id('BNBBTC') == 14
+
+
+def test_read_range(client, tmpdir):
+    """Test reads by time and id are limited to the range"""
+    store = AggTradeStore(str(tmpdir))
+
+    with requests_mock.mock() as m:
+        m.get(AGG_TRADES_URI, json=make_agg_trades_response(10))
+        store.sync(client, 'BNBBTC')
+
+    records = store.read('BNBBTC', START_TS + 2 * SECOND, START_TS + 4 * SECOND)
+    assert list(records['id']) == [2, 3, 4]
+    assert list(store.read_ids('BNBBTC', 7)['id']) == [7, 8, 9]
+    assert list(store.read_ids('BNBBTC', 3, 5)['time']) == [START_TS + i * SECOND for i in (3, 4, 5)]
+    assert len(store.read('ETHBTC')) == 0
@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+import json
+
+from binance.websockets import BinanceClientFactory, BinanceClientProtocol
+
+
+def create_protocol(json_loads=None):
+    messages = []
+    factory = BinanceClientFactory('wss://stream.binance.com:9443/ws/bnbbtc@depth')
+    factory.callback = messages.append
+    factory.json_loads = json_loads
+    protocol = BinanceClientProtocol()
+    protocol.factory = factory
+    return protocol, messages
+
+
+def test_on_message():
+    """Test messages are decoded and passed to the callback"""
+    protocol, messages = create_protocol()
+
+    protocol.onMessage(b'{"e": "depthUpdate"}', False)
+    # invalid messages are ignored
+    protocol.onMessage(b'<html>', False)
+
+    assert messages == [{"e": "depthUpdate"}]
+
+
+def test_on_message_json_loads():
+    """Test messages are passed to a custom decoder as bytes"""
+    payloads = []
+
+    def json_loads(payload):
+        payloads.append(payload)
+        return json.loads(payload)
+
+    protocol, messages = create_protocol(json_loads)
+
+    protocol.onMessage(b'{"e": "depthUpdate"}', False)
+    protocol.onMessage(b'<html>', False)
+
+    assert payloads == [b'{"e": "depthUpdate"}', b'<html>']
+    assert messages == [{"e": "depthUpdate"}]